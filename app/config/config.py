@@ -220,12 +220,54 @@ class Config:
             "password_require_numbers": True,
             "max_failed_attempts": 5,
             "lockout_duration_minutes": 30,
+            "bcrypt_rounds": 12,  # Password hashing cost; see scripts/benchmark_bcrypt.py
             "encryption_key": ""  # Will be generated if empty
         },
         "logging": {
             "log_level": "INFO",
             "log_file": "logs/mis_system.log"
         },
+        "connection_pool": {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_timeout": 30,
+            "pool_recycle": 3600,
+            "pre_ping": True,
+            "isolation_level": None  # None keeps the server default
+        },
+        "search": {
+            "full_text": False,
+            "min_token_length": 3,  # Matches MySQL innodb_ft_min_token_size
+            "trigram_index": True,
+            "fuzzy_min_similarity": 0.5
+        },
+        "refresh": {
+            "dashboard_seconds": 60,  # 0 disables timed refresh
+            "student_data_seconds": 30,
+            "jitter": 0.1,  # Fraction each interval is randomly stretched or shortened by
+            "max_backoff_seconds": 600,  # Longest delay after repeated failures
+            "idle_pause_minutes": 5  # Pause refreshes after this long without input (0 never pauses)
+        },
+        "cache": {
+            "enabled": True,  # Read-through cache for courses and filter choices
+            "max_entries": 256,
+            "ttl_seconds": 300
+        },
+        "change_log": {
+            "enabled": False,  # Share changes with other workstations through data_change_log
+            "poll_seconds": 5,
+            "retention_hours": 24
+        },
+        "sessions": {
+            "validation_cache_seconds": 30,  # Re-check a validated session in the database after this long
+            "activity_flush_seconds": 60  # Write a session's last_activity at most this often
+        },
+        "login_attempts": {
+            "retention_days": 90,  # 0 keeps every attempt in login_attempts
+            "archive": "table",  # "table" (login_attempts_archive), "file" (gzipped CSV) or "none"
+            "archive_dir": "logs/login_attempts",
+            "batch_size": 1000
+        },
         "user_info": {
             "last_login": "",
             "last_login_time": ""
@@ -365,6 +407,12 @@ class Config:
     def lockout_duration(self):
         return self._config['security']['lockout_duration_minutes']
 
+    @property
+    def bcrypt_rounds(self):
+        # bcrypt accepts costs from 4 to 31
+        rounds = self._config['security'].get('bcrypt_rounds', self.DEFAULT_CONFIG['security']['bcrypt_rounds'])
+        return min(max(int(rounds), 4), 31)
+
     @property
     def log_file_path(self):
         log_file = self._config['logging']['log_file']
@@ -377,6 +425,69 @@ class Config:
     def log_level(self):
         return self._config['logging']['log_level']
 
+    @property
+    def pool_settings(self):
+        """Connection pool settings shared by the auth and data engines"""
+        settings = dict(self.DEFAULT_CONFIG['connection_pool'])
+        settings.update(self._config.get('connection_pool', {}))
+        return settings
+
+    @property
+    def full_text_search(self):
+        return self._config.get('search', {}).get('full_text', False)
+
+    @property
+    def full_text_min_token_length(self):
+        return self._config.get('search', {}).get('min_token_length', 3)
+
+    @property
+    def trigram_index_enabled(self):
+        return self._config.get('search', {}).get('trigram_index', True)
+
+    @property
+    def fuzzy_min_similarity(self):
+        return self._config.get('search', {}).get('fuzzy_min_similarity', 0.5)
+
+    @property
+    def refresh_settings(self):
+        """Timed refresh settings: seconds per component (0 disables), jitter, backoff and idle pause"""
+        settings = dict(self.DEFAULT_CONFIG['refresh'])
+        settings.update(self._config.get('refresh', {}))
+        return settings
+
+    @property
+    def cache_settings(self):
+        """Reference data cache settings"""
+        settings = dict(self.DEFAULT_CONFIG['cache'])
+        settings.update(self._config.get('cache', {}))
+        return settings
+
+    @property
+    def session_settings(self):
+        """Session validation cache and last_activity write throttling"""
+        settings = dict(self.DEFAULT_CONFIG['sessions'])
+        settings.update(self._config.get('sessions', {}))
+        return settings
+
+    @property
+    def login_attempt_settings(self):
+        """Retention and archiving of old login attempts"""
+        settings = dict(self.DEFAULT_CONFIG['login_attempts'])
+        settings.update(self._config.get('login_attempts', {}))
+        return settings
+
+    @property
+    def change_log_enabled(self):
+        return self._config.get('change_log', {}).get('enabled', False)
+
+    @property
+    def change_log_poll_seconds(self):
+        return self._config.get('change_log', {}).get('poll_seconds', 5)
+
+    @property
+    def change_log_retention_hours(self):
+        return self._config.get('change_log', {}).get('retention_hours', 24)
+
     @property
     def current_user(self):
         # Return empty string if last_login is not available or empty
@@ -1,9 +1,9 @@
 import logging
-from datetime import datetime, timezone, timedelta
-from sqlalchemy import func
+import math
 
-from app.models import User, LoginAttempt
+from app.models import User
 from app.config.config import Config
+from app.services.login_rate_limiter import LoginRateLimiter
 from app.services.session_manager import SessionManager
 
 
@@ -14,6 +14,7 @@ class AuthController:
         self.db_session = db_session
         self.config = Config()
         self.session_manager = SessionManager(db_session)
+        self.rate_limiter = LoginRateLimiter()
 
     def authenticate(self, username, password, ip_address=None, user_agent=None):
         """
@@ -30,23 +31,14 @@ class AuthController:
             If authentication fails, user and session will be None
         """
         # Check for too many login attempts from this IP in the past hour
-        if ip_address:
-            # Fixed: use correct datetime import and convert to naive for MySQL compatibility
-            one_hour_ago = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1)
-            attempt_count = self.db_session.query(func.count(LoginAttempt.id)).filter(
-                LoginAttempt.ip_address == ip_address,
-                LoginAttempt.timestamp >= one_hour_ago
-            ).scalar()
-
-            if attempt_count >= 100:
-                return None, None, "Invalid username or password"
+        if self.rate_limiter.is_throttled(ip_address):
+            return None, None, "Invalid username or password"
 
-        # Record login attempt
-        login_attempt = LoginAttempt(
-            username=username,
-            ip_address=ip_address,
-            successful=False
-        )
+        # Check for too many failed attempts on this account
+        if self.rate_limiter.is_locked(username):
+            self.rate_limiter.record(username, ip_address)
+            minutes = math.ceil(self.rate_limiter.lockout_remaining(username) / 60)
+            return None, None, f"Account is temporarily locked. Try again in {minutes} minutes."
 
         try:
             # Find user
@@ -54,21 +46,24 @@ class AuthController:
 
             # Check if user exists and is active
             if not user:
-                self.db_session.add(login_attempt)
-                self.db_session.commit()
+                self.rate_limiter.record(username, ip_address)
                 return None, None, "Invalid username or password"
 
             if not user.is_active:
-                self.db_session.add(login_attempt)
-                self.db_session.commit()
+                self.rate_limiter.record(username, ip_address)
                 return None, None, "Account is disabled"
 
             # Check password
             if not user.check_password(password):
-                self.db_session.add(login_attempt)
-                self.db_session.commit()
+                self.rate_limiter.record(username, ip_address)
                 return None, None, "Invalid username or password"
 
+            # Rehash with the configured cost; saved with the new session
+            rounds = self.config.bcrypt_rounds
+            if user.needs_rehash(rounds):
+                user.set_password(password, rounds)
+                logging.info(f"Rehashed password for {username} with cost {rounds}")
+
             # Use SessionManager to create a new session
             session, session_message = self.session_manager.create_session(
                 user=user,
@@ -78,17 +73,11 @@ class AuthController:
 
             if not session:
                 # Session creation failed
-                self.db_session.add(login_attempt)
-                self.db_session.commit()
+                self.rate_limiter.record(username, ip_address)
                 return None, None, session_message
 
-            # Update login attempt
-            login_attempt.successful = True
-            login_attempt.user_id = user.id
-
-            # Save login attempt to database
-            self.db_session.add(login_attempt)
-            self.db_session.commit()
+            # Record the successful attempt; it is written in the background
+            self.rate_limiter.record(username, ip_address, successful=True, user_id=user.id)
 
             return user, session, "Authentication successful"
 
@@ -1,9 +1,137 @@
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.pool import QueuePool
 from app.models.base import Base
 from app.config.config import Config
 
 
+class PoolStatistics:
+    """Thread-safe counters describing how an engine's connection pool is used"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Reset all counters to zero"""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connections_created = 0
+            self.invalidations = 0
+            self.total_wait_time = 0.0
+            self.max_wait_time = 0.0
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self.total_wait_time += seconds
+            if seconds > self.max_wait_time:
+                self.max_wait_time = seconds
+
+    def record_checkout(self):
+        with self._lock:
+            self.checkouts += 1
+
+    def record_checkin(self):
+        with self._lock:
+            self.checkins += 1
+
+    def record_connect(self):
+        with self._lock:
+            self.connections_created += 1
+
+    def record_invalidate(self):
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self, pool):
+        """
+        Build a point-in-time report of the pool
+
+        Args:
+            pool: The SQLAlchemy pool the counters belong to
+
+        Returns:
+            Dictionary with checkout, overflow, wait time and usage figures
+        """
+        with self._lock:
+            checkouts = self.checkouts
+            report = {
+                'checkouts': checkouts,
+                'checkins': self.checkins,
+                'connections_created': self.connections_created,
+                'invalidations': self.invalidations,
+                'total_wait_ms': round(self.total_wait_time * 1000, 3),
+                'max_wait_ms': round(self.max_wait_time * 1000, 3),
+                'avg_wait_ms': round(self.total_wait_time * 1000 / checkouts, 3) if checkouts else 0.0,
+            }
+
+        report['pool_size'] = pool.size() if hasattr(pool, 'size') else None
+        report['in_use'] = pool.checkedout() if hasattr(pool, 'checkedout') else None
+        report['idle'] = pool.checkedin() if hasattr(pool, 'checkedin') else None
+        report['overflow'] = max(pool.overflow(), 0) if hasattr(pool, 'overflow') else None
+        return report
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited for a free connection"""
+
+    statistics = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.statistics is not None:
+                self.statistics.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        # The pool is rebuilt after invalidation; keep reporting into the same counters
+        new_pool = super().recreate()
+        new_pool.statistics = self.statistics
+        return new_pool
+
+
+def create_pooled_engine(connection_string):
+    """
+    Create an engine using the pool settings from config.json
+
+    Args:
+        connection_string: SQLAlchemy database URL
+
+    Returns:
+        Tuple of (engine, PoolStatistics)
+    """
+    settings = Config().pool_settings
+
+    engine_options = {
+        'poolclass': TimedQueuePool,
+        'pool_size': settings['pool_size'],
+        'max_overflow': settings['max_overflow'],
+        'pool_timeout': settings['pool_timeout'],
+        'pool_recycle': settings['pool_recycle'],
+        'pool_pre_ping': settings['pre_ping'],
+    }
+    if settings.get('isolation_level'):
+        engine_options['isolation_level'] = settings['isolation_level']
+
+    engine = create_engine(connection_string, **engine_options)
+
+    statistics = PoolStatistics()
+    engine.pool.statistics = statistics
+
+    event.listen(engine, 'connect', lambda dbapi_conn, record: statistics.record_connect())
+    event.listen(engine, 'checkout', lambda dbapi_conn, record, proxy: statistics.record_checkout())
+    event.listen(engine, 'checkin', lambda dbapi_conn, record: statistics.record_checkin())
+    event.listen(engine, 'invalidate', lambda dbapi_conn, record, exc: statistics.record_invalidate())
+
+    return engine, statistics
+
+
 class AuthDatabase:
     """Database connection for authentication and user management"""
     _instance = None
@@ -18,7 +146,7 @@ class AuthDatabase:
         config = Config()
         connection_string = config.get_auth_db_connection_string()
 
-        self.engine = create_engine(connection_string, pool_recycle=3600)
+        self.engine, self.pool_statistics = create_pooled_engine(connection_string)
         self.session_factory = sessionmaker(bind=self.engine)
         self.Session = scoped_session(self.session_factory)
 
@@ -27,6 +155,32 @@ class AuthDatabase:
         # from app.models import User, UserSession, LoginAttempt
         Base.metadata.create_all(self.engine)
 
+    def create_indexes(self):
+        """
+        Add indexes declared on the auth models that existing tables lack
+
+        create_all() only creates indexes together with a new table, so
+        databases created before an index was declared are migrated here.
+
+        Returns:
+            List of the index names that were created
+        """
+        inspector = inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+        created = []
+
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name in existing_indexes:
+                    continue
+                index.create(self.engine)
+                created.append(index.name)
+
+        return created
+
     def get_session(self):
         return self.Session()
 
@@ -35,6 +189,10 @@ class AuthDatabase:
         if session:
             session.close()
 
+    def get_pool_stats(self):
+        """Get checkout, overflow, wait time and in-use figures for the auth pool"""
+        return self.pool_statistics.snapshot(self.engine.pool)
+
 
 class DataDatabase:
     """Database connection for student data and operations"""
@@ -50,8 +208,10 @@ class DataDatabase:
         config = Config()
         connection_string = config.get_data_db_connection_string()
 
-        self.engine = create_engine(connection_string, pool_recycle=3600)
-        self.session_factory = sessionmaker(bind=self.engine)
+        self.engine, self.pool_statistics = create_pooled_engine(connection_string)
+        # Records returned by the services must stay readable after commit and
+        # close, so commits do not expire loaded attributes
+        self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.Session = scoped_session(self.session_factory)
 
     def get_session(self):
@@ -60,4 +220,8 @@ class DataDatabase:
     # @staticmethod
     def close_session(self, session):
         if session:
-            session.close()
\ No newline at end of file
+            session.close()
+
+    def get_pool_stats(self):
+        """Get checkout, overflow, wait time and in-use figures for the data pool"""
+        return self.pool_statistics.snapshot(self.engine.pool)
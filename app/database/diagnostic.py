@@ -63,4 +63,19 @@ def check_database_tables():
             print("No students found in database")
         connection.close()
     except Exception as e:
-        print(f"Error accessing database: {str(e)}")
\ No newline at end of file
+        print(f"Error accessing database: {str(e)}")
+
+def check_pool_statistics():
+    """Print connection pool telemetry for both databases"""
+    from app.database.db_connection import AuthDatabase
+
+    print("Connection Pool Diagnostic:")
+    print("--------------------------")
+
+    for label, db in (("Auth", AuthDatabase()), ("Data", DataDatabase())):
+        stats = db.get_pool_stats()
+        print(f"{label} pool: size={stats['pool_size']}, in use={stats['in_use']}, "
+              f"idle={stats['idle']}, overflow={stats['overflow']}")
+        print(f"  - Checkouts: {stats['checkouts']}, connections created: {stats['connections_created']}, "
+              f"invalidated: {stats['invalidations']}")
+        print(f"  - Wait time: avg {stats['avg_wait_ms']} ms, max {stats['max_wait_ms']} ms")
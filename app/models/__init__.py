@@ -1,5 +1,5 @@
 from app.models.base import Base
 from app.models.user import User, UserRole
-from app.models.session import UserSession, LoginAttempt
+from app.models.session import UserSession, LoginAttempt, LoginAttemptArchive
 
-__all__ = ['Base', 'User', 'UserRole', 'UserSession', 'LoginAttempt']
\ No newline at end of file
+__all__ = ['Base', 'User', 'UserRole', 'UserSession', 'LoginAttempt', 'LoginAttemptArchive']
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 # import os
 # import base64
@@ -10,6 +10,11 @@ from app.models.base import Base
 
 class UserSession(Base):
     __tablename__ = 'user_sessions'
+    # Lookups by token use the unique index on session_token alone
+    __table_args__ = (
+        Index('ix_user_sessions_user_active', 'user_id', 'is_active'),
+        Index('ix_user_sessions_active_activity', 'is_active', 'last_activity'),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'))
@@ -33,6 +38,10 @@ class UserSession(Base):
 
 class LoginAttempt(Base):
     __tablename__ = 'login_attempts'
+    __table_args__ = (
+        Index('ix_login_attempts_ip_time', 'ip_address', 'timestamp'),
+        Index('ix_login_attempts_user_result_time', 'username', 'successful', 'timestamp'),
+    )
 
     id = Column(Integer, primary_key=True)
     username = Column(String(50), nullable=False)
@@ -45,4 +54,16 @@ class LoginAttempt(Base):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=True)
 
     # Relationship with User
-    user = relationship("User")
\ No newline at end of file
+    user = relationship("User")
+
+
+class LoginAttemptArchive(Base):
+    """Login attempts moved out of login_attempts by the retention job"""
+    __tablename__ = 'login_attempts_archive'
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    username = Column(String(50), nullable=False)
+    ip_address = Column(String(45), nullable=True)
+    successful = Column(Boolean, default=False)
+    timestamp = Column(DateTime, nullable=False, index=True)
+    user_id = Column(Integer, nullable=True)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import enum  # Add this import at the top
-from sqlalchemy import Column, Integer, String, Date, Text, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, Boolean, ForeignKey, Enum, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -127,6 +127,36 @@ class Transportation(Base):
     student = relationship("Student", back_populates="transportation")
 
 
+class DashboardStat(Base):
+    __tablename__ = 'dashboard_stats'
+    __table_args__ = (
+        UniqueConstraint('period', 'bucket', 'metric', name='uq_dashboard_stats_bucket'),
+    )
+
+    stat_id = Column(Integer, primary_key=True, autoincrement=True)
+    period = Column(String(10), nullable=False)  # 'day', 'month' or 'total'
+    bucket = Column(String(10), nullable=False)  # 'YYYY-MM-DD', 'YYYY-MM' or 'all'
+    metric = Column(String(50), nullable=False)
+    value = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<DashboardStat({self.period} {self.bucket} {self.metric}={self.value})>"
+
+
+class DataChangeLog(Base):
+    __tablename__ = 'data_change_log'
+
+    change_id = Column(Integer, primary_key=True, autoincrement=True)
+    table_name = Column(String(64), nullable=False)
+    record_id = Column(Integer, nullable=True)
+    operation = Column(String(10), nullable=False)  # 'insert', 'update' or 'delete'
+    origin = Column(String(32), nullable=False)  # Client that made the change
+    changed_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<DataChangeLog(#{self.change_id} {self.operation} {self.table_name} {self.record_id})>"
+
+
 class ActionType(enum.Enum):
     INSERT = "INSERT"
     UPDATE = "UPDATE"
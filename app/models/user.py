@@ -30,17 +30,32 @@ class User(Base):
 
     # Relationship will be defined later using backref
 
-    def set_password(self, password):
+    def set_password(self, password, rounds=12):
         """Set the user's password by generating a salt and hashing the password"""
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=rounds)
         password_hash = bcrypt.hashpw(password.encode('utf-8'), salt)
         self.salt = salt.decode('utf-8')
         self.password_hash = password_hash.decode('utf-8')
 
     def check_password(self, password):
-        """Check if the provided password matches the stored hash"""
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), self.salt.encode('utf-8'))
-        return password_hash.decode('utf-8') == self.password_hash
+        """Check if the provided password matches the stored hash, in constant time"""
+        try:
+            return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        except ValueError:
+            # Malformed stored hash
+            return False
+
+    @property
+    def password_rounds(self):
+        """Cost factor the stored hash was made with ("$2b$<rounds>$...")"""
+        try:
+            return int(self.password_hash.split('$')[2])
+        except (AttributeError, IndexError, ValueError):
+            return None
+
+    def needs_rehash(self, rounds):
+        """True when the stored hash was made with a different cost factor"""
+        return self.password_rounds != rounds
 
     @classmethod
     def get_current_time_utc(cls):
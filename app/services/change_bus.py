@@ -0,0 +1,234 @@
+import datetime
+import threading
+import uuid
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import func, inspect
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config.config import Config
+from app.database.db_connection import DataDatabase
+from app.models.student_models import DataChangeLog
+from app.utils.logger import Logger
+
+
+class DataChange(NamedTuple):
+    """A committed write published on the ChangeBus"""
+    table: str
+    pk: Optional[int]
+    op: str
+    # Written instance for local inserts and updates; None for deletes and remote changes
+    record: object = None
+    remote: bool = False
+
+
+class ChangeBus:
+    """
+    Publish/subscribe hub for committed data changes
+
+    CrudService publishes a DataChange for every row it creates, updates or
+    deletes once its transaction commits, so caches and views can react to
+    writes instead of polling. Callbacks run on the publishing thread; Qt
+    widgets subscribe through ChangeNotifier, which re-emits on the GUI thread.
+
+    When "change_log.enabled" is set, writes are also recorded in the
+    data_change_log table inside the same transaction, and start_polling()
+    publishes the changes other workstations made.
+    """
+    _instance = None
+
+    INSERT = 'insert'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+    # Change IDs below the high-water mark that are still re-read, so rows
+    # from transactions that committed out of ID order are not missed
+    REORDER_WINDOW = 200
+    POLL_BATCH_SIZE = 1000
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ChangeBus, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = Config()
+        self.db = DataDatabase()
+        self.logger = Logger()
+        self.origin = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._subscribers = []
+        self._log_available = None
+        self._last_change_id = None
+        self._seen_ids = set()
+        self._poll_thread = None
+        self._stop_polling = threading.Event()
+
+    def subscribe(self, callback: Callable[[List[DataChange]], None], tables: Optional[Iterable[str]] = None):
+        """
+        Register a callback for committed changes
+
+        Args:
+            callback: Callable receiving a list of DataChange
+            tables: Table names of interest (every table when omitted)
+        """
+        with self._lock:
+            self._subscribers.append((callback, frozenset(tables) if tables else None))
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers = [(other, tables) for other, tables in self._subscribers if other != callback]
+
+    def publish(self, changes: List[DataChange]):
+        """Deliver committed changes to the subscribers interested in their tables"""
+        if not changes:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for callback, tables in subscribers:
+            relevant = changes if tables is None else [change for change in changes if change.table in tables]
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                self.logger.error(f"Error in data change subscriber {getattr(callback, '__qualname__', callback)}: "
+                                  f"{str(e)}")
+
+    def log_enabled(self) -> bool:
+        """True when the change log is switched on and its table exists (checked once per process)"""
+        if not self.config.change_log_enabled:
+            return False
+        if self._log_available is None:
+            try:
+                self._log_available = inspect(self.db.engine).has_table(DataChangeLog.__tablename__)
+            except SQLAlchemyError as e:
+                self.logger.warning(f"Could not check for the data_change_log table: {str(e)}")
+                self._log_available = False
+            if not self._log_available:
+                self.logger.warning("change_log is enabled but data_change_log does not exist; "
+                                    "run scripts/create_change_log.py")
+        return self._log_available
+
+    def log(self, db_session, changes: List[DataChange]):
+        """
+        Record changes in data_change_log inside the caller's transaction
+
+        Does nothing unless the change log is enabled. A failure is logged and
+        leaves the write itself untouched.
+
+        Args:
+            db_session: Session holding the writes
+            changes: Changes made in this transaction
+        """
+        if not changes or not self.log_enabled():
+            return
+
+        now = datetime.datetime.now()
+        savepoint = db_session.begin_nested()
+        try:
+            db_session.bulk_insert_mappings(DataChangeLog, [
+                {'table_name': change.table, 'record_id': change.pk, 'operation': change.op,
+                 'origin': self.origin, 'changed_at': now}
+                for change in changes
+            ])
+            savepoint.commit()
+        except SQLAlchemyError as e:
+            savepoint.rollback()
+            self.logger.warning(f"Could not record data changes, other workstations will miss them: {str(e)}")
+
+    def start_polling(self):
+        """Start publishing other workstations' changes from a daemon thread (no-op unless enabled)"""
+        interval = self.config.change_log_poll_seconds
+        if interval <= 0 or not self.log_enabled():
+            return
+        with self._lock:
+            if self._poll_thread and self._poll_thread.is_alive():
+                return
+            self._stop_polling.clear()
+            self._poll_thread = threading.Thread(target=self._poll_loop, args=(interval,),
+                                                 name="ChangeLogPoll", daemon=True)
+            self._poll_thread.start()
+
+    def stop_polling(self):
+        self._stop_polling.set()
+
+    def _poll_loop(self, interval):
+        self.prune()
+        self.poll()
+        while not self._stop_polling.wait(interval):
+            self.poll()
+
+    def poll(self) -> int:
+        """
+        Publish the changes other clients logged since the last poll
+
+        The first call only records the current position.
+
+        Returns:
+            Number of changes published
+        """
+        session = self.db.session_factory()
+        try:
+            if self._last_change_id is None:
+                self._last_change_id = session.query(func.max(DataChangeLog.change_id)).scalar() or 0
+                self._seen_ids = {change_id for change_id, in session.query(DataChangeLog.change_id).filter(
+                    DataChangeLog.change_id > self._last_change_id - self.REORDER_WINDOW)}
+                return 0
+
+            rows = session.query(
+                DataChangeLog.change_id, DataChangeLog.table_name, DataChangeLog.record_id,
+                DataChangeLog.operation, DataChangeLog.origin
+            ).filter(
+                DataChangeLog.change_id > self._last_change_id - self.REORDER_WINDOW
+            ).order_by(DataChangeLog.change_id).limit(self.POLL_BATCH_SIZE).all()
+        except SQLAlchemyError as e:
+            self.logger.warning(f"Could not poll data_change_log: {str(e)}")
+            return 0
+        finally:
+            session.close()
+
+        changes = []
+        for change_id, table_name, record_id, operation, origin in rows:
+            if change_id in self._seen_ids:
+                continue
+            self._seen_ids.add(change_id)
+            self._last_change_id = max(self._last_change_id, change_id)
+            if origin != self.origin:
+                changes.append(DataChange(table_name, record_id, operation, remote=True))
+
+        floor = self._last_change_id - self.REORDER_WINDOW
+        self._seen_ids = {change_id for change_id in self._seen_ids if change_id > floor}
+
+        self.publish(changes)
+        return len(changes)
+
+    def prune(self) -> int:
+        """
+        Delete change-log rows older than "change_log.retention_hours"
+
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = datetime.datetime.now() - datetime.timedelta(hours=self.config.change_log_retention_hours)
+        session = self.db.session_factory()
+        try:
+            deleted = session.query(DataChangeLog).filter(
+                DataChangeLog.changed_at < cutoff).delete(synchronize_session=False)
+            session.commit()
+            return deleted
+        except SQLAlchemyError as e:
+            session.rollback()
+            self.logger.warning(f"Could not prune data_change_log: {str(e)}")
+            return 0
+        finally:
+            session.close()
+
+    def create_log_table(self, engine=None):
+        """Create the data_change_log table if it does not exist"""
+        engine = engine or self.db.engine
+        DataChangeLog.__table__.create(engine, checkfirst=True)
+        if engine is self.db.engine:
+            self._log_available = True
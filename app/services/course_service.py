@@ -1,4 +1,5 @@
 from app.services.crud_service import CrudService
+from app.services.reference_cache import ReferenceCache
 from app.models.student_models import Course
 from typing import Dict, List, Any, Tuple, Union
 
@@ -8,6 +9,7 @@ class CourseService(CrudService):
 
     def __init__(self):
         super().__init__(Course)
+        self.cache = ReferenceCache()
 
     def create_course(self, course_data: Dict[str, Any]) -> Tuple[bool, Union[Course, str]]:
         """
@@ -30,7 +32,23 @@ class CourseService(CrudService):
         """
         Get all courses
 
+        Served from the reference cache; any write to the courses table drops
+        the cached list.
+
         Returns:
             List of all courses
         """
-        return self.read_all()
\ No newline at end of file
+        try:
+            return list(self.cache.get_or_load(('courses', 'all'), self._query_all_courses,
+                                               tables=[Course.__tablename__]))
+        except Exception as e:
+            self.logger.error(f"Error reading courses: {str(e)}")
+            return []
+
+    def _query_all_courses(self) -> List[Course]:
+        # Unlike read_all, errors propagate so an empty list is never cached
+        db_session = self.db.get_session()
+        try:
+            return db_session.query(Course).all()
+        finally:
+            db_session.close()
@@ -1,6 +1,14 @@
+from collections import Counter
+import zlib
+from sqlalchemy import and_, or_, case, func, cast, String
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Dict, List, Any, Type, Optional, Union, Tuple
+from sqlalchemy.orm import selectinload
+from typing import Dict, List, Any, Type, Optional, Union, Tuple, Iterable, Iterator
 from app.database.db_connection import DataDatabase
+from app.services.change_bus import ChangeBus, DataChange
+from app.services.dashboard_stats import DashboardStats
+from app.services.full_text_search import FullTextSearch
+from app.services.trigram_index import TrigramSearch
 from app.utils.logger import Logger
 
 
@@ -10,6 +18,9 @@ class CrudService:
     Each table-specific service will inherit from this base class.
     """
 
+    # Number of rows flushed together by the bulk_* methods
+    BULK_CHUNK_SIZE = 500
+
     def __init__(self, model_class=None):
         """
         Initialize with model class and create database session
@@ -20,6 +31,10 @@ class CrudService:
         self.model_class = model_class
         self.db = DataDatabase()
         self.logger = Logger()
+        self.full_text = FullTextSearch()
+        self.search_index = TrigramSearch()
+        self.stats = DashboardStats()
+        self.changes = ChangeBus()
 
     def create(self, data: Dict[str, Any]) -> Tuple[bool, Union[object, str]]:
         """
@@ -52,15 +67,17 @@ class CrudService:
 
             # Add and commit
             db_session.add(new_record)
+            if self.stats.tracks(self.model_class):
+                self.stats.apply(db_session, self.stats.contributions(new_record))
+            db_session.flush()
+            changes = [self._change(ChangeBus.INSERT, new_record)]
+            self.changes.log(db_session, changes)
             db_session.commit()
+            self.changes.publish(changes)
 
-            # Create a fresh copy of the object's data
-            result = self.model_class()
-            for column in new_record.__table__.columns:
-                setattr(result, column.name, getattr(new_record, column.name))
-
-            # Return the detached copy
-            return True, result
+            # Sessions do not expire on commit, so the record stays readable
+            # once close() detaches it
+            return True, new_record
 
         except SQLAlchemyError as e:
             db_session.rollback()
@@ -89,15 +106,8 @@ class CrudService:
         try:
             record = db_session.query(self.model_class).get(record_id)
 
-            if not record:
-                return None
-
-            # Create a copy of the record data to return
-            result = self.model_class()
-            for column in record.__table__.columns:
-                setattr(result, column.name, getattr(record, column.name))
-
-            return result
+            # The record is detached with its loaded columns when the session closes
+            return record
         except Exception as e:
             self.logger.error(f"Error reading record #{record_id}: {str(e)}")
             return None
@@ -116,32 +126,361 @@ class CrudService:
         """
         db_session = self.db.get_session()
         try:
-            query = db_session.query(self.model_class)
+            query = self._apply_filters(db_session.query(self.model_class), filters)
+
+            # Execute query; records are detached when the session closes
+            return query.all()
+        except Exception as e:
+            self.logger.error(f"Error reading records: {str(e)}")
+            return []
+        finally:
+            db_session.close()
+
+    def read_page(self, filters: Dict[str, Any] = None, order_by: Optional[str] = None,
+                  limit: int = 100, after_key: Any = None) -> Tuple[List[object], Any]:
+        """
+        Get one page of records using keyset (seek) pagination
+
+        Instead of OFFSET, each page continues after the key of the last row
+        of the previous page, so the cost of a page does not grow with its
+        position in the table.
 
-            # Apply filters if provided
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model_class, field):
-                        query = query.filter(getattr(self.model_class, field) == value)
+        Args:
+            filters: Dictionary of field:value pairs to filter by
+            order_by: Column to order by, prefixed with '-' for descending.
+                      Defaults to the primary key. The column should not be nullable.
+            limit: Maximum number of records in the page
+            after_key: Key returned with the previous page, or None for the first page
 
-            # Execute query
-            records = query.all()
+        Returns:
+            Tuple of (list of model instances, key for the next page or None if this is the last page)
+        """
+        pk_column = self._primary_key_column()
+        descending = bool(order_by) and order_by.startswith('-')
+        order_name = order_by.lstrip('-') if order_by else pk_column.key
 
-            # Create copies of the records to return
-            results = []
-            for record in records:
-                result = self.model_class()
-                for column in record.__table__.columns:
-                    setattr(result, column.name, getattr(record, column.name))
-                results.append(result)
+        if not hasattr(self.model_class, order_name):
+            self.logger.error(f"Cannot order {self.model_class.__name__} by unknown field '{order_name}'")
+            return [], None
 
-            return results
+        order_column = getattr(self.model_class, order_name)
+        ordered_by_pk = order_name == pk_column.key
+
+        db_session = self.db.get_session()
+        try:
+            query = self._apply_filters(db_session.query(self.model_class), filters)
+
+            # Seek past the previous page; ties on the order column are broken by the primary key
+            if after_key is not None:
+                if ordered_by_pk:
+                    query = query.filter(order_column < after_key if descending else order_column > after_key)
+                else:
+                    last_value, last_pk = after_key
+                    if descending:
+                        query = query.filter(or_(order_column < last_value,
+                                                 and_(order_column == last_value, pk_column < last_pk)))
+                    else:
+                        query = query.filter(or_(order_column > last_value,
+                                                 and_(order_column == last_value, pk_column > last_pk)))
+
+            if ordered_by_pk:
+                order_clauses = [order_column.desc() if descending else order_column.asc()]
+            else:
+                order_clauses = [order_column.desc(), pk_column.desc()] if descending \
+                    else [order_column.asc(), pk_column.asc()]
+
+            # Fetch one extra row to know whether another page exists
+            records = query.order_by(*order_clauses).limit(limit + 1).all()
+
+            next_key = None
+            if len(records) > limit:
+                records = records[:limit]
+                last = records[-1]
+                last_pk = getattr(last, pk_column.key)
+                next_key = last_pk if ordered_by_pk else (getattr(last, order_name), last_pk)
+
+            return records, next_key
         except Exception as e:
-            self.logger.error(f"Error reading records: {str(e)}")
+            self.logger.error(f"Error reading page of records: {str(e)}")
+            return [], None
+        finally:
+            db_session.close()
+
+    def iter_all(self, filters: Dict[str, Any] = None, batch_size: int = 1000) -> Iterator[object]:
+        """
+        Stream all records, optionally filtered, without loading the whole table
+
+        Rows are fetched from a server-side cursor in batches of batch_size.
+        The stream uses its own session, so service calls made while
+        iterating do not close it; it stays open until the generator is
+        exhausted or closed. Errors are logged and re-raised so a cut-off
+        stream is never mistaken for a complete one.
+
+        Args:
+            filters: Dictionary of field:value pairs to filter by
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Model instances in primary key order
+        """
+        db_session = self.db.session_factory()
+        try:
+            query = self._apply_filters(db_session.query(self.model_class), filters)
+            query = query.order_by(self._primary_key_column().asc())
+            query = query.execution_options(stream_results=True).yield_per(batch_size)
+
+            for record in query:
+                yield record
+        except Exception as e:
+            self.logger.error(f"Error streaming records: {str(e)}")
+            raise
+        finally:
+            db_session.close()
+
+    def count(self, filters: Dict[str, Any] = None) -> int:
+        """
+        Count records, optionally filtered
+
+        Args:
+            filters: Dictionary of field:value pairs to filter by
+
+        Returns:
+            Number of matching records
+        """
+        db_session = self.db.get_session()
+        try:
+            query = db_session.query(func.count(self._primary_key_column()))
+            return self._apply_filters(query, filters).scalar() or 0
+        except Exception as e:
+            self.logger.error(f"Error counting records: {str(e)}")
+            return 0
+        finally:
+            db_session.close()
+
+    def table_checksum(self) -> Optional[Tuple[int, Any, int]]:
+        """
+        Summarize the whole table so a caller can tell cheaply whether anything changed
+
+        On MySQL this is a single aggregate over per-row CRC32 values and
+        only three numbers cross the wire. Other databases have no CRC32, so
+        the rows are streamed and hashed locally instead.
+
+        Returns:
+            Tuple of (row count, highest primary key, XOR of the row checksums),
+            or None on error
+        """
+        pk_column = self._primary_key_column()
+        db_session = self.db.get_session()
+        try:
+            if self._checksums_in_database():
+                count, max_key, checksum = db_session.query(
+                    func.count(pk_column), func.max(pk_column),
+                    func.coalesce(func.bit_xor(self._row_checksum_expression()), 0)
+                ).one()
+                return count, max_key, int(checksum)
+
+            count, max_key, checksum = 0, None, 0
+            for row in self._checksum_query(db_session).yield_per(1000):
+                count += 1
+                max_key = row[0] if max_key is None else max(max_key, row[0])
+                checksum ^= self._row_checksum(row[1:])
+            return count, max_key, checksum
+        except Exception as e:
+            self.logger.error(f"Error computing checksum of {self.model_class.__name__} table: {str(e)}")
+            return None
+        finally:
+            db_session.close()
+
+    def row_checksums(self, record_ids: Optional[List[int]] = None,
+                      up_to: Any = None) -> Optional[Dict[Any, int]]:
+        """
+        Get a checksum of every column of each row, to find rows that changed
+
+        Args:
+            record_ids: Only these primary keys
+            up_to: Only rows whose primary key is at most this value
+
+        Returns:
+            Dictionary of primary key: checksum, or None on error (an empty
+            dictionary always means no rows)
+        """
+        if record_ids is not None and not record_ids:
+            return {}
+
+        pk_column = self._primary_key_column()
+        in_database = self._checksums_in_database()
+        db_session = self.db.get_session()
+        try:
+            if in_database:
+                query = db_session.query(pk_column, self._row_checksum_expression())
+            else:
+                query = self._checksum_query(db_session)
+            if up_to is not None:
+                query = query.filter(pk_column <= up_to)
+
+            chunks = [None]
+            if record_ids is not None:
+                chunks = [record_ids[start:start + self.BULK_CHUNK_SIZE]
+                          for start in range(0, len(record_ids), self.BULK_CHUNK_SIZE)]
+
+            checksums = {}
+            for chunk in chunks:
+                chunk_query = query if chunk is None else query.filter(pk_column.in_(chunk))
+                for row in chunk_query:
+                    checksums[row[0]] = int(row[1]) if in_database else self._row_checksum(row[1:])
+            return checksums
+        except Exception as e:
+            self.logger.error(f"Error reading row checksums: {str(e)}")
+            return None
+        finally:
+            db_session.close()
+
+    def _checksums_in_database(self) -> bool:
+        return self.db.engine.dialect.name == 'mysql'
+
+    def _row_checksum_expression(self):
+        """CRC32 over all columns; NULL is spelled out because CONCAT_WS skips it"""
+        return func.crc32(func.concat_ws('|', *[
+            func.coalesce(cast(column, String), '\\N') for column in self.model_class.__table__.columns
+        ]))
+
+    def _checksum_query(self, db_session):
+        """Primary key followed by every column, for hashing rows locally"""
+        return db_session.query(self._primary_key_column(), *self.model_class.__table__.columns)
+
+    @staticmethod
+    def _row_checksum(values) -> int:
+        return zlib.crc32('|'.join('\\N' if value is None else str(value) for value in values).encode('utf-8'))
+
+    def _find(self, *criteria, relevance=None) -> List[object]:
+        """
+        Get records matching SQL criteria
+
+        Args:
+            criteria: SQLAlchemy filter expressions, combined with AND
+            relevance: Optional score expression; best matches come first
+
+        Returns:
+            List of model instances, by relevance then primary key order
+        """
+        db_session = self.db.get_session()
+        try:
+            query = db_session.query(self.model_class).filter(*criteria)
+            if relevance is not None:
+                query = query.order_by(relevance.desc())
+            return query.order_by(self._primary_key_column()).all()
+        except Exception as e:
+            self.logger.error(f"Error searching {self.model_class.__name__} records: {str(e)}")
             return []
         finally:
             db_session.close()
 
+    def _search_with_reasons(self, conditions: List[Tuple[str, Any]],
+                             relevance=None) -> Tuple[List[object], Dict[int, List[str]]]:
+        """
+        Search with several conditions in one query and report which ones matched
+
+        Each condition sets one bit of a CASE-built match mask computed by the
+        database, which is decoded into match reasons.
+
+        Args:
+            conditions: List of (match reason, SQLAlchemy condition) in display order
+            relevance: Optional score expression; best matches come first
+
+        Returns:
+            Tuple of (matching records, dict of primary key: list of match reasons)
+        """
+        if not conditions:
+            return [], {}
+
+        pk_column = self._primary_key_column()
+        match_mask = sum(
+            case((condition, 1 << bit), else_=0)
+            for bit, (_, condition) in enumerate(conditions)
+        ).label('match_mask')
+
+        db_session = self.db.get_session()
+        try:
+            query = db_session.query(self.model_class, match_mask).filter(
+                or_(*[condition for _, condition in conditions])
+            )
+            if relevance is not None:
+                query = query.order_by(relevance.desc())
+            rows = query.order_by(pk_column).all()
+
+            records = []
+            match_reasons = {}
+            for record, mask in rows:
+                records.append(record)
+                match_reasons[getattr(record, pk_column.key)] = [
+                    reason for bit, (reason, _) in enumerate(conditions) if mask & (1 << bit)
+                ]
+
+            return records, match_reasons
+        except Exception as e:
+            self.logger.error(f"Error searching {self.model_class.__name__} records: {str(e)}")
+            return [], {}
+        finally:
+            db_session.close()
+
+    def fuzzy_search(self, search_term: str,
+                     limit: Optional[int] = None) -> Optional[Tuple[List[object], Dict[int, List[str]]]]:
+        """
+        Typo-tolerant search answered by the in-process trigram index
+
+        Matching and ranking happen in memory; the database is only asked for
+        the matched rows by primary key.
+
+        Args:
+            search_term: Term to search for
+            limit: Maximum number of records
+
+        Returns:
+            Tuple of (records best match first, dict of primary key: match reasons),
+            or None when the index is not available for this table yet
+        """
+        hits = self.search_index.search(self.model_class, search_term, limit)
+        if hits is None:
+            return None
+        records = self.read_many([hit.key for hit in hits]) or []
+        return records, {hit.key: hit.fields for hit in hits}
+
+    def read_many(self, record_ids: List[int]) -> Optional[List[object]]:
+        """
+        Get records by primary key with IN queries, keeping the order of record_ids
+
+        Args:
+            record_ids: Primary key IDs; IDs that do not exist are skipped
+
+        Returns:
+            List of model instances, or None on error
+        """
+        if not record_ids:
+            return []
+
+        pk_column = self._primary_key_column()
+        db_session = self.db.get_session()
+        try:
+            found = {}
+            for start in range(0, len(record_ids), self.BULK_CHUNK_SIZE):
+                chunk = record_ids[start:start + self.BULK_CHUNK_SIZE]
+                for record in db_session.query(self.model_class).filter(pk_column.in_(chunk)):
+                    found[getattr(record, pk_column.key)] = record
+            return [found[record_id] for record_id in record_ids if record_id in found]
+        except Exception as e:
+            self.logger.error(f"Error loading {self.model_class.__name__} records: {str(e)}")
+            return None
+        finally:
+            db_session.close()
+
+    def _apply_filters(self, query, filters: Optional[Dict[str, Any]]):
+        """Apply field:value equality filters to a query, ignoring unknown fields"""
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model_class, field):
+                    query = query.filter(getattr(self.model_class, field) == value)
+        return query
+
     def update(self, record_id: int, data: Dict[str, Any]) -> Tuple[bool, Union[object, str]]:
         """
         Update an existing record
@@ -160,20 +499,27 @@ class CrudService:
             if not record:
                 return False, f"Record with ID {record_id} not found"
 
+            track_stats = self.stats.tracks(self.model_class)
+            if track_stats:
+                deltas = Counter()
+                deltas.subtract(self.stats.contributions(record))
+
             # Update fields
             for field, value in data.items():
                 if hasattr(record, field):
                     setattr(record, field, value)
 
+            if track_stats:
+                deltas.update(self.stats.contributions(record))
+                self.stats.apply(db_session, deltas)
+
             # Commit changes
+            changes = [self._change(ChangeBus.UPDATE, record)]
+            self.changes.log(db_session, changes)
             db_session.commit()
+            self.changes.publish(changes)
 
-            # Create a copy of the updated record to return
-            result = self.model_class()
-            for column in record.__table__.columns:
-                setattr(result, column.name, getattr(record, column.name))
-
-            return True, result
+            return True, record
         except SQLAlchemyError as e:
             db_session.rollback()
             error_msg = f"Database error updating record #{record_id}: {str(e)}"
@@ -204,9 +550,16 @@ class CrudService:
             if not record:
                 return False, f"Record with ID {record_id} not found"
 
-            # Delete record
+            # Delete record, taking rows removed by cascades off the dashboard counters too
+            if self.stats.tracks(self.model_class):
+                deltas = Counter()
+                deltas.subtract(self.stats.contributions(record, cascade=True))
+                self.stats.apply(db_session, deltas)
             db_session.delete(record)
+            changes = [DataChange(self.model_class.__tablename__, record_id, ChangeBus.DELETE)]
+            self.changes.log(db_session, changes)
             db_session.commit()
+            self.changes.publish(changes)
 
             return True, f"Record #{record_id} deleted successfully"
         except SQLAlchemyError as e:
@@ -222,6 +575,277 @@ class CrudService:
         finally:
             db_session.close()
 
+    def bulk_create(self, records: List[Dict[str, Any]],
+                    chunk_size: Optional[int] = None) -> List[Tuple[bool, Union[object, str]]]:
+        """
+        Create many records in a single transaction
+
+        Rows are flushed in chunks. If a chunk fails, its rows are retried one
+        by one inside savepoints so only the offending rows are rejected.
+
+        Args:
+            records: List of dictionaries of field:value pairs
+            chunk_size: Rows per flush (defaults to BULK_CHUNK_SIZE)
+
+        Returns:
+            List of (success, object or error message), one per input row in order
+        """
+        primary_key_cols = {column.name for column in self.model_class.__table__.primary_key}
+
+        def build(data):
+            new_record = self.model_class()
+            for field, value in data.items():
+                # Skip primary key fields (let the database assign them)
+                if field in primary_key_cols:
+                    continue
+                if hasattr(new_record, field):
+                    setattr(new_record, field, value)
+            return new_record
+
+        def apply(db_session, new_record):
+            db_session.add(new_record)
+
+        return self._run_bulk(records, build, apply, chunk_size, "creating")
+
+    def bulk_update(self, updates: Dict[int, Dict[str, Any]],
+                    chunk_size: Optional[int] = None) -> List[Tuple[bool, Union[object, str]]]:
+        """
+        Update many records in a single transaction
+
+        Each chunk of records is loaded with one IN query instead of one
+        query per ID.
+
+        Args:
+            updates: Dictionary of record_id: {field: value} pairs
+            chunk_size: Rows per flush (defaults to BULK_CHUNK_SIZE)
+
+        Returns:
+            List of (success, updated object or error message) in the order of updates
+        """
+        items = list(updates.items())
+
+        def apply(db_session, record, data):
+            for field, value in data.items():
+                if hasattr(record, field):
+                    setattr(record, field, value)
+
+        return self._run_bulk_by_id(items, apply, chunk_size, "updating", return_records=True)
+
+    def bulk_delete(self, record_ids: Iterable[int],
+                    chunk_size: Optional[int] = None) -> List[Tuple[bool, str]]:
+        """
+        Delete many records in a single transaction
+
+        Relationships with delete cascades are preloaded per chunk so related
+        rows are removed exactly as delete() would remove them.
+
+        Args:
+            record_ids: Primary key IDs of the records to delete
+            chunk_size: Rows per flush (defaults to BULK_CHUNK_SIZE)
+
+        Returns:
+            List of (success, message) in the order of record_ids
+        """
+        items = [(record_id, None) for record_id in record_ids]
+
+        def apply(db_session, record, _data):
+            db_session.delete(record)
+
+        return self._run_bulk_by_id(items, apply, chunk_size, "deleting", return_records=False,
+                                    load_cascades=True)
+
+    def _primary_key_column(self):
+        """Get the primary key column attribute of the model"""
+        return self.model_class.__mapper__.primary_key[0]
+
+    def _change(self, op: str, record) -> DataChange:
+        """Describe a write of a flushed record for the ChangeBus"""
+        return DataChange(self.model_class.__tablename__, getattr(record, self._primary_key_column().key), op, record)
+
+    def _run_bulk(self, rows, build, apply, chunk_size, action):
+        """
+        Flush prepared rows chunk by chunk and commit once
+
+        Args:
+            rows: Input rows
+            build: Callable turning an input row into a model instance
+            apply: Callable (db_session, instance) adding the instance to the session
+            chunk_size: Rows per flush
+            action: Verb used in error messages
+
+        Returns:
+            List of (success, object or error message)
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        outcomes = [None] * len(rows)
+        db_session = self.db.get_session()
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = []
+                for index in range(start, min(start + chunk_size, len(rows))):
+                    try:
+                        chunk.append((index, build(rows[index])))
+                    except Exception as e:
+                        outcomes[index] = (False, f"Error {action} record: {str(e)}")
+
+                self._flush_chunk(db_session, chunk, lambda instance: apply(db_session, instance),
+                                  outcomes, action, "record")
+
+            if self.stats.tracks(self.model_class):
+                deltas = Counter()
+                for outcome in outcomes:
+                    if outcome and outcome[0]:
+                        deltas.update(self.stats.contributions(outcome[1]))
+                self.stats.apply(db_session, deltas)
+
+            changes = [self._change(ChangeBus.INSERT, outcome[1]) for outcome in outcomes if outcome and outcome[0]]
+            self.changes.log(db_session, changes)
+            db_session.commit()
+            self.changes.publish(changes)
+            return outcomes
+
+        except Exception as e:
+            db_session.rollback()
+            error_msg = f"Database error {action} records in bulk: {str(e)}"
+            self.logger.error(error_msg)
+            return [(False, error_msg)] * len(rows)
+        finally:
+            db_session.close()
+
+    def _run_bulk_by_id(self, items, apply, chunk_size, action, return_records, load_cascades=False):
+        """
+        Load existing records by ID chunk by chunk, apply a change and commit once
+
+        Args:
+            items: List of (record_id, data) pairs
+            apply: Callable (db_session, record, data) performing the change
+            chunk_size: Rows per flush
+            action: Verb used in error messages
+            return_records: Return detached records instead of success messages
+            load_cascades: Preload relationships that cascade deletes
+
+        Returns:
+            List of (success, detached object or message)
+        """
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        pk_column = self._primary_key_column()
+        outcomes = [None] * len(items)
+        track_stats = self.stats.tracks(self.model_class)
+        # Dashboard counters contributed by each record before the change
+        before = {}
+        db_session = self.db.get_session()
+        try:
+            for start in range(0, len(items), chunk_size):
+                chunk_items = items[start:start + chunk_size]
+                chunk_ids = {record_id for record_id, _ in chunk_items}
+
+                query = db_session.query(self.model_class).filter(pk_column.in_(chunk_ids))
+                if load_cascades:
+                    cascades = [selectinload(getattr(self.model_class, rel.key))
+                                for rel in self.model_class.__mapper__.relationships
+                                if rel.cascade.delete]
+                    if cascades:
+                        query = query.options(*cascades)
+                found = {getattr(record, pk_column.key): record for record in query.all()}
+                if track_stats:
+                    for record_id, record in found.items():
+                        before[record_id] = self.stats.contributions(record, cascade=not return_records)
+
+                chunk = []
+                for offset, (record_id, data) in enumerate(chunk_items):
+                    index = start + offset
+                    record = found.get(record_id)
+                    if record is None:
+                        outcomes[index] = (False, f"Record with ID {record_id} not found")
+                    else:
+                        chunk.append((index, (record, data)))
+
+                self._flush_chunk(db_session, chunk, lambda pair: apply(db_session, *pair),
+                                  outcomes, action, "record")
+
+            if track_stats:
+                deltas = Counter()
+                changed = {}
+                for index, outcome in enumerate(outcomes):
+                    if outcome and outcome[0]:
+                        changed[items[index][0]] = outcome[1][0]
+                for record_id, record in changed.items():
+                    deltas.subtract(before[record_id])
+                    if return_records:
+                        deltas.update(self.stats.contributions(record))
+                self.stats.apply(db_session, deltas)
+
+            changes = []
+            for index, outcome in enumerate(outcomes):
+                if outcome and outcome[0]:
+                    record_id = items[index][0]
+                    if return_records:
+                        changes.append(self._change(ChangeBus.UPDATE, outcome[1][0]))
+                    else:
+                        changes.append(DataChange(self.model_class.__tablename__, record_id, ChangeBus.DELETE))
+            self.changes.log(db_session, changes)
+            db_session.commit()
+            self.changes.publish(changes)
+
+            for index, outcome in enumerate(outcomes):
+                if outcome and outcome[0]:
+                    record_id = items[index][0]
+                    if return_records:
+                        outcomes[index] = (True, outcome[1][0])
+                    else:
+                        outcomes[index] = (True, f"Record #{record_id} deleted successfully")
+            return outcomes
+
+        except Exception as e:
+            db_session.rollback()
+            error_msg = f"Database error {action} records in bulk: {str(e)}"
+            self.logger.error(error_msg)
+            return [(False, error_msg)] * len(items)
+        finally:
+            db_session.close()
+
+    def _flush_chunk(self, db_session, chunk, apply, outcomes, action, label):
+        """
+        Apply and flush a chunk inside a savepoint, isolating failing rows on error
+
+        Args:
+            db_session: Active database session
+            chunk: List of (index, payload) pairs
+            apply: Callable applying one payload to the session
+            outcomes: Outcome list updated in place, (True, payload) on success
+            action: Verb used in error messages
+            label: Noun used in error messages
+        """
+        if not chunk:
+            return
+
+        savepoint = db_session.begin_nested()
+        try:
+            for _, payload in chunk:
+                apply(payload)
+            db_session.flush()
+            savepoint.commit()
+            for index, payload in chunk:
+                outcomes[index] = (True, payload)
+            return
+        except SQLAlchemyError as e:
+            savepoint.rollback()
+            self.logger.warning(f"Bulk chunk failed while {action}, retrying row by row: {str(e)}")
+
+        # Slow path: isolate the failing rows
+        for index, payload in chunk:
+            savepoint = db_session.begin_nested()
+            try:
+                apply(payload)
+                db_session.flush()
+                savepoint.commit()
+                outcomes[index] = (True, payload)
+            except SQLAlchemyError as e:
+                savepoint.rollback()
+                error_msg = f"Database error {action} {label}: {str(e)}"
+                self.logger.error(error_msg)
+                outcomes[index] = (False, error_msg)
+
     def exists(self, record_id: int) -> bool:
         """
         Check if a record exists
@@ -0,0 +1,266 @@
+import datetime
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, inspect, or_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from app.database.db_connection import DataDatabase
+from app.models.student_models import Course, DashboardStat, Enrollment, HostelManagement, Student
+from app.utils.logger import Logger
+
+# (period, bucket, metric)
+StatKey = Tuple[str, str, str]
+
+
+class DashboardStats:
+    """
+    Pre-aggregated dashboard counters stored in the dashboard_stats table
+
+    Each row is one counter for a period bucket: admissions and enrollment
+    status per day and per month, and running totals for students by gender,
+    enrollments by status, hostel residents and courses. CrudService applies
+    the change in counters of every write in the same transaction as the
+    write itself, so the dashboard reads a few dozen rows instead of scanning
+    the base tables. rebuild() recomputes everything when drift is suspected.
+    """
+    _instance = None
+
+    DAY = 'day'
+    MONTH = 'month'
+    TOTAL = 'total'
+    ALL = 'all'
+
+    TRACKED_MODELS = (Student, Enrollment, HostelManagement, Course)
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(DashboardStats, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.db = DataDatabase()
+        self.logger = Logger()
+        self._available = None
+
+    def available(self) -> bool:
+        """True once the dashboard_stats table exists (checked once per process)"""
+        if self._available is None:
+            try:
+                self._available = inspect(self.db.engine).has_table(DashboardStat.__tablename__)
+            except SQLAlchemyError as e:
+                self.logger.warning(f"Could not check for the dashboard_stats table: {str(e)}")
+                self._available = False
+        return self._available
+
+    def tracks(self, model_class) -> bool:
+        return model_class in self.TRACKED_MODELS and self.available()
+
+    @classmethod
+    def _dated_keys(cls, date_value, metric) -> List[StatKey]:
+        keys = [(cls.TOTAL, cls.ALL, metric)]
+        if date_value is not None:
+            keys.append((cls.DAY, date_value.strftime('%Y-%m-%d'), metric))
+            keys.append((cls.MONTH, date_value.strftime('%Y-%m'), metric))
+        return keys
+
+    @classmethod
+    def student_keys(cls, gender, admission_date) -> List[StatKey]:
+        """Counters one student contributes to"""
+        keys = cls._dated_keys(admission_date, 'students')
+        gender = str(gender or '').upper()
+        if gender.startswith('M'):
+            keys.extend(cls._dated_keys(admission_date, 'students_male'))
+        elif gender.startswith('F'):
+            keys.extend(cls._dated_keys(admission_date, 'students_female'))
+        return keys
+
+    @classmethod
+    def enrollment_keys(cls, completion_status, date_of_enrollment) -> List[StatKey]:
+        """Counters one enrollment contributes to"""
+        if completion_status is None:
+            return []
+        metric = 'enrollments_completed' if completion_status else 'enrollments_active'
+        return cls._dated_keys(date_of_enrollment, metric)
+
+    def contributions(self, record, cascade: bool = False) -> Counter:
+        """
+        Get the counters a record adds to
+
+        Args:
+            record: Instance of a tracked model
+            cascade: Also include rows deleted along with a student
+
+        Returns:
+            Counter of StatKey: amount
+        """
+        counts = Counter()
+        if isinstance(record, Student):
+            counts.update(self.student_keys(record.gender, record.admission_date))
+            if cascade:
+                for enrollment in record.enrollments:
+                    counts.update(self.contributions(enrollment))
+                for hostel in record.hostel_info:
+                    counts.update(self.contributions(hostel))
+        elif isinstance(record, Enrollment):
+            counts.update(self.enrollment_keys(record.completion_status, record.date_of_enrollment))
+        elif isinstance(record, HostelManagement):
+            counts[(self.TOTAL, self.ALL, 'hostel_students')] += 1
+        elif isinstance(record, Course):
+            counts[(self.TOTAL, self.ALL, 'courses')] += 1
+        return counts
+
+    def apply(self, db_session, deltas: Dict[StatKey, int]):
+        """
+        Add deltas to the counters inside the caller's transaction
+
+        Uses UPDATE value = value + delta so concurrent clients do not
+        overwrite each other; missing rows are inserted. A failure is logged
+        and leaves the write itself untouched (run rebuild() to resync).
+
+        Args:
+            db_session: Session holding the write being recorded
+            deltas: Dictionary of StatKey: change
+        """
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        savepoint = db_session.begin_nested()
+        try:
+            for (period, bucket, metric), delta in deltas.items():
+                self._add(db_session, period, bucket, metric, delta)
+            savepoint.commit()
+        except SQLAlchemyError as e:
+            savepoint.rollback()
+            self.logger.warning(f"Could not update dashboard_stats, counters may drift: {str(e)}")
+
+    @staticmethod
+    def _add(db_session, period, bucket, metric, delta):
+        criteria = and_(DashboardStat.period == period, DashboardStat.bucket == bucket,
+                        DashboardStat.metric == metric)
+
+        def increment():
+            return db_session.query(DashboardStat).filter(criteria).update(
+                {DashboardStat.value: DashboardStat.value + delta}, synchronize_session=False)
+
+        if increment():
+            return
+
+        insert = db_session.begin_nested()
+        try:
+            db_session.add(DashboardStat(period=period, bucket=bucket, metric=metric, value=delta))
+            db_session.flush()
+            insert.commit()
+        except IntegrityError:
+            # Another client created the row first
+            insert.rollback()
+            increment()
+
+    def read(self, session, months: List[datetime.datetime],
+             since: datetime.date) -> Optional[Dict[str, object]]:
+        """
+        Read the dashboard figures from the pre-aggregated rows
+
+        Args:
+            session: Database session to use
+            months: First day of each month to report admissions for
+            since: First day counted as a new registration
+
+        Returns:
+            Dictionary in the shape of DashboardWidget's analytics, or None when
+            the table is missing or has not been built yet
+        """
+        if not self.available():
+            return None
+
+        first_month = months[0].strftime('%Y-%m')
+        rows = session.query(DashboardStat.period, DashboardStat.bucket,
+                             DashboardStat.metric, DashboardStat.value).filter(or_(
+            DashboardStat.period == self.TOTAL,
+            and_(DashboardStat.period == self.MONTH, DashboardStat.bucket >= first_month,
+                 DashboardStat.metric == 'students'),
+            and_(DashboardStat.period == self.DAY, DashboardStat.bucket >= since.strftime('%Y-%m-%d'),
+                 DashboardStat.metric == 'students'),
+        )).all()
+
+        totals = {}
+        monthly = {}
+        new_registrations = 0
+        for period, bucket, metric, value in rows:
+            if period == self.TOTAL:
+                totals[metric] = value
+            elif period == self.MONTH:
+                monthly[bucket] = value
+            else:
+                new_registrations += value
+
+        # rebuild() always writes the student total, so its absence means "not built"
+        if 'students' not in totals:
+            return None
+
+        return {
+            'total_students': totals.get('students', 0),
+            'male_count': totals.get('students_male', 0),
+            'female_count': totals.get('students_female', 0),
+            'active_courses': totals.get('courses', 0),
+            'active_enrollments': totals.get('enrollments_active', 0),
+            'completed_enrollments': totals.get('enrollments_completed', 0),
+            'new_registrations': new_registrations,
+            'hostel_students': totals.get('hostel_students', 0),
+            'monthly_admissions': [
+                (month.strftime("%b %y"), monthly.get(month.strftime('%Y-%m'), 0)) for month in months
+            ],
+        }
+
+    def rebuild(self, engine=None) -> int:
+        """
+        Recompute every counter from the base tables, creating the table if needed
+
+        Args:
+            engine: Engine to rebuild (defaults to the data database engine)
+
+        Returns:
+            Number of counter rows written
+        """
+        engine = engine or self.db.engine
+        DashboardStat.__table__.create(engine, checkfirst=True)
+
+        session = self.db.session_factory(bind=engine)
+        try:
+            counts = Counter({(self.TOTAL, self.ALL, 'students'): 0})
+
+            for gender, admission_date, count in session.query(
+                    Student.gender, Student.admission_date, func.count(Student.student_id)
+            ).group_by(Student.gender, Student.admission_date):
+                for key in self.student_keys(gender, admission_date):
+                    counts[key] += count
+
+            for status, enrolled_on, count in session.query(
+                    Enrollment.completion_status, Enrollment.date_of_enrollment,
+                    func.count(Enrollment.enrollment_id)
+            ).group_by(Enrollment.completion_status, Enrollment.date_of_enrollment):
+                for key in self.enrollment_keys(status, enrolled_on):
+                    counts[key] += count
+
+            counts[(self.TOTAL, self.ALL, 'hostel_students')] = \
+                session.query(func.count(HostelManagement.hostel_id)).scalar() or 0
+            counts[(self.TOTAL, self.ALL, 'courses')] = session.query(func.count(Course.course_id)).scalar() or 0
+
+            session.query(DashboardStat).delete(synchronize_session=False)
+            session.bulk_insert_mappings(DashboardStat, [
+                {'period': period, 'bucket': bucket, 'metric': metric, 'value': value}
+                for (period, bucket, metric), value in counts.items()
+            ])
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        if engine is self.db.engine:
+            self._available = True
+        self.logger.info(f"Rebuilt dashboard_stats with {len(counts)} rows")
+        return len(counts)
@@ -1,6 +1,8 @@
 from typing import Dict, List, Any, Tuple, Optional, Union
-from sqlalchemy import desc, asc, and_, or_, not_, func, text
+from sqlalchemy import desc, asc, and_, not_, func, text
 from sqlalchemy.orm import Query
+from app.services.full_text_search import FullTextSearch
+from app.services.reference_cache import ReferenceCache
 import datetime
 
 
@@ -12,6 +14,7 @@ class DataFilterService:
 
     def __init__(self, db_session):
         self.db_session = db_session
+        self.cache = ReferenceCache()
 
     def apply_filters(self, model_class, filters=None, sort_by=None, sort_order='asc',
                       page=1, per_page=50, search_term=None, search_fields=None,
@@ -48,15 +51,15 @@ class DataFilterService:
             if filter_conditions:
                 query = query.filter(and_(*filter_conditions))
 
-        # Apply search term across multiple fields
+        # Apply search term across multiple fields (MATCH ... AGAINST in full-text mode)
+        relevance = None
         if search_term and search_fields:
-            search_conditions = []
-            for field_name in search_fields:
-                if hasattr(model_class, field_name):
-                    field = getattr(model_class, field_name)
-                    search_conditions.append(field.ilike(f"%{search_term}%"))
-            if search_conditions:
-                query = query.filter(or_(*search_conditions))
+            full_text = FullTextSearch()
+            search_columns = [getattr(model_class, field_name) for field_name in search_fields
+                              if hasattr(model_class, field_name)]
+            if search_columns:
+                query = query.filter(full_text.contains_any(search_columns, search_term))
+                relevance = full_text.relevance(search_columns, search_term)
 
         # Apply date range filters
         if date_range:
@@ -102,6 +105,9 @@ class DataFilterService:
                 query = query.order_by(desc(sort_field))
             else:
                 query = query.order_by(asc(sort_field))
+        elif relevance is not None:
+            # Without an explicit sort, show the most relevant matches first
+            query = query.order_by(desc(relevance))
 
         # Apply pagination
         if page and per_page:
@@ -120,27 +126,38 @@ class DataFilterService:
             filters: Optional filters to apply before getting distinct values
 
         Returns:
-            List of distinct values
+            List of distinct values (cached until the table is written to)
         """
         if not hasattr(model_class, field_name):
             return []
 
-        field = getattr(model_class, field_name)
-        query = self.db_session.query(field).distinct()
-
-        # Apply filters if provided
-        if filters:
-            filter_conditions = []
-            for f_name, value in filters.items():
-                if hasattr(model_class, f_name):
-                    f = getattr(model_class, f_name)
-                    filter_conditions.append(f == value)
-            if filter_conditions:
-                query = query.filter(and_(*filter_conditions))
-
-        # Execute and extract values
-        result = query.all()
-        return [r[0] for r in result if r[0] is not None]
+        def load():
+            field = getattr(model_class, field_name)
+            query = self.db_session.query(field).distinct()
+
+            # Apply filters if provided
+            if filters:
+                filter_conditions = []
+                for f_name, value in filters.items():
+                    if hasattr(model_class, f_name):
+                        f = getattr(model_class, f_name)
+                        filter_conditions.append(f == value)
+                if filter_conditions:
+                    query = query.filter(and_(*filter_conditions))
+
+            # Execute and extract values
+            result = query.all()
+            return [r[0] for r in result if r[0] is not None]
+
+        filter_key = tuple(sorted((filters or {}).items(), key=lambda item: item[0]))
+        try:
+            hash(filter_key)
+        except TypeError:
+            # Unhashable filter values cannot form a cache key
+            return load()
+
+        key = ('distinct', model_class.__tablename__, field_name, filter_key)
+        return list(self.cache.get_or_load(key, load, tables=[model_class.__tablename__]))
 
     def _parse_date(self, date_str):
         """Helper method to parse date strings"""
@@ -1,7 +1,8 @@
 from app.services.data_filter_service import DataFilterService
+from app.services.row_serializer import row_serializer
+from app.services.student_service import StudentService
 from app.models.student_models import *
 from sqlalchemy import func, and_, or_
-import datetime
 
 
 class DataManager:
@@ -10,6 +11,20 @@ class DataManager:
     Handles CRUD operations with specialized filtering
     """
 
+    # Searchable fields for each table (also the columns that get FULLTEXT indexes)
+    SEARCHABLE_FIELDS = {
+        'students_personal': ['student_name', 'cnic', 'phone', 'address', 'student_occupation'],
+        'education_history': ['education_level'],
+        'courses': ['course_name'],
+        'hostel_management': ['special_requirements'],
+        'medical_history': ['name_of_disability', 'brief_medical_history', 'regular_medication',
+                            'communicable_disease', 'assistive_device_used'],
+        'student_guardians': ['guardian_name', 'guardian_relationship', 'guardian_contact_number'],
+        'transportation': ['pickup_drop_responsible_name', 'pickup_drop_contact_number'],
+        'admins': ['admin_name'],
+        'admin': ['table_name', 'description']
+    }
+
     def __init__(self, db_session):
         self.db_session = db_session
         self.filter_service = DataFilterService(db_session)
@@ -29,18 +44,7 @@ class DataManager:
         }
 
         # Define searchable fields for each table
-        self.searchable_fields = {
-            'students_personal': ['student_name', 'cnic', 'phone', 'address', 'student_occupation'],
-            'education_history': ['education_level'],
-            'courses': ['course_name'],
-            'hostel_management': ['special_requirements'],
-            'medical_history': ['name_of_disability', 'brief_medical_history', 'regular_medication',
-                                'communicable_disease', 'assistive_device_used'],
-            'student_guardians': ['guardian_name', 'guardian_relationship', 'guardian_contact_number'],
-            'transportation': ['pickup_drop_responsible_name', 'pickup_drop_contact_number'],
-            'admins': ['admin_name'],
-            'admin': ['table_name', 'description']
-        }
+        self.searchable_fields = self.SEARCHABLE_FIELDS
 
         # Define date fields for each table
         self.date_fields = {
@@ -92,7 +96,9 @@ class DataManager:
         Returns:
             Dict with student data and related records
         """
-        student = self.db_session.query(Student).filter_by(student_id=student_id).first()
+        # One eager query instead of a lazy load per relationship and per course
+        student = StudentService.query_with_details(self.db_session).filter(
+            Student.student_id == student_id).one_or_none()
         if not student:
             return None
 
@@ -133,6 +139,12 @@ class DataManager:
         if not model_class:
             return {}
 
+        # Built from the model metadata only, so it never goes stale
+        return dict(self.filter_service.cache.get_or_load(
+            ('filter_options', table_name), lambda: self._build_filter_options(table_name, model_class), ttl=None))
+
+    def _build_filter_options(self, table_name, model_class):
+        """Describe the columns, relationships and filterable fields of a model"""
         # Get column information
         columns = []
         primary_key = None
@@ -174,12 +186,5 @@ class DataManager:
         if not model:
             return None
 
-        result = {}
-        for column in model.__table__.columns:
-            value = getattr(model, column.name)
-            # Convert dates to string for easier handling
-            if isinstance(value, (datetime.date, datetime.datetime)):
-                value = value.isoformat()
-            result[column.name] = value
-
-        return result
\ No newline at end of file
+        # Dates become ISO strings for easier handling
+        return row_serializer(type(model), None)(model)
\ No newline at end of file
@@ -0,0 +1,180 @@
+import functools
+import operator
+import re
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import Float, String, Text, inspect, or_, text, type_coerce
+
+from app.config.config import Config
+from app.database.db_connection import DataDatabase
+from app.models.student_models import Base as StudentBase
+from app.utils.logger import Logger
+
+
+class FullTextSearch:
+    """
+    Opt-in MySQL FULLTEXT search over the columns in DataManager.SEARCHABLE_FIELDS
+
+    When "search.full_text" is enabled in config.json and the data database
+    is MySQL, contains() builds MATCH ... AGAINST conditions and relevance()
+    builds a score to rank by. Otherwise, and for terms FULLTEXT cannot
+    answer (numbers, words shorter than the minimum token length), both fall
+    back to LIKE so SQLite and unindexed databases keep working.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FullTextSearch, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = Config()
+        self.db = DataDatabase()
+        self.logger = Logger()
+        self._indexed_columns = None
+
+    @property
+    def enabled(self) -> bool:
+        """True when full-text mode is switched on and the database supports it"""
+        return bool(self.config.full_text_search) and self.db.engine.dialect.name == 'mysql'
+
+    def indexed_columns(self) -> Dict[str, Set[str]]:
+        """
+        Get the text columns that carry a FULLTEXT index, per table
+
+        Returns:
+            Dictionary of table name: set of column names
+        """
+        if self._indexed_columns is None:
+            # Imported here because data_manager imports the filter service, which uses this module
+            from app.services.data_manager import DataManager
+
+            columns = {}
+            for table_name, fields in DataManager.SEARCHABLE_FIELDS.items():
+                table = StudentBase.metadata.tables.get(table_name)
+                if table is None:
+                    continue
+                text_fields = {
+                    field for field in fields
+                    if field in table.columns and isinstance(table.columns[field].type, (String, Text))
+                }
+                if text_fields:
+                    columns[table_name] = text_fields
+            self._indexed_columns = columns
+        return self._indexed_columns
+
+    def is_indexed(self, column) -> bool:
+        """Check whether a model attribute (e.g. Student.student_name) has a FULLTEXT index"""
+        table_name = column.class_.__tablename__
+        return column.key in self.indexed_columns().get(table_name, set())
+
+    def boolean_query(self, search_term: str) -> Optional[str]:
+        """
+        Translate a search term into a BOOLEAN MODE query requiring every word as a prefix
+
+        Args:
+            search_term: Text typed by the user
+
+        Returns:
+            Query string such as '+ali* +khan*', or None when LIKE must be used instead
+        """
+        # Identifiers such as CNICs and phone numbers need substring matches
+        if not any(char.isalpha() for char in search_term):
+            return None
+
+        words = re.findall(r'\w+', search_term)
+        if not words or any(len(word) < self.config.full_text_min_token_length for word in words):
+            return None
+
+        return ' '.join(f'+{word}*' for word in words)
+
+    def contains(self, column, search_term: str):
+        """
+        Build a condition matching rows whose column contains the search term
+
+        Args:
+            column: Model attribute to search
+            search_term: Text to search for
+
+        Returns:
+            MATCH ... AGAINST condition in full-text mode, otherwise column ILIKE '%term%'
+        """
+        if self.enabled and self.is_indexed(column):
+            query = self.boolean_query(search_term)
+            if query:
+                return column.match(query)
+        return column.ilike(f'%{search_term}%')
+
+    def contains_any(self, columns: List, search_term: str):
+        """Build an OR of contains() over several columns"""
+        return or_(*[self.contains(column, search_term) for column in columns])
+
+    def relevance(self, columns: List, search_term: str):
+        """
+        Build a relevance score over the indexed columns
+
+        Args:
+            columns: Model attributes that were searched
+            search_term: Text searched for
+
+        Returns:
+            SQL expression to order by (descending), or None when no column uses full-text
+        """
+        if not self.enabled:
+            return None
+
+        query = self.boolean_query(search_term)
+        if not query:
+            return None
+
+        # MATCH is typed as a boolean; treat each score as a number before adding
+        # (MySQL has no CAST to FLOAT, and MATCH already returns one)
+        scores = [type_coerce(column.match(query), Float) for column in columns if self.is_indexed(column)]
+        if not scores:
+            return None
+        return functools.reduce(operator.add, scores)
+
+    @staticmethod
+    def index_name(table_name: str, column_name: str) -> str:
+        return f"ft_{table_name}_{column_name}"[:64]
+
+    def create_indexes(self, engine=None) -> List[str]:
+        """
+        Add a FULLTEXT index on every searchable text column that lacks one
+
+        Args:
+            engine: Engine to migrate (defaults to the data database engine)
+
+        Returns:
+            List of the index names that were created
+        """
+        engine = engine or self.db.engine
+        if engine.dialect.name != 'mysql':
+            self.logger.warning(f"FULLTEXT indexes are not supported on {engine.dialect.name}; skipping")
+            return []
+
+        inspector = inspect(engine)
+        existing_tables = set(inspector.get_table_names())
+        created = []
+
+        for table_name, columns in sorted(self.indexed_columns().items()):
+            if table_name not in existing_tables:
+                self.logger.warning(f"Table {table_name} not found; skipping FULLTEXT indexes")
+                continue
+
+            existing_indexes = {index['name'] for index in inspector.get_indexes(table_name)}
+            for column_name in sorted(columns):
+                name = self.index_name(table_name, column_name)
+                if name in existing_indexes:
+                    continue
+
+                with engine.begin() as connection:
+                    connection.execute(text(
+                        f"ALTER TABLE `{table_name}` ADD FULLTEXT INDEX `{name}` (`{column_name}`)"
+                    ))
+                self.logger.info(f"Created FULLTEXT index {name}")
+                created.append(name)
+
+        return created
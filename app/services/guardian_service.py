@@ -108,50 +108,14 @@ class GuardianService(CrudService):
             if student_id_matches:
                 return student_id_matches
 
-        # Perform a general search across all guardians
-        all_guardians = self.read_all()
-        results = []
-
-        for guardian in all_guardians:
-            # Search in guardian name
-            if guardian.guardian_name and search_term in guardian.guardian_name.lower():
-                results.append(guardian)
-                continue
-
-            # Search in relationship
-            if guardian.guardian_relationship and search_term in guardian.guardian_relationship.lower():
-                results.append(guardian)
-                continue
-
-            # Search in contact number
-            if guardian.guardian_contact_number and search_term in guardian.guardian_contact_number.lower():
-                results.append(guardian)
-                continue
-
-            # Search in address if exists
-            if hasattr(guardian,
-                       'guardian_address') and guardian.guardian_address and search_term in guardian.guardian_address.lower():
-                results.append(guardian)
-                continue
-
-            # Search in email if exists
-            if hasattr(guardian,
-                       'guardian_email') and guardian.guardian_email and search_term in guardian.guardian_email.lower():
-                results.append(guardian)
-                continue
-
-            # Search in CNIC if exists
-            if hasattr(guardian,
-                       'guardian_cnic') and guardian.guardian_cnic and search_term in guardian.guardian_cnic.lower():
-                results.append(guardian)
-                continue
-
-            # If student ID is in the guardian object and matches the search term
-            if str(guardian.student_id) == search_term:
-                results.append(guardian)
-                continue
-
-        return results
+        # Perform a general search across the guardian columns
+        columns = [
+            StudentGuardian.guardian_name,
+            StudentGuardian.guardian_relationship,
+            StudentGuardian.guardian_contact_number
+        ]
+        return self._find(self.full_text.contains_any(columns, search_term),
+                          relevance=self.full_text.relevance(columns, search_term))
 
     def advanced_search(self, search_term: str) -> Tuple[List[StudentGuardian], Dict[int, List[str]]]:
         """
@@ -164,63 +128,18 @@ class GuardianService(CrudService):
             Tuple of (matching records, dictionary of guardian_id to list of match reasons)
         """
         search_term = search_term.lower().strip()
-        all_guardians = self.read_all()
-        results = []
-        match_reasons = {}  # Dictionary to store match reasons
-
-        for guardian in all_guardians:
-            guardian_id = guardian.student_guardian_id
-            reasons = []
-
-            # Check student ID
-            if str(guardian.student_id) == search_term:
-                results.append(guardian)
-                reasons.append('Student ID')
-
-            # Check guardian name
-            if guardian.guardian_name and search_term in guardian.guardian_name.lower():
-                if guardian not in results:
-                    results.append(guardian)
-                reasons.append('Name')
-
-            # Check relationship
-            if guardian.guardian_relationship and search_term in guardian.guardian_relationship.lower():
-                if guardian not in results:
-                    results.append(guardian)
-                reasons.append('Relationship')
-
-            # Check contact number
-            if guardian.guardian_contact_number and search_term in guardian.guardian_contact_number.lower():
-                if guardian not in results:
-                    results.append(guardian)
-                reasons.append('Contact')
-
-            # Check address if exists
-            if hasattr(guardian,
-                       'guardian_address') and guardian.guardian_address and search_term in guardian.guardian_address.lower():
-                if guardian not in results:
-                    results.append(guardian)
-                reasons.append('Address')
-
-            # Check email if exists
-            if hasattr(guardian,
-                       'guardian_email') and guardian.guardian_email and search_term in guardian.guardian_email.lower():
-                if guardian not in results:
-                    results.append(guardian)
-                reasons.append('Email')
-
-            # Check CNIC if exists
-            if hasattr(guardian,
-                       'guardian_cnic') and guardian.guardian_cnic and search_term in guardian.guardian_cnic.lower():
-                if guardian not in results:
-                    results.append(guardian)
-                reasons.append('CNIC')
-
-            # Store match reasons if any were found
-            if reasons:
-                match_reasons[guardian_id] = reasons
-
-        return results, match_reasons
+        contains = self.full_text.contains
+
+        conditions = []
+        if search_term.isdigit():
+            conditions.append(('Student ID', StudentGuardian.student_id == int(search_term)))
+        conditions.append(('Name', contains(StudentGuardian.guardian_name, search_term)))
+        conditions.append(('Relationship', contains(StudentGuardian.guardian_relationship, search_term)))
+        conditions.append(('Contact', contains(StudentGuardian.guardian_contact_number, search_term)))
+
+        relevance = self.full_text.relevance(
+            [StudentGuardian.guardian_name, StudentGuardian.guardian_relationship], search_term)
+        return self._search_with_reasons(conditions, relevance)
 
     def search_by_relationship(self, relationship_type: str) -> List[StudentGuardian]:
         """
@@ -233,14 +152,7 @@ class GuardianService(CrudService):
             List of guardians matching the relationship type
         """
         relationship_type = relationship_type.lower().strip()
-        all_guardians = self.read_all()
-        results = []
-
-        for guardian in all_guardians:
-            if guardian.guardian_relationship and relationship_type in guardian.guardian_relationship.lower():
-                results.append(guardian)
-
-        return results
+        return self._find(self.full_text.contains(StudentGuardian.guardian_relationship, relationship_type))
 
     def search_by_contact(self, contact_info: str) -> List[StudentGuardian]:
         """
@@ -253,14 +165,7 @@ class GuardianService(CrudService):
             List of guardians with matching contact information
         """
         contact_info = contact_info.strip()
-        all_guardians = self.read_all()
-        results = []
-
-        for guardian in all_guardians:
-            if guardian.guardian_contact_number and contact_info in guardian.guardian_contact_number:
-                results.append(guardian)
-
-        return results
+        return self._find(self.full_text.contains(StudentGuardian.guardian_contact_number, contact_info))
 
     def search_by_name(self, name: str) -> List[StudentGuardian]:
         """
@@ -273,14 +178,7 @@ class GuardianService(CrudService):
             List of guardians with matching names
         """
         name = name.lower().strip()
-        all_guardians = self.read_all()
-        results = []
-
-        for guardian in all_guardians:
-            if guardian.guardian_name and name in guardian.guardian_name.lower():
-                results.append(guardian)
-
-        return results
+        return self._find(self.full_text.contains(StudentGuardian.guardian_name, name))
 
     def get_student_all_guardians(self, student_id: int) -> Dict[str, List[StudentGuardian]]:
         """
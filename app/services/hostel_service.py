@@ -46,6 +46,7 @@
 from app.services.crud_service import CrudService
 from app.models.student_models import HostelManagement
 from typing import Dict, List, Any, Tuple, Optional, Union
+from sqlalchemy import func
 
 
 class HostelService(CrudService):
@@ -125,29 +126,10 @@ class HostelService(CrudService):
         if any(word in search_term for word in ['day', 'days', 'week', 'weeks', 'month', 'months', 'year', 'years']):
             return self.search_by_duration(search_term)
 
-        # Perform a general search across all hostel records
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            # Search in duration of stay
-            if record.duration_of_stay and search_term in record.duration_of_stay.lower():
-                results.append(record)
-                continue
-
-            # Search in special requirements
-            if record.special_requirements and search_term in record.special_requirements.lower():
-                results.append(record)
-                continue
-
-            # Search in any other fields that might exist
-            for field_name in ['room_number', 'building', 'floor', 'status', 'notes']:
-                if hasattr(record, field_name) and getattr(record, field_name):
-                    if search_term in str(getattr(record, field_name)).lower():
-                        results.append(record)
-                        break
-
-        return results
+        # Perform a general search across the text columns
+        columns = [HostelManagement.duration_of_stay, HostelManagement.special_requirements]
+        return self._find(self.full_text.contains_any(columns, search_term),
+                          relevance=self.full_text.relevance(columns, search_term))
 
     def advanced_search(self, search_term: str) -> Tuple[List[HostelManagement], Dict[int, List[str]]]:
         """
@@ -160,50 +142,16 @@ class HostelService(CrudService):
             Tuple of (matching records, dictionary of hostel_id to list of match reasons)
         """
         search_term = search_term.lower().strip()
-        all_records = self.read_all()
-        results = []
-        match_reasons = {}  # Dictionary to store match reasons
+        contains = self.full_text.contains
 
-        for record in all_records:
-            record_id = record.hostel_id
-            reasons = []
-
-            # Check student ID
-            if search_term.isdigit() and int(search_term) == record.student_id:
-                results.append(record)
-                reasons.append('Student ID')
-
-            # Check duration of stay
-            if record.duration_of_stay and search_term in record.duration_of_stay.lower():
-                if record not in results:
-                    results.append(record)
-                reasons.append('Duration of Stay')
-
-            # Check special requirements
-            if record.special_requirements and search_term in record.special_requirements.lower():
-                if record not in results:
-                    results.append(record)
-                reasons.append('Special Requirements')
-
-            # Check other fields
-            for field_name, display_name in [
-                ('room_number', 'Room Number'),
-                ('building', 'Building'),
-                ('floor', 'Floor'),
-                ('status', 'Status'),
-                ('notes', 'Notes')
-            ]:
-                if hasattr(record, field_name) and getattr(record, field_name):
-                    if search_term in str(getattr(record, field_name)).lower():
-                        if record not in results:
-                            results.append(record)
-                        reasons.append(display_name)
-
-            # Store match reasons if any were found
-            if reasons:
-                match_reasons[record_id] = reasons
-
-        return results, match_reasons
+        conditions = []
+        if search_term.isdigit():
+            conditions.append(('Student ID', HostelManagement.student_id == int(search_term)))
+        conditions.append(('Duration of Stay', contains(HostelManagement.duration_of_stay, search_term)))
+        conditions.append(('Special Requirements', contains(HostelManagement.special_requirements, search_term)))
+
+        relevance = self.full_text.relevance([HostelManagement.special_requirements], search_term)
+        return self._search_with_reasons(conditions, relevance)
 
     def search_by_duration(self, duration_term: str) -> List[HostelManagement]:
         """
@@ -216,14 +164,7 @@ class HostelService(CrudService):
             List of matching hostel records
         """
         duration_term = duration_term.lower().strip()
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if record.duration_of_stay and duration_term in record.duration_of_stay.lower():
-                results.append(record)
-
-        return results
+        return self._find(HostelManagement.duration_of_stay.ilike(f'%{duration_term}%'))
 
     def search_by_requirements(self, requirements_term: str) -> List[HostelManagement]:
         """
@@ -236,14 +177,7 @@ class HostelService(CrudService):
             List of matching hostel records
         """
         requirements_term = requirements_term.lower().strip()
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if record.special_requirements and requirements_term in record.special_requirements.lower():
-                results.append(record)
-
-        return results
+        return self._find(self.full_text.contains(HostelManagement.special_requirements, requirements_term))
 
     def get_by_room(self, room_number: str) -> List[HostelManagement]:
         """
@@ -253,17 +187,10 @@ class HostelService(CrudService):
             room_number: Room number to search for
 
         Returns:
-            List of hostel records for that room
+            Always an empty list: hostel_management has no room column, so
+            there is nothing to match
         """
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if hasattr(record, 'room_number') and record.room_number:
-                if str(record.room_number) == str(room_number):
-                    results.append(record)
-
-        return results
+        return []
 
     def get_by_building(self, building: str) -> List[HostelManagement]:
         """
@@ -273,18 +200,10 @@ class HostelService(CrudService):
             building: Building name or number to search for
 
         Returns:
-            List of hostel records for that building
+            Always an empty list: hostel_management has no building column,
+            so there is nothing to match
         """
-        building = building.lower().strip()
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if hasattr(record, 'building') and record.building:
-                if building in record.building.lower():
-                    results.append(record)
-
-        return results
+        return []
 
     def get_hostel_summary(self, student_id: int) -> Dict[str, Any]:
         """
@@ -326,14 +245,10 @@ class HostelService(CrudService):
         Returns:
             List of hostel records with special requirements
         """
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if record.special_requirements and record.special_requirements.strip():
-                results.append(record)
-
-        return results
+        return self._find(
+            HostelManagement.special_requirements.isnot(None),
+            func.trim(HostelManagement.special_requirements) != ''
+        )
 
     def get_students_by_duration_category(self) -> Dict[str, List[HostelManagement]]:
         """
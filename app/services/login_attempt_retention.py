@@ -0,0 +1,313 @@
+import csv
+import datetime
+import gzip
+import math
+import os
+import threading
+from typing import List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config.config import Config
+from app.database.db_connection import AuthDatabase
+from app.models.session import LoginAttempt, LoginAttemptArchive
+from app.utils.logger import Logger
+
+
+class LoginAttemptRetention:
+    """
+    Keeps login_attempts down to the window the lockout checks look at
+
+    Attempts older than "login_attempts.retention_days" are copied to the
+    login_attempts_archive table or a gzipped CSV file per month, then
+    deleted in batches of "batch_size" rows, one short transaction each.
+
+    On MySQL the table can instead be partitioned by month
+    (enable_partitioning()); whole months past the retention window are
+    then archived and removed with DROP PARTITION, so the window is rounded
+    up to whole months.
+    """
+    _instance = None
+
+    COLUMNS = ('id', 'username', 'ip_address', 'successful', 'timestamp', 'user_id')
+    TABLE = LoginAttempt.__tablename__
+    # Partition holding rows newer than the last monthly partition
+    OVERFLOW_PARTITION = 'pmax'
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LoginAttemptRetention, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = Config()
+        self.logger = Logger()
+        self.db = AuthDatabase()
+        settings = self.config.login_attempt_settings
+        self.retention_days = int(settings['retention_days'])
+        self.archive = settings['archive']
+        self.archive_dir = settings['archive_dir']
+        if not os.path.isabs(self.archive_dir):
+            root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            self.archive_dir = os.path.join(root, self.archive_dir)
+        self.batch_size = max(1, int(settings['batch_size']))
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def cutoff(self) -> datetime.datetime:
+        """Attempts before this naive UTC time are archived"""
+        # Never cut into the longest window the lockout checks count over
+        # (LoginMonitor.get_failed_attempts looks back one day)
+        minimum_days = max(1, math.ceil(self.config.lockout_duration / 1440))
+        days = max(self.retention_days, minimum_days)
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        return now - datetime.timedelta(days=days)
+
+    def run_in_background(self):
+        """Run purge() once on a daemon thread (no-op if disabled or already running)"""
+        if self.retention_days <= 0:
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self.purge, name="LoginAttemptRetention", daemon=True)
+            self._thread.start()
+
+    def purge(self) -> int:
+        """
+        Archive and delete login attempts older than the retention window
+
+        Returns:
+            Number of attempts removed from login_attempts
+        """
+        if self.retention_days <= 0:
+            return 0
+
+        cutoff = self.cutoff()
+        try:
+            if self.archive == 'table':
+                LoginAttemptArchive.__table__.create(self.db.engine, checkfirst=True)
+            if self.is_partitioned():
+                removed = self._drop_partitions(cutoff)
+                self.add_partitions()
+            else:
+                removed = self._delete_batches(cutoff)
+        except (SQLAlchemyError, OSError) as e:
+            self.logger.error(f"Error purging login attempts: {str(e)}")
+            return 0
+
+        if removed:
+            self.logger.info(f"Archived {removed} login attempts older than {cutoff:%Y-%m-%d}")
+        return removed
+
+    def _delete_batches(self, cutoff) -> int:
+        """
+        Archive and delete attempts older than cutoff, one batch per transaction
+
+        Each batch is archived before it is deleted, so a failed archive
+        write leaves the rows in place. With the file archive, a batch whose
+        delete fails is written again by the next run; such duplicates can
+        be removed by id.
+
+        Returns:
+            Number of attempts removed from login_attempts
+        """
+        removed = 0
+        columns = [getattr(LoginAttempt, name) for name in self.COLUMNS]
+        while True:
+            session = self.db.session_factory()
+            try:
+                rows = session.query(*columns).filter(LoginAttempt.timestamp < cutoff).order_by(
+                    LoginAttempt.id).limit(self.batch_size).all()
+                if not rows:
+                    return removed
+                if self.archive == 'table':
+                    self._archive_to_table(session, rows)
+                elif self.archive == 'file':
+                    self._archive_to_files(rows)
+                session.query(LoginAttempt).filter(LoginAttempt.id.in_([row.id for row in rows])).delete(
+                    synchronize_session=False)
+                session.commit()
+                removed += len(rows)
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+            if len(rows) < self.batch_size:
+                return removed
+
+    def _archive_to_table(self, session, rows):
+        """Copy attempts to login_attempts_archive inside the caller's transaction"""
+        session.execute(LoginAttemptArchive.__table__.insert(),
+                        [dict(zip(self.COLUMNS, row)) for row in rows])
+
+    def _archive_to_files(self, rows):
+        """Append attempts to the gzipped CSV file of their month"""
+        # Appending a gzip member per batch keeps each monthly file a valid .gz
+        os.makedirs(self.archive_dir, exist_ok=True)
+        by_month = {}
+        for row in rows:
+            by_month.setdefault(row.timestamp.strftime('%Y-%m') if row.timestamp else 'undated', []).append(row)
+        for month, month_rows in by_month.items():
+            path = os.path.join(self.archive_dir, f"login_attempts-{month}.csv.gz")
+            new_file = not os.path.exists(path)
+            with gzip.open(path, 'at', newline='') as archive_file:
+                writer = csv.writer(archive_file)
+                if new_file:
+                    writer.writerow(self.COLUMNS)
+                writer.writerows(month_rows)
+
+    # ----- Monthly partitioning (MySQL) -----
+
+    def is_partitioned(self) -> bool:
+        if self.db.engine.dialect.name != 'mysql':
+            return False
+        with self.db.engine.connect() as connection:
+            return bool(connection.execute(text(
+                "SELECT COUNT(*) FROM information_schema.PARTITIONS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL"
+            ), {'table': self.TABLE}).scalar())
+
+    def _partitions(self, connection):
+        """Monthly partitions as (name, first day of the following month), oldest first"""
+        rows = connection.execute(text(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ), {'table': self.TABLE}).scalars().all()
+        return [(name, self._next_month(datetime.datetime.strptime(name[1:], '%Y%m').date()))
+                for name in rows if name != self.OVERFLOW_PARTITION]
+
+    @staticmethod
+    def _next_month(day: datetime.date) -> datetime.date:
+        return (day.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+
+    @classmethod
+    def _partition_clause(cls, month: datetime.date) -> str:
+        return (f"PARTITION p{month:%Y%m} VALUES LESS THAN "
+                f"(TO_DAYS('{cls._next_month(month):%Y-%m-%d}'))")
+
+    def enable_partitioning(self) -> bool:
+        """
+        Convert login_attempts to monthly RANGE partitions
+
+        MySQL requires the partitioning column in the primary key and does
+        not allow foreign keys on partitioned tables, so the primary key
+        becomes (id, timestamp) and the user_id foreign key is dropped.
+
+        Returns:
+            True if the table is partitioned afterwards
+        """
+        engine = self.db.engine
+        if engine.dialect.name != 'mysql':
+            self.logger.warning(f"Partitioning is not supported on {engine.dialect.name}; skipping")
+            return False
+        if self.is_partitioned():
+            self.add_partitions()
+            return True
+
+        with engine.begin() as connection:
+            oldest = connection.execute(text(f"SELECT MIN(`timestamp`) FROM `{self.TABLE}`")).scalar()
+        today = datetime.date.today()
+        month = (oldest.date() if oldest else today).replace(day=1)
+        clauses = []
+        while month <= self._next_month(today):
+            clauses.append(self._partition_clause(month))
+            month = self._next_month(month)
+        clauses.append(f"PARTITION {self.OVERFLOW_PARTITION} VALUES LESS THAN MAXVALUE")
+
+        with engine.begin() as connection:
+            for foreign_key in inspect(engine).get_foreign_keys(self.TABLE):
+                connection.execute(text(f"ALTER TABLE `{self.TABLE}` DROP FOREIGN KEY `{foreign_key['name']}`"))
+            connection.execute(text(
+                f"ALTER TABLE `{self.TABLE}` MODIFY `timestamp` DATETIME NOT NULL, "
+                f"DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `timestamp`)"
+            ))
+            connection.execute(text(
+                f"ALTER TABLE `{self.TABLE}` PARTITION BY RANGE (TO_DAYS(`timestamp`)) ({', '.join(clauses)})"
+            ))
+
+        self.logger.info(f"Partitioned {self.TABLE} into {len(clauses) - 1} monthly partitions")
+        return True
+
+    def add_partitions(self) -> List[str]:
+        """
+        Split monthly partitions off the overflow partition up to next month
+
+        Returns:
+            List of the partition names that were added
+        """
+        with self.db.engine.begin() as connection:
+            partitions = self._partitions(connection)
+            today = datetime.date.today()
+            month = partitions[-1][1] if partitions else today.replace(day=1)
+            clauses = []
+            while month <= self._next_month(today):
+                clauses.append(self._partition_clause(month))
+                month = self._next_month(month)
+            if not clauses:
+                return []
+            clauses.append(f"PARTITION {self.OVERFLOW_PARTITION} VALUES LESS THAN MAXVALUE")
+            connection.execute(text(
+                f"ALTER TABLE `{self.TABLE}` REORGANIZE PARTITION {self.OVERFLOW_PARTITION} "
+                f"INTO ({', '.join(clauses)})"
+            ))
+        added = [clause.split()[1] for clause in clauses[:-1]]
+        self.logger.info(f"Added login_attempts partitions: {', '.join(added)}")
+        return added
+
+    def _drop_partitions(self, cutoff) -> int:
+        """
+        Archive and drop every monthly partition that ends before cutoff
+
+        Returns:
+            Number of attempts archived (with archiving off the partitions
+            are dropped without being read, so nothing is counted)
+        """
+        removed = 0
+        with self.db.engine.connect() as connection:
+            partitions = self._partitions(connection)
+
+        for name, ends in partitions:
+            if ends > cutoff.date():
+                break
+            if self.archive != 'none':
+                removed += self._archive_partition(name)
+
+            # DROP PARTITION commits implicitly and takes no time regardless of size
+            with self.db.engine.begin() as connection:
+                connection.execute(text(f"ALTER TABLE `{self.TABLE}` DROP PARTITION `{name}`"))
+            self.logger.info(f"Dropped login_attempts partition {name}")
+
+        return removed
+
+    def _archive_partition(self, name) -> int:
+        """Copy one partition's attempts to the configured archive"""
+        removed = 0
+        columns = ', '.join(f"`{column}`" for column in self.COLUMNS)
+        session = self.db.session_factory()
+        try:
+            if self.archive == 'table':
+                removed = session.execute(text(
+                    # IGNORE skips rows archived by a run that stopped before the drop
+                    f"INSERT IGNORE INTO `{LoginAttemptArchive.__tablename__}` ({columns}) "
+                    f"SELECT {columns} FROM `{self.TABLE}` PARTITION (`{name}`)"
+                )).rowcount
+                session.commit()
+            else:
+                result = session.execute(text(f"SELECT {columns} FROM `{self.TABLE}` PARTITION (`{name}`)"))
+                while True:
+                    rows = result.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    self._archive_to_files(rows)
+                    removed += len(rows)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        return removed
@@ -2,41 +2,22 @@ from datetime import datetime, timedelta
 
 from app.models.session import LoginAttempt
 from app.config.config import Config
+from app.services.login_rate_limiter import LoginRateLimiter
 
 
 class LoginMonitor:
     def __init__(self, db_session):
         self.db_session = db_session
         self.config = Config()
+        self.rate_limiter = LoginRateLimiter()
 
     def record_attempt(self, username, ip_address=None, successful=False, user=None):
-        # Create login attempt record
-        attempt = LoginAttempt(
-            username=username,
-            ip_address=ip_address,
-            successful=successful,
-            user_id=user.id if user else None
-        )
-
-        self.db_session.add(attempt)
-        self.db_session.commit()
+        # Counted in memory and written to login_attempts in the background
+        self.rate_limiter.record(username, ip_address, successful, user.id if user else None)
 
     def is_account_locked(self, username):
-        # Get config values
-        max_attempts = self.config.max_failed_attempts
-        lockout_duration = timedelta(minutes=self.config.lockout_duration)
-
-        # Calculate time threshold
-        time_threshold = datetime.utcnow() - lockout_duration
-
-        # Count failed attempts within the lockout window
-        failed_attempts = self.db_session.query(LoginAttempt).filter(
-            LoginAttempt.username == username,
-            LoginAttempt.successful == False,
-            LoginAttempt.timestamp >= time_threshold
-        ).count()
-
-        return failed_attempts >= max_attempts
+        # max_failed_attempts failures within lockout_duration, answered from memory
+        return self.rate_limiter.is_locked(username)
 
     def get_failed_attempts(self, username):
         # Calculate time threshold (last 24 hours)
@@ -0,0 +1,200 @@
+import atexit
+import datetime
+import queue
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config.config import Config
+from app.database.db_connection import AuthDatabase
+from app.models.session import LoginAttempt
+from app.utils.logger import Logger
+
+
+def _utc_now() -> datetime.datetime:
+    # Naive UTC, as stored in MySQL
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class SlidingWindow:
+    """
+    Counts events per key over the last window seconds, up to a limit
+
+    Only the newest limit timestamps are kept per key, so memory is bounded
+    and reaching the limit is answered in O(1) amortized.
+    """
+
+    def __init__(self, window: float, limit: int):
+        self.window = window
+        self.limit = max(1, limit)
+        self._events: Dict[str, deque] = {}
+
+    def add(self, key: str, at: float):
+        events = self._events.get(key)
+        if events is None:
+            events = self._events[key] = deque(maxlen=self.limit)
+        events.append(at)
+
+    def count(self, key: str, now: float) -> int:
+        events = self._events.get(key)
+        if not events:
+            return 0
+        while events and events[0] <= now - self.window:
+            events.popleft()
+        if not events:
+            del self._events[key]
+            return 0
+        return len(events)
+
+    def is_full(self, key: str, now: float) -> bool:
+        return self.count(key, now) >= self.limit
+
+    def retry_after(self, key: str, now: float) -> float:
+        """Seconds until the key drops below the limit"""
+        if not self.is_full(key, now):
+            return 0.0
+        return self._events[key][0] + self.window - now
+
+    def prune(self, now: float):
+        for key in list(self._events):
+            self.count(key, now)
+
+    def __len__(self):
+        return len(self._events)
+
+
+class LoginRateLimiter:
+    """
+    In-memory login throttling and account lockout
+
+    Attempts per IP address (IP_LIMIT per IP_WINDOW_SECONDS) and failed
+    attempts per username ("security.max_failed_attempts" per
+    "security.lockout_duration_minutes") are counted in sliding windows
+    seeded from login_attempts at startup, so checks need no query. Every
+    attempt is still written to login_attempts for auditing, in batches
+    from a background thread. Attempts made on other workstations after
+    startup are not counted.
+    """
+    _instance = None
+
+    IP_LIMIT = 100
+    IP_WINDOW_SECONDS = 3600
+    # Drop expired keys once this many are tracked
+    PRUNE_THRESHOLD = 10000
+    # Attempts written per INSERT
+    WRITE_BATCH = 100
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LoginRateLimiter, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = Config()
+        self.logger = Logger()
+        self.db = AuthDatabase()
+        self.by_ip = SlidingWindow(self.IP_WINDOW_SECONDS, self.IP_LIMIT)
+        self.failures = SlidingWindow(self.config.lockout_duration * 60, self.config.max_failed_attempts)
+        self._lock = threading.Lock()
+        self._pending = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="LoginAttemptWriter", daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
+        self.seed()
+
+    @staticmethod
+    def _epoch(timestamp: datetime.datetime) -> float:
+        return timestamp.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+    def seed(self):
+        """Load the attempts still inside either window from login_attempts"""
+        now = _utc_now()
+        session = self.db.session_factory()
+        try:
+            by_ip = session.query(LoginAttempt.ip_address, LoginAttempt.timestamp).filter(
+                LoginAttempt.ip_address.isnot(None),
+                LoginAttempt.timestamp >= now - datetime.timedelta(seconds=self.by_ip.window)
+            ).order_by(LoginAttempt.timestamp).all()
+            failures = session.query(LoginAttempt.username, LoginAttempt.timestamp).filter(
+                LoginAttempt.successful == False,
+                LoginAttempt.timestamp >= now - datetime.timedelta(seconds=self.failures.window)
+            ).order_by(LoginAttempt.timestamp).all()
+        except SQLAlchemyError as e:
+            self.logger.error(f"Could not seed login rate limiter: {str(e)}")
+            return
+        finally:
+            session.close()
+
+        with self._lock:
+            for ip_address, timestamp in by_ip:
+                self.by_ip.add(ip_address, self._epoch(timestamp))
+            for username, timestamp in failures:
+                self.failures.add(username, self._epoch(timestamp))
+        self.logger.info(f"Login rate limiter seeded with {len(by_ip)} recent attempts "
+                         f"and {len(failures)} recent failures")
+
+    def is_throttled(self, ip_address: Optional[str]) -> bool:
+        """True when the IP address has used up its attempts for the hour"""
+        if not ip_address:
+            return False
+        with self._lock:
+            return self.by_ip.is_full(ip_address, time.time())
+
+    def is_locked(self, username: str) -> bool:
+        """True when the username has max_failed_attempts failures inside the lockout window"""
+        with self._lock:
+            return self.failures.is_full(username, time.time())
+
+    def lockout_remaining(self, username: str) -> float:
+        """Seconds until a locked username can try again (0 when not locked)"""
+        with self._lock:
+            return self.failures.retry_after(username, time.time())
+
+    def record(self, username: str, ip_address: Optional[str] = None, successful: bool = False,
+               user_id: Optional[int] = None):
+        """Count an attempt and queue it to be written to login_attempts"""
+        now = time.time()
+        with self._lock:
+            if ip_address:
+                self.by_ip.add(ip_address, now)
+            if not successful:
+                self.failures.add(username, now)
+            if len(self.by_ip) + len(self.failures) > self.PRUNE_THRESHOLD:
+                self.by_ip.prune(now)
+                self.failures.prune(now)
+
+        self._pending.put({'username': username, 'ip_address': ip_address, 'successful': successful,
+                           'user_id': user_id, 'timestamp': _utc_now()})
+
+    def flush(self):
+        """Block until every queued attempt has been written"""
+        self._pending.join()
+
+    def _write_loop(self):
+        while True:
+            rows = [self._pending.get()]
+            while len(rows) < self.WRITE_BATCH:
+                try:
+                    rows.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(rows)
+            finally:
+                for _ in rows:
+                    self._pending.task_done()
+
+    def _write(self, rows):
+        session = self.db.session_factory()
+        try:
+            session.execute(LoginAttempt.__table__.insert(), rows)
+            session.commit()
+        except SQLAlchemyError as e:
+            session.rollback()
+            self.logger.error(f"Could not record {len(rows)} login attempts: {str(e)}")
+        finally:
+            session.close()
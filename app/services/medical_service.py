@@ -1,6 +1,7 @@
 from app.services.crud_service import CrudService
 from app.models.student_models import MedicalHistory
 from typing import Dict, List, Any, Tuple, Optional, Union
+from sqlalchemy import or_
 
 
 class MedicalService(CrudService):
@@ -87,35 +88,10 @@ class MedicalService(CrudService):
         if any(term in search_term for term in ['addiction', 'drug', 'smoking']):
             return self.search_by_condition('drug_addiction_smoking', True)
 
-        # Perform a general search across all medical records
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            # Search in disability name
-            if record.name_of_disability and search_term in record.name_of_disability.lower():
-                results.append(record)
-                continue
-
-            # Search in additional information if it exists
-            if hasattr(record, 'additional_information') and record.additional_information:
-                if search_term in record.additional_information.lower():
-                    results.append(record)
-                    continue
-
-            # Search in medical history if it exists
-            if hasattr(record, 'medical_history_details') and record.medical_history_details:
-                if search_term in record.medical_history_details.lower():
-                    results.append(record)
-                    continue
-
-            # Search in medication if it exists
-            if hasattr(record, 'medication') and record.medication:
-                if search_term in record.medication.lower():
-                    results.append(record)
-                    continue
-
-        return results
+        # Perform a general search across the medical text columns
+        columns = self._text_columns()
+        return self._find(self.full_text.contains_any(columns, search_term),
+                          relevance=self.full_text.relevance(columns, search_term))
 
     def advanced_search(self, search_term: str) -> Tuple[List[MedicalHistory], Dict[int, List[str]]]:
         """
@@ -128,72 +104,31 @@ class MedicalService(CrudService):
             Tuple of (matching records, dictionary of medical_id to list of match reasons)
         """
         search_term = search_term.lower().strip()
-        all_records = self.read_all()
-        results = []
-        match_reasons = {}  # Dictionary to store match reasons
+        contains = self.full_text.contains
 
-        for record in all_records:
-            record_id = record.medical_id
-            reasons = []
+        conditions = []
 
-            # Check student ID
-            if search_term.isdigit() and int(search_term) == record.student_id:
-                results.append(record)
-                reasons.append('Student ID')
-
-            # Check for epilepsy
-            if search_term in ['epilepsy', 'epileptic', 'yes']:
-                if record.epilepsy:
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Epilepsy')
-
-            # Check for non-epilepsy
-            if search_term in ['no epilepsy', 'not epileptic', 'no']:
-                if not record.epilepsy:
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('No Epilepsy')
-
-            # Check for addiction
-            if any(term in search_term for term in ['addiction', 'drug', 'smoking']):
-                if record.drug_addiction_smoking:
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Drug Addiction/Smoking')
-
-            # Check disability name
-            if record.name_of_disability and search_term in record.name_of_disability.lower():
-                if record not in results:
-                    results.append(record)
-                reasons.append('Disability Name')
-
-            # Check additional information
-            if hasattr(record, 'additional_information') and record.additional_information:
-                if search_term in record.additional_information.lower():
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Additional Information')
-
-            # Check medical history details
-            if hasattr(record, 'medical_history_details') and record.medical_history_details:
-                if search_term in record.medical_history_details.lower():
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Medical History Details')
-
-            # Check medication
-            if hasattr(record, 'medication') and record.medication:
-                if search_term in record.medication.lower():
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Medication')
-
-            # Store match reasons if any were found
-            if reasons:
-                match_reasons[record_id] = reasons
-
-        return results, match_reasons
+        # Check student ID
+        if search_term.isdigit():
+            conditions.append(('Student ID', MedicalHistory.student_id == int(search_term)))
+
+        # Check for epilepsy / non-epilepsy
+        if search_term in ['epilepsy', 'epileptic', 'yes']:
+            conditions.append(('Epilepsy', MedicalHistory.epilepsy == True))
+        if search_term in ['no epilepsy', 'not epileptic', 'no']:
+            conditions.append(('No Epilepsy', or_(MedicalHistory.epilepsy == False,
+                                                  MedicalHistory.epilepsy.is_(None))))
+
+        # Check for addiction
+        if any(term in search_term for term in ['addiction', 'drug', 'smoking']):
+            conditions.append(('Drug Addiction/Smoking', MedicalHistory.drug_addiction_smoking == True))
+
+        conditions.append(('Disability Name', contains(MedicalHistory.name_of_disability, search_term)))
+        conditions.append(('Medical History Details', contains(MedicalHistory.brief_medical_history, search_term)))
+        conditions.append(('Medication', contains(MedicalHistory.regular_medication, search_term)))
+
+        relevance = self.full_text.relevance(self._text_columns(), search_term)
+        return self._search_with_reasons(conditions, relevance)
 
     def search_by_condition(self, condition_field: str, is_positive: bool) -> List[MedicalHistory]:
         """
@@ -228,14 +163,7 @@ class MedicalService(CrudService):
             List of matching medical records
         """
         disability_name = disability_name.lower().strip()
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if record.name_of_disability and disability_name in record.name_of_disability.lower():
-                results.append(record)
-
-        return results
+        return self._find(self.full_text.contains(MedicalHistory.name_of_disability, disability_name))
 
     def get_medical_summary(self, student_id: int) -> Dict[str, Any]:
         """
@@ -268,6 +196,14 @@ class MedicalService(CrudService):
             'additional_information': getattr(record, 'additional_information', None),
         }
 
+    def _text_columns(self) -> List:
+        """Free-text columns searched by search() and advanced_search()"""
+        return [
+            MedicalHistory.name_of_disability,
+            MedicalHistory.brief_medical_history,
+            MedicalHistory.regular_medication
+        ]
+
     def get_students_with_special_needs(self) -> List[MedicalHistory]:
         """
         Get all students with special medical needs
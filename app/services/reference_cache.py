@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from app.config.config import Config
+from app.services.change_bus import ChangeBus
+from app.utils.logger import Logger
+
+
+class _Entry:
+    __slots__ = ('value', 'expires_at', 'tables')
+
+    def __init__(self, value, expires_at, tables):
+        self.value = value
+        self.expires_at = expires_at
+        self.tables = tables
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache with a time-to-live per entry
+
+    Entries are tagged with the tables they were read from so a write to a
+    table can drop exactly the entries built from it.
+    """
+
+    def __init__(self, max_entries: int = 256, default_ttl: Optional[float] = 300):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            default_ttl: Seconds an entry lives (None keeps it until evicted or invalidated)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry.expires_at is not None and entry.expires_at <= time.monotonic()):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, value, ttl: Optional[float] = -1, tables: Iterable[str] = ()):
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds to keep it (-1 uses the default, None never expires)
+            tables: Table names the value was read from
+        """
+        ttl = self.default_ttl if ttl == -1 else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = _Entry(value, expires_at, frozenset(tables))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        """Drop every entry read from any of the tables; returns the number dropped"""
+        tables = set(tables)
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry.tables & tables]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions}
+
+
+class ReferenceCache:
+    """
+    Read-through cache for reference data such as courses and filter choices
+
+    Lookups go through get_or_load(); entries built from a table are dropped
+    whenever the ChangeBus reports a committed write to that table, locally
+    or (with the change log enabled) from another workstation. The backend
+    can be replaced by any object with TTLCache's interface.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ReferenceCache, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = Config()
+        self.logger = Logger()
+        settings = self.config.cache_settings
+        self.enabled = bool(settings['enabled'])
+        self.backend = TTLCache(int(settings['max_entries']), settings['ttl_seconds'])
+        ChangeBus().subscribe(self._on_changes)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], tables: Iterable[str] = (),
+                    ttl: Optional[float] = -1):
+        """
+        Get a cached value, calling loader and caching its result on a miss
+
+        Args:
+            key: Cache key
+            loader: Callable producing the value
+            tables: Table names the value is read from
+            ttl: Seconds to keep the value (-1 uses the configured default, None never expires)
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        if not self.enabled:
+            return loader()
+
+        missing = object()
+        value = self.backend.get(key, missing)
+        if value is missing:
+            value = loader()
+            self.backend.set(key, value, ttl, tables)
+        return value
+
+    def invalidate_tables(self, tables: Iterable[str]):
+        self.backend.invalidate_tables(tables)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self.backend.stats()
+
+    def _on_changes(self, changes):
+        self.backend.invalidate_tables({change.table for change in changes})
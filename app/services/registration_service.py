@@ -0,0 +1,287 @@
+import datetime
+from collections import Counter
+from typing import Any, Dict, List, Tuple, Union
+
+from sqlalchemy import Boolean, Date
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database.db_connection import DataDatabase
+from app.models.student_models import (
+    Course, EducationHistory, Enrollment, HostelManagement, MedicalHistory, Student, StudentGuardian,
+    Transportation
+)
+from app.services.change_bus import ChangeBus, DataChange
+from app.services.dashboard_stats import DashboardStats
+from app.services.student_service import StudentService
+from app.utils.logger import Logger
+
+
+class RegistrationService:
+    """
+    Registers and edits a student together with all related records in one transaction
+
+    The student and its children are added or changed through the Student
+    relationships and written by a single flush, so either the whole
+    registration or edit is saved or nothing is.
+    """
+
+    # Form section: (Student relationship, model, {required field: error message})
+    SECTIONS = {
+        'guardians': ('guardians', StudentGuardian, {'guardian_name': "Guardian name is required"}),
+        'medical': ('medical_history', MedicalHistory, {}),
+        'education': ('education_history', EducationHistory, {'education_level': "Education level is required"}),
+        'enrollments': ('enrollments', Enrollment, {'course_id': "Course ID is required"}),
+        'hostel': ('hostel_info', HostelManagement, {}),
+        'transportation': ('transportation', Transportation, {}),
+    }
+
+    def __init__(self):
+        self.db = DataDatabase()
+        self.logger = Logger()
+        self.student_service = StudentService()
+        self.stats = DashboardStats()
+        self.changes = ChangeBus()
+
+    def register(self, form_data: Dict[str, Any]) -> Tuple[bool, Union[Dict[str, Any], str]]:
+        """
+        Insert a student and its related records with a single commit
+
+        Args:
+            form_data: Dictionary with a 'personal' dict of student fields and,
+                       per SECTIONS key, a dict or list of dicts of that table's
+                       fields (student_id is filled in automatically)
+
+        Returns:
+            Tuple of (success, details dictionary shaped like
+            StudentService.get_student_with_details, or error message)
+        """
+        personal = dict(form_data.get('personal') or {})
+        error = self.student_service.prepare_student_data(personal)
+        if error:
+            return False, error
+
+        student = self._build(Student, personal)
+        for section, (relationship, model_class, required) in self.SECTIONS.items():
+            # Touching every collection while the student is transient makes it
+            # an empty loaded list rather than a lazy load after the insert
+            collection = getattr(student, relationship)
+            rows = form_data.get(section) or []
+            if isinstance(rows, dict):
+                rows = [rows]
+            for data in rows:
+                for field, message in required.items():
+                    if data.get(field) in (None, ''):
+                        return False, message
+                try:
+                    collection.append(self._build(model_class, data))
+                except ValueError as e:
+                    return False, f"Invalid {section} data: {str(e)}"
+
+        db_session = self.db.get_session()
+        try:
+            db_session.add(student)
+            db_session.flush()
+
+            if self.stats.tracks(Student):
+                self.stats.apply(db_session, self.stats.contributions(student, cascade=True))
+
+            changes = self._changes(student)
+            self.changes.log(db_session, changes)
+
+            course_ids = {enr.course_id for enr in student.enrollments if enr.course_id}
+            course_names = dict(db_session.query(Course.course_id, Course.course_name).filter(
+                Course.course_id.in_(course_ids))) if course_ids else {}
+
+            db_session.commit()
+            self.changes.publish(changes)
+        except SQLAlchemyError as e:
+            db_session.rollback()
+            error_msg = f"Database error registering student: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            db_session.rollback()
+            error_msg = f"Error registering student: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        finally:
+            db_session.close()
+
+        self.logger.info(f"Registered student #{student.student_id} with {len(changes) - 1} related records")
+        related = {key: getattr(student, key) for key, _ in StudentService.DETAIL_TABLES}
+        return True, self.student_service.serialize_details(student, related, course_names)
+
+    def save_changes(self, original: Dict[str, Any],
+                     form_data: Dict[str, Any]) -> Tuple[bool, Union[int, str]]:
+        """
+        Save an edited student profile as one unit of work
+
+        The form is compared with the details it was loaded from and only
+        fields whose value changed are written: one UPDATE of the changed
+        columns per modified row and one INSERT per section that had no row
+        yet, all flushed and committed together. When nothing changed the
+        database is not touched at all.
+
+        Args:
+            original: Details the form was filled from (StudentService.get_student_with_details)
+            form_data: Dictionary with a 'personal' dict of student fields and,
+                       per SECTIONS key, a dict of the fields of that table's
+                       first row; sections left out are not saved
+
+        Returns:
+            Tuple of (success, number of rows written or error message)
+        """
+        student_id = original['student_id']
+
+        personal = dict(form_data.get('personal') or {})
+        if personal:
+            error = self.student_service.prepare_student_data(personal)
+            if error:
+                return False, error
+
+        # (Student relationship, model, primary key, {field: new value}) per row to write;
+        # a primary key of None is a new row
+        pending = []
+        changed = self._diff(Student, original, personal)
+        if changed:
+            pending.append((None, Student, student_id, changed))
+
+        for section, (relationship, model_class, required) in self.SECTIONS.items():
+            data = form_data.get(section)
+            if not data:
+                continue
+            key_field = model_class.__mapper__.primary_key[0].key
+            rows = original.get(relationship) or []
+            try:
+                if rows and rows[0].get(key_field):
+                    changed = self._diff(model_class, rows[0], data)
+                    if changed:
+                        pending.append((relationship, model_class, rows[0][key_field], changed))
+                elif not all(value in (None, '', False) for value in data.values()):
+                    for field, message in required.items():
+                        if data.get(field) in (None, ''):
+                            return False, message
+                    pending.append((relationship, model_class, None, self._build(model_class, data)))
+            except ValueError as e:
+                return False, f"Invalid {section} data: {str(e)}"
+
+        if not pending:
+            self.logger.info(f"No changes to save for student #{student_id}")
+            return True, 0
+
+        db_session = self.db.get_session()
+        try:
+            student = self.student_service.query_with_details(db_session).filter(
+                Student.student_id == student_id).one_or_none()
+            if not student:
+                return False, f"Student #{student_id} no longer exists"
+
+            track_stats = self.stats.tracks(Student)
+            if track_stats:
+                deltas = Counter()
+                deltas.subtract(self.stats.contributions(student, cascade=True))
+
+            written = []
+            for relationship, model_class, record_id, values in pending:
+                if record_id is None:
+                    getattr(student, relationship).append(values)
+                    written.append((ChangeBus.INSERT, values))
+                    continue
+                if model_class is Student:
+                    record = student
+                else:
+                    key_field = model_class.__mapper__.primary_key[0].key
+                    record = next((row for row in getattr(student, relationship)
+                                   if getattr(row, key_field) == record_id), None)
+                    if record is None:
+                        db_session.rollback()
+                        return False, f"{model_class.__tablename__} record #{record_id} no longer exists"
+                for field, value in values.items():
+                    setattr(record, field, value)
+                written.append((ChangeBus.UPDATE, record))
+
+            # Every UPDATE and INSERT goes out in this one flush
+            db_session.flush()
+
+            if track_stats:
+                deltas.update(self.stats.contributions(student, cascade=True))
+                self.stats.apply(db_session, deltas)
+
+            changes = [DataChange(record.__tablename__,
+                                  getattr(record, type(record).__mapper__.primary_key[0].key), op, record)
+                       for op, record in written]
+            self.changes.log(db_session, changes)
+            db_session.commit()
+            self.changes.publish(changes)
+        except SQLAlchemyError as e:
+            db_session.rollback()
+            error_msg = f"Database error saving student #{student_id}: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        except Exception as e:
+            db_session.rollback()
+            error_msg = f"Error saving student #{student_id}: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+        finally:
+            db_session.close()
+
+        self.logger.info(f"Saved {len(changes)} changed records for student #{student_id}")
+        return True, len(changes)
+
+    @classmethod
+    def _diff(cls, model_class, original: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Form fields whose value differs from the loaded row, converted for the model"""
+        table = model_class.__table__
+        changed = {}
+        for field, value in data.items():
+            if field == 'student_id' or field not in table.columns or table.columns[field].primary_key:
+                continue
+            column = table.columns[field]
+            value = cls._convert(column, value)
+            if cls._comparable(column, value) != cls._comparable(column, original.get(field)):
+                changed[field] = value
+        return changed
+
+    @staticmethod
+    def _comparable(column, value):
+        """Normalize a value so form input and loaded data compare equal when unchanged"""
+        if isinstance(column.type, Boolean):
+            return bool(value)
+        if value is None or value == '':
+            return None
+        if isinstance(value, datetime.date):
+            return value.strftime('%Y-%m-%d')
+        return value
+
+    @staticmethod
+    def _convert(column, value):
+        """Convert a form value for a column, parsing YYYY-MM-DD strings for dates"""
+        if isinstance(value, str) and isinstance(column.type, Date):
+            try:
+                return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+            except ValueError:
+                raise ValueError(f"Invalid date format for {column.name}. Use YYYY-MM-DD.")
+        return value
+
+    @classmethod
+    def _build(cls, model_class, data: Dict[str, Any]):
+        """Create an unsaved instance from form fields, skipping keys and unknown fields"""
+        record = model_class()
+        table = model_class.__table__
+        for field, value in data.items():
+            if field == 'student_id' or field not in table.columns or table.columns[field].primary_key:
+                continue
+            setattr(record, field, cls._convert(table.columns[field], value))
+        return record
+
+    @staticmethod
+    def _changes(student) -> List[DataChange]:
+        """ChangeBus events for the student and every related row inserted with it"""
+        changes = [DataChange(Student.__tablename__, student.student_id, ChangeBus.INSERT, student)]
+        for relationship, model_class, _ in RegistrationService.SECTIONS.values():
+            key_field = model_class.__mapper__.primary_key[0].key
+            for record in getattr(student, relationship):
+                changes.append(DataChange(model_class.__tablename__, getattr(record, key_field),
+                                          ChangeBus.INSERT, record))
+        return changes
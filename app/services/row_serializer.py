@@ -0,0 +1,44 @@
+import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import Date, DateTime
+
+
+@lru_cache(maxsize=None)
+def row_serializer(model_class, date_format: Optional[str] = '%Y-%m-%d') -> Callable[[object], Dict[str, Any]]:
+    """
+    Get a function converting instances of a model to {column name: value}
+
+    The column names, a single attrgetter for all of them and the positions
+    of date columns are worked out once per model and format, so converting
+    a row no longer walks __table__.columns and type-checks every value.
+
+    Args:
+        model_class: SQLAlchemy model class
+        date_format: strftime format for date columns, or None for isoformat()
+
+    Returns:
+        Callable taking a model instance and returning a dictionary
+    """
+    columns = list(model_class.__table__.columns)
+    names = tuple(column.name for column in columns)
+    getter = attrgetter(*names)
+    date_positions = tuple(index for index, column in enumerate(columns)
+                           if isinstance(column.type, (Date, DateTime)))
+    single = len(names) == 1
+
+    def to_dict(record) -> Dict[str, Any]:
+        values = getter(record)
+        if single:
+            values = (values,)
+        if date_positions:
+            values = list(values)
+            for index in date_positions:
+                value = values[index]
+                if isinstance(value, (datetime.date, datetime.datetime)):
+                    values[index] = value.strftime(date_format) if date_format else value.isoformat()
+        return dict(zip(names, values))
+
+    return to_dict
@@ -1,6 +1,9 @@
 from datetime import datetime, timezone, timedelta
-from sqlalchemy import func, and_
+import threading
+import time
+from sqlalchemy import func, and_, bindparam, event
 from sqlalchemy import exc as sqlalchemy_exc
+from sqlalchemy.orm import make_transient_to_detached
 import logging
 
 from app.models.session import UserSession
@@ -8,6 +11,129 @@ from app.models.user import User
 from app.config.config import Config
 
 
+class _ValidatedSession:
+    __slots__ = ('session_id', 'user_id', 'user', 'last_activity', 'flushed_activity', 'checked_at')
+
+    def __init__(self, session_id, user_id, user, last_activity, flushed_activity, checked_at):
+        self.session_id = session_id
+        self.user_id = user_id
+        self.user = user
+        self.last_activity = last_activity
+        self.flushed_activity = flushed_activity
+        self.checked_at = checked_at
+
+
+class SessionCache:
+    """
+    Sessions validated against the database, kept in memory by token
+
+    A cached session is re-read from the database once it is older than
+    validation_cache_seconds; in between, validation only checks expiry
+    against the in-memory last_activity. That value is written back at most
+    once per activity_flush_seconds per session, in one batched UPDATE.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(SessionCache, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        settings = Config().session_settings
+        self.ttl = float(settings['validation_cache_seconds'])
+        self.flush_interval = timedelta(seconds=float(settings['activity_flush_seconds']))
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_token):
+        """Get the cached session and whether it was checked within the TTL"""
+        with self._lock:
+            entry = self._entries.get(session_token)
+        if entry is None:
+            return None, False
+        return entry, time.monotonic() - entry.checked_at < self.ttl
+
+    @staticmethod
+    def _snapshot(user):
+        """
+        Detached copy of a user with every column loaded
+
+        The live instance belongs to the caller's session and is expired by
+        its next commit, so after that session closes it can no longer be
+        read. The copy is never expired and needs no session.
+        """
+        snapshot = User(**{column.key: getattr(user, column.key) for column in User.__mapper__.column_attrs})
+        make_transient_to_detached(snapshot)
+        return snapshot
+
+    def put(self, session_token, session, user, last_activity):
+        """Cache a session just validated against the database, keeping unwritten activity"""
+        user = self._snapshot(user)
+        with self._lock:
+            entry = self._entries.get(session_token)
+            if entry is not None and entry.session_id == session.id:
+                entry.user = user
+                entry.last_activity = max(entry.last_activity, last_activity)
+                entry.flushed_activity = session.last_activity
+                entry.checked_at = time.monotonic()
+            else:
+                entry = _ValidatedSession(session.id, user.id, user, last_activity, session.last_activity,
+                                          time.monotonic())
+                self._entries[session_token] = entry
+            return entry
+
+    def invalidate(self, session_token):
+        with self._lock:
+            self._entries.pop(session_token, None)
+
+    def invalidate_user(self, user_id):
+        with self._lock:
+            for token in [token for token, entry in self._entries.items() if entry.user_id == user_id]:
+                del self._entries[token]
+
+    def invalidate_idle(self, before):
+        """Drop sessions whose last activity is older than before"""
+        with self._lock:
+            for token in [token for token, entry in self._entries.items() if entry.last_activity < before]:
+                del self._entries[token]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def due_activity(self, force=False):
+        """
+        Get the last_activity values waiting to be written
+
+        Args:
+            force: Include every unwritten value, not only those older than the flush interval
+
+        Returns:
+            List of {'session_id', 'activity'} parameter dictionaries
+        """
+        with self._lock:
+            return [{'session_id': entry.session_id, 'activity': entry.last_activity}
+                    for entry in self._entries.values()
+                    if entry.last_activity > entry.flushed_activity
+                    and (force or entry.last_activity - entry.flushed_activity >= self.flush_interval)]
+
+    def mark_flushed(self, rows):
+        written = {row['session_id']: row['activity'] for row in rows}
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.session_id in written:
+                    entry.flushed_activity = max(entry.flushed_activity, written[entry.session_id])
+
+
+@event.listens_for(User.is_active, 'set')
+def _invalidate_deactivated_user(user, value, _old_value, _initiator):
+    """Drop a deactivated user's cached sessions as soon as the flag is set"""
+    if not value and user.id is not None:
+        SessionCache().invalidate_user(user.id)
+
+
 class SessionManager:
     """Manager for handling user sessions and session-related operations"""
 
@@ -22,6 +148,7 @@ class SessionManager:
             'supervisor': 1
         }
         self.config = config
+        self.cache = SessionCache()
 
     def create_session(self, user, ip_address=None, user_agent=None):
         """
@@ -85,6 +212,7 @@ class SessionManager:
         Args:
             user_id: ID of the user whose sessions to deactivate
         """
+        self.cache.invalidate_user(user_id)
         active_sessions = self.db_session.query(UserSession).filter(
             UserSession.user_id == user_id,
             UserSession.is_active == True
@@ -97,6 +225,9 @@ class SessionManager:
         """
         Validate if a session is active and not expired
 
+        Repeat validations within the cache TTL are answered from memory;
+        expiry is still checked on every call, against the latest activity.
+
         Args:
             session_token: The token of the session to validate
 
@@ -104,6 +235,22 @@ class SessionManager:
             Tuple of (user, message)
         """
         try:
+            # Get current time as naive UTC for MySQL
+            current_time = datetime.now(timezone.utc).replace(tzinfo=None)
+
+            cached, fresh = self.cache.get(session_token)
+            if fresh:
+                if current_time - cached.last_activity > self.session_timeout:
+                    self.cache.invalidate(session_token)
+                    self.db_session.query(UserSession).filter(UserSession.id == cached.session_id).update(
+                        {"is_active": False}, synchronize_session=False)
+                    self.db_session.commit()
+                    return None, "Session expired"
+
+                cached.last_activity = current_time
+                self.flush_activity()
+                return cached.user, "Session valid"
+
             # Find session
             session = self.db_session.query(UserSession).filter(
                 UserSession.session_token == session_token,
@@ -111,10 +258,15 @@ class SessionManager:
             ).first()
 
             if not session:
+                self.cache.invalidate(session_token)
                 return None, "Session not found or inactive"
 
-            # Check if session has expired
-            if self._is_session_expired(session):
+            # Check if session has expired, counting activity not yet written
+            last_activity = session.last_activity
+            if cached is not None and cached.session_id == session.id:
+                last_activity = max(last_activity, cached.last_activity)
+            if current_time - last_activity > self.session_timeout:
+                self.cache.invalidate(session_token)
                 session.is_active = False
                 self.db_session.commit()
                 return None, "Session expired"
@@ -123,13 +275,14 @@ class SessionManager:
             user = self.db_session.query(User).filter(User.id == session.user_id).first()
 
             if not user or not user.is_active:
+                self.cache.invalidate(session_token)
                 session.is_active = False
                 self.db_session.commit()
                 return None, "User not found or inactive"
 
-            # Update last activity time - naive UTC for MySQL
-            session.last_activity = datetime.now(timezone.utc).replace(tzinfo=None)
-            self.db_session.commit()
+            # Record the activity in memory; it is written by flush_activity()
+            self.cache.put(session_token, session, user, current_time)
+            self.flush_activity()
 
             return user, "Session valid"
 
@@ -154,6 +307,35 @@ class SessionManager:
         session_age = current_time - session.last_activity
         return session_age > self.session_timeout
 
+    def flush_activity(self, force=False):
+        """
+        Write throttled last_activity values in one batched UPDATE
+
+        Args:
+            force: Write every unwritten value, not only those due
+
+        Returns:
+            Number of sessions updated
+        """
+        rows = self.cache.due_activity(force)
+        if not rows:
+            return 0
+
+        table = UserSession.__table__
+        try:
+            self.db_session.execute(
+                table.update().where(table.c.id == bindparam('session_id')).values(
+                    last_activity=bindparam('activity')),
+                rows
+            )
+            self.db_session.commit()
+            self.cache.mark_flushed(rows)
+            return len(rows)
+        except sqlalchemy_exc.SQLAlchemyError as e:
+            self.db_session.rollback()
+            logging.error(f"Error writing session activity: {str(e)}")
+            return 0
+
     def end_session(self, session_token):
         """
         End an active user session
@@ -164,6 +346,7 @@ class SessionManager:
         Returns:
             Tuple of (success, message)
         """
+        self.cache.invalidate(session_token)
         try:
             # Find session
             session = self.db_session.query(UserSession).filter(
@@ -197,6 +380,9 @@ class SessionManager:
         Returns:
             Count of active non-expired sessions
         """
+        # Count on up-to-date activity times
+        self.flush_activity(force=True)
+
         # Get current time as naive UTC for MySQL
         current_time = datetime.now(timezone.utc).replace(tzinfo=None)
         comparison_time = current_time - self.session_timeout
@@ -216,10 +402,13 @@ class SessionManager:
         Returns:
             Number of sessions deactivated
         """
+        # Write pending activity first so recently used sessions are not expired
+        self.flush_activity(force=True)
         try:
             # Calculate expiration threshold - naive UTC for MySQL
             current_time = datetime.now(timezone.utc).replace(tzinfo=None)
             expiration_time = current_time - self.session_timeout
+            self.cache.invalidate_idle(expiration_time)
 
             # Use direct SQL update for better performance
             result = self.db_session.query(UserSession).filter(
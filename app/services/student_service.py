@@ -1,4 +1,5 @@
 from app.services.crud_service import CrudService
+from app.services.row_serializer import row_serializer
 from app.models.student_models import (
     Student,
     StudentGuardian,
@@ -9,11 +10,12 @@ from app.models.student_models import (
     HostelManagement,  # Add this import
     Transportation     # Add this import
 )
-from typing import Dict, List, Any, Tuple, Optional, Union
+from typing import Dict, List, Any, Tuple, Optional, Union, Iterable, Iterator
+from collections import defaultdict
 import datetime
 # import logging  # Add this for logger
-from sqlalchemy import or_
-# from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, or_, exists
+from sqlalchemy.orm import joinedload
 
 
 class StudentService(CrudService):
@@ -32,9 +34,27 @@ class StudentService(CrudService):
         Returns:
             Tuple of (success, student object or error message)
         """
+        error = self.prepare_student_data(student_data)
+        if error:
+            return False, error
+
+        # Use the generic create method
+        return self.create(student_data)
+
+    @staticmethod
+    def prepare_student_data(student_data: Dict[str, Any]) -> Optional[str]:
+        """
+        Validate student fields and convert date strings in place
+
+        Args:
+            student_data: Dictionary with student fields
+
+        Returns:
+            Error message, or None when the data is valid
+        """
         # Perform validations
         if 'student_name' not in student_data or not student_data['student_name']:
-            return False, "Student name is required"
+            return "Student name is required"
 
         # Format date fields if provided as strings
         if 'date_of_birth' in student_data and isinstance(student_data['date_of_birth'], str):
@@ -42,21 +62,53 @@ class StudentService(CrudService):
                 student_data['date_of_birth'] = datetime.datetime.strptime(
                     student_data['date_of_birth'], '%Y-%m-%d').date()
             except ValueError:
-                return False, "Invalid date format for date_of_birth. Use YYYY-MM-DD."
+                return "Invalid date format for date_of_birth. Use YYYY-MM-DD."
 
         if 'admission_date' in student_data and isinstance(student_data['admission_date'], str):
             try:
                 student_data['admission_date'] = datetime.datetime.strptime(
                     student_data['admission_date'], '%Y-%m-%d').date()
             except ValueError:
-                return False, "Invalid date format for admission_date. Use YYYY-MM-DD."
+                return "Invalid date format for admission_date. Use YYYY-MM-DD."
+
+        return None
+
+    # Related tables included in a student's details: (result key and
+    # Student relationship name, model)
+    DETAIL_TABLES = (
+        ('education_history', EducationHistory),
+        ('enrollments', Enrollment),
+        ('medical_history', MedicalHistory),
+        ('guardians', StudentGuardian),
+        ('hostel_info', HostelManagement),
+        ('transportation', Transportation),
+    )
+
+    # Every collection the details and edit dialogs show, loaded with the student
+    DETAIL_OPTIONS = (
+        joinedload(Student.education_history),
+        joinedload(Student.enrollments).joinedload(Enrollment.course),
+        joinedload(Student.medical_history),
+        joinedload(Student.guardians),
+        joinedload(Student.hostel_info),
+        joinedload(Student.transportation),
+    )
+
+    @classmethod
+    def query_with_details(cls, db_session):
+        """
+        Build a Student query that eagerly loads every related table
 
-        # Use the generic create method
-        return self.create(student_data)
+        The collections are LEFT OUTER JOINed into one statement instead of
+        being lazy-loaded one relationship (and one course) at a time. A
+        student only has a handful of rows per table, so the joined row
+        count stays small.
+        """
+        return db_session.query(Student).options(*cls.DETAIL_OPTIONS)
 
     def get_student_with_details(self, student_id: int) -> Optional[Dict[str, Any]]:
         """
-        Get a student with related records
+        Get a student with related records in a single query
 
         Args:
             student_id: ID of the student
@@ -66,120 +118,16 @@ class StudentService(CrudService):
         """
         db_session = self.db.get_session()
         try:
-            # First try to get the base student record
-            student = db_session.query(Student).get(student_id)
+            student = self.query_with_details(db_session).filter(
+                Student.student_id == student_id).one_or_none()
 
             if not student:
                 self.logger.error(f"Student with ID {student_id} not found")
                 return None
 
-            # Create a dictionary copy of the student data
-            result = {}
-            for column in student.__table__.columns:
-                value = getattr(student, column.name)
-                # Convert dates to string for easier handling
-                if isinstance(value, (datetime.date, datetime.datetime)):
-                    value = value.strftime('%Y-%m-%d')
-                result[column.name] = value
-
-            # Fetch related data with separate queries to avoid session issues
-
-            # Education History
-            education_history = db_session.query(EducationHistory).filter(
-                EducationHistory.student_id == student_id
-            ).all()
-            result['education_history'] = []
-            for edu in education_history:
-                edu_dict = {}
-                for column in edu.__table__.columns:
-                    value = getattr(edu, column.name)
-                    if isinstance(value, (datetime.date, datetime.datetime)):
-                        value = value.strftime('%Y-%m-%d')
-                    edu_dict[column.name] = value
-                result['education_history'].append(edu_dict)
-
-            # Enrollments - with course names
-            enrollments = db_session.query(Enrollment).filter(
-                Enrollment.student_id == student_id
-            ).all()
-            result['enrollments'] = []
-            for enr in enrollments:
-                enr_dict = {}
-                for column in enr.__table__.columns:
-                    value = getattr(enr, column.name)
-                    if isinstance(value, (datetime.date, datetime.datetime)):
-                        value = value.strftime('%Y-%m-%d')
-                    enr_dict[column.name] = value
-
-                # Get course name if available
-                if hasattr(enr, 'course_id') and enr.course_id:
-                    course = db_session.query(Course).get(enr.course_id)
-                    if course:
-                        enr_dict['course_name'] = course.course_name
-                    else:
-                        enr_dict['course_name'] = f"Unknown Course"
-                else:
-                    enr_dict['course_name'] = "No course assigned"
-
-                result['enrollments'].append(enr_dict)
-
-            # Medical History
-            medical_history = db_session.query(MedicalHistory).filter(
-                MedicalHistory.student_id == student_id
-            ).all()
-            result['medical_history'] = []
-            for med in medical_history:
-                med_dict = {}
-                for column in med.__table__.columns:
-                    value = getattr(med, column.name)
-                    if isinstance(value, (datetime.date, datetime.datetime)):
-                        value = value.strftime('%Y-%m-%d')
-                    med_dict[column.name] = value
-                result['medical_history'].append(med_dict)
-
-            # Guardians
-            guardians = db_session.query(StudentGuardian).filter(
-                StudentGuardian.student_id == student_id
-            ).all()
-            result['guardians'] = []
-            for guard in guardians:
-                guard_dict = {}
-                for column in guard.__table__.columns:
-                    value = getattr(guard, column.name)
-                    if isinstance(value, (datetime.date, datetime.datetime)):
-                        value = value.strftime('%Y-%m-%d')
-                    guard_dict[column.name] = value
-                result['guardians'].append(guard_dict)
-
-            # Hostel information
-            hostel_info = db_session.query(HostelManagement).filter(
-                HostelManagement.student_id == student_id
-            ).all()
-            result['hostel_info'] = []
-            for host in hostel_info:
-                host_dict = {}
-                for column in host.__table__.columns:
-                    value = getattr(host, column.name)
-                    if isinstance(value, (datetime.date, datetime.datetime)):
-                        value = value.strftime('%Y-%m-%d')
-                    host_dict[column.name] = value
-                result['hostel_info'].append(host_dict)
-
-            # Transportation
-            transportation = db_session.query(Transportation).filter(
-                Transportation.student_id == student_id
-            ).all()
-            result['transportation'] = []
-            for trans in transportation:
-                trans_dict = {}
-                for column in trans.__table__.columns:
-                    value = getattr(trans, column.name)
-                    if isinstance(value, (datetime.date, datetime.datetime)):
-                        value = value.strftime('%Y-%m-%d')
-                    trans_dict[column.name] = value
-                result['transportation'].append(trans_dict)
-
-            return result
+            related = {key: getattr(student, key) for key, _ in self.DETAIL_TABLES}
+            course_names = {enr.course_id: enr.course.course_name for enr in student.enrollments if enr.course}
+            return self.serialize_details(student, related, course_names)
 
         except Exception as e:
             self.logger.error(f"Error getting student with details #{student_id}: {str(e)}")
@@ -187,126 +135,160 @@ class StudentService(CrudService):
         finally:
             db_session.close()
 
+    def get_many_with_details(self, student_ids: Iterable[int],
+                              chunk_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream full student profiles for many students, for reports and exports
+
+        Each chunk of IDs costs one IN query per table (students, the six
+        related tables and the course names), and the related rows are
+        grouped by student_id in memory. The session is closed before a
+        chunk is yielded, so callers may do other work while iterating.
+
+        Args:
+            student_ids: IDs of the students; IDs that do not exist are skipped
+            chunk_size: Students loaded per round of queries (defaults to BULK_CHUNK_SIZE)
+
+        Yields:
+            Dictionaries shaped like get_student_with_details, in the order of student_ids
+        """
+        student_ids = list(dict.fromkeys(student_ids))
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+
+        for start in range(0, len(student_ids), chunk_size):
+            chunk = student_ids[start:start + chunk_size]
+            db_session = self.db.get_session()
+            try:
+                students = {student.student_id: student for student in
+                            db_session.query(Student).filter(Student.student_id.in_(chunk))}
+                related = {student_id: defaultdict(list) for student_id in students}
+                course_ids = set()
+                for key, model_class in self.DETAIL_TABLES:
+                    for row in db_session.query(model_class).filter(model_class.student_id.in_(list(students))):
+                        related[row.student_id][key].append(row)
+                        if key == 'enrollments' and row.course_id:
+                            course_ids.add(row.course_id)
+                course_names = dict(db_session.query(Course.course_id, Course.course_name).filter(
+                    Course.course_id.in_(course_ids))) if course_ids else {}
+
+                profiles = [self.serialize_details(students[student_id], related[student_id], course_names)
+                            for student_id in chunk if student_id in students]
+            except Exception as e:
+                self.logger.error(f"Error loading details for {len(chunk)} students: {str(e)}")
+                raise
+            finally:
+                db_session.close()
+
+            for profile in profiles:
+                yield profile
+
+    def serialize_details(self, student: Student, related: Dict[str, List[Any]],
+                         course_names: Dict[int, str]) -> Dict[str, Any]:
+        """
+        Serialize a student and its related rows
+
+        Args:
+            student: Student instance
+            related: Dictionary of DETAIL_TABLES key: related instances
+            course_names: Dictionary of course_id: course name
+
+        Returns:
+            Dictionary with the student's columns and one list per related table
+        """
+        result = row_serializer(Student)(student)
+        for key, model_class in self.DETAIL_TABLES:
+            to_dict = row_serializer(model_class)
+            result[key] = [to_dict(row) for row in related.get(key, ())]
+
+        # Enrollments - with course names
+        for enr_dict in result['enrollments']:
+            if enr_dict['course_id']:
+                enr_dict['course_name'] = course_names.get(enr_dict['course_id']) or "Unknown Course"
+            else:
+                enr_dict['course_name'] = "No course assigned"
+        return result
+
     def advanced_search(self, search_term: str) -> Tuple[List[Student], Dict[int, List[str]]]:
         """
         Search for students by multiple fields including guardian information
 
+        All fields are checked in a single query; the database reports which
+        fields matched for each student. In full-text mode the text fields use
+        MATCH ... AGAINST and results are ranked by relevance.
+
         Args:
             search_term: Term to search for
 
         Returns:
             Tuple of (list of matching students, dict of student_id: match_reasons)
         """
-        db_session = self.db.get_session()
-        try:
-            # Try to parse student_id if the search term is a number
-            student_id = None
-            if search_term.isdigit():
-                student_id = int(search_term)
-
-            # Keep track of why each student matched
-            match_reasons = {}
-
-            # Query students directly first
-            direct_students = []
-
-            # Check each field individually to track match reasons
-            name_matches = db_session.query(Student).filter(
-                Student.student_name.ilike(f'%{search_term}%')
-            ).all()
-            for student in name_matches:
-                if student.student_id not in match_reasons:
-                    match_reasons[student.student_id] = []
-                match_reasons[student.student_id].append('Name')
-                direct_students.append(student)
-
-            cnic_matches = db_session.query(Student).filter(
-                Student.cnic.ilike(f'%{search_term}%')
-            ).all()
-            for student in cnic_matches:
-                if student.student_id not in match_reasons:
-                    match_reasons[student.student_id] = []
-                match_reasons[student.student_id].append('CNIC')
-                if student not in direct_students:
-                    direct_students.append(student)
-
-            phone_matches = db_session.query(Student).filter(
-                or_(
-                    Student.phone.ilike(f'%{search_term}%'),
-                    Student.student_contact_no.ilike(f'%{search_term}%')
-                )
-            ).all()
-            for student in phone_matches:
-                if student.student_id not in match_reasons:
-                    match_reasons[student.student_id] = []
-                match_reasons[student.student_id].append('Phone')
-                if student not in direct_students:
-                    direct_students.append(student)
-
-            address_matches = db_session.query(Student).filter(
-                Student.address.ilike(f'%{search_term}%')
-            ).all()
-            for student in address_matches:
-                if student.student_id not in match_reasons:
-                    match_reasons[student.student_id] = []
-                match_reasons[student.student_id].append('Address')
-                if student not in direct_students:
-                    direct_students.append(student)
-
-            # If search term is a number, also search by student_id
-            if student_id:
-                id_student = db_session.query(Student).filter(
-                    Student.student_id == student_id
-                ).first()
-                if id_student:
-                    if id_student.student_id not in match_reasons:
-                        match_reasons[id_student.student_id] = []
-                    match_reasons[id_student.student_id].append('Student ID')
-                    if id_student not in direct_students:
-                        direct_students.append(id_student)
-
-            # Search in guardian data
-            guardian_results = db_session.query(
-                StudentGuardian, Student
-            ).join(
-                Student, StudentGuardian.student_id == Student.student_id
-            ).filter(
-                or_(
-                    StudentGuardian.guardian_name.ilike(f'%{search_term}%'),
-                    StudentGuardian.guardian_contact_number.ilike(f'%{search_term}%')
-                )
-            ).all()
-
-            # Process guardian matches
-            for guardian, student in guardian_results:
-                if student.student_id not in match_reasons:
-                    match_reasons[student.student_id] = []
-
-                if search_term.lower() in guardian.guardian_name.lower():
-                    match_reasons[student.student_id].append('Guardian Name')
-
-                if guardian.guardian_contact_number and search_term.lower() in guardian.guardian_contact_number.lower():
-                    match_reasons[student.student_id].append('Guardian Contact')
-
-                if student not in direct_students:
-                    direct_students.append(student)
-
-            # Convert direct_students to a list of detached dictionaries
-            result_students = []
-            for student in direct_students:
-                # Create a fresh copy of the student data
-                student_copy = Student()
-                for column in student.__table__.columns:
-                    setattr(student_copy, column.name, getattr(student, column.name))
-                result_students.append(student_copy)
-
-            return result_students, match_reasons
+        contains = self.full_text.contains
+
+        def guardian_matches(column):
+            return exists().where(and_(
+                StudentGuardian.student_id == Student.student_id,
+                contains(column, search_term)
+            ))
+
+        conditions = [
+            ('Name', contains(Student.student_name, search_term)),
+            ('CNIC', contains(Student.cnic, search_term)),
+            ('Phone', or_(
+                contains(Student.phone, search_term),
+                contains(Student.student_contact_no, search_term)
+            )),
+            ('Address', contains(Student.address, search_term)),
+        ]
+
+        # If search term is a number, also search by student_id
+        if search_term.isdigit():
+            conditions.append(('Student ID', Student.student_id == int(search_term)))
+
+        conditions.append(('Guardian Name', guardian_matches(StudentGuardian.guardian_name)))
+        conditions.append(('Guardian Contact', guardian_matches(StudentGuardian.guardian_contact_number)))
+
+        relevance = self.full_text.relevance(
+            [Student.student_name, Student.cnic, Student.phone, Student.address], search_term)
+
+        return self._search_with_reasons(conditions, relevance)
+
+    def fuzzy_search(self, search_term: str,
+                     limit: Optional[int] = None) -> Optional[Tuple[List[Student], Dict[int, List[str]]]]:
+        """
+        Typo-tolerant student search answered by the in-process trigram index
 
-        except Exception as e:
-            self.logger.error(f"Error in advanced search: {str(e)}")
-            return [], {}
-        finally:
-            db_session.close()
+        Covers the same fields as advanced_search, including guardian name and
+        contact; a student matched only through a guardian ranks by that match.
+
+        Args:
+            search_term: Term to search for
+            limit: Maximum number of students
+
+        Returns:
+            Tuple of (students best match first, dict of student_id: match_reasons),
+            or None when the index is not ready yet
+        """
+        student_hits = self.search_index.search(Student, search_term)
+        guardian_hits = self.search_index.search(StudentGuardian, search_term)
+        if student_hits is None or guardian_hits is None:
+            return None
+
+        guardian_reasons = {'Name': 'Guardian Name', 'Contact': 'Guardian Contact'}
+        scores = {hit.key: hit.score for hit in student_hits}
+        match_reasons = {hit.key: list(hit.fields) for hit in student_hits}
+        for hit in guardian_hits:
+            reasons = [guardian_reasons[field] for field in hit.fields if field in guardian_reasons]
+            if not reasons or hit.student_id is None:
+                continue
+            scores[hit.student_id] = max(scores.get(hit.student_id, 0.0), hit.score)
+            existing = match_reasons.setdefault(hit.student_id, [])
+            existing.extend(reason for reason in reasons if reason not in existing)
+
+        ranked = sorted(scores, key=lambda student_id: (-scores[student_id], student_id))
+        if limit:
+            ranked = ranked[:limit]
+        students = self.read_many(ranked) or []
+        return students, {student_id: match_reasons[student_id] for student_id in ranked}
 
     def _model_to_dict(self, model):
         """Helper method to convert SQLAlchemy model to dict"""
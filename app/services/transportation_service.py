@@ -44,8 +44,9 @@
 # Current User: CryinMonk
 
 from app.services.crud_service import CrudService
-from app.models.student_models import Transportation
+from app.models.student_models import Transportation, Student
 from typing import Dict, List, Any, Tuple, Optional, Union
+from sqlalchemy import exists
 
 
 class TransportationService(CrudService):
@@ -124,44 +125,10 @@ class TransportationService(CrudService):
             # If no records found by student ID, look for contact numbers
             return self.search_by_contact(search_term)
 
-        # Perform a general search across all transportation records
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            # Search in responsible person name
-            if (hasattr(record, 'pickup_drop_responsible_name') and
-                    record.pickup_drop_responsible_name and
-                    search_term in record.pickup_drop_responsible_name.lower()):
-                results.append(record)
-                continue
-
-            # Search in contact number
-            if (hasattr(record, 'pickup_drop_contact_number') and
-                    record.pickup_drop_contact_number and
-                    search_term in record.pickup_drop_contact_number):
-                results.append(record)
-                continue
-
-            # Search in transport type if it exists
-            if hasattr(record, 'transport_type') and record.transport_type:
-                if search_term in record.transport_type.lower():
-                    results.append(record)
-                    continue
-
-            # Search in route information if it exists
-            if hasattr(record, 'route_information') and record.route_information:
-                if search_term in record.route_information.lower():
-                    results.append(record)
-                    continue
-
-            # Search in additional notes if it exists
-            if hasattr(record, 'notes') and record.notes:
-                if search_term in record.notes.lower():
-                    results.append(record)
-                    continue
-
-        return results
+        # Perform a general search across the text columns
+        columns = [Transportation.pickup_drop_responsible_name, Transportation.pickup_drop_contact_number]
+        return self._find(self.full_text.contains_any(columns, search_term),
+                          relevance=self.full_text.relevance(columns, search_term))
 
     def advanced_search(self, search_term: str) -> Tuple[List[Transportation], Dict[int, List[str]]]:
         """
@@ -174,61 +141,16 @@ class TransportationService(CrudService):
             Tuple of (matching records, dictionary of transport_id to list of match reasons)
         """
         search_term = search_term.lower().strip()
-        all_records = self.read_all()
-        results = []
-        match_reasons = {}  # Dictionary to store match reasons
-
-        for record in all_records:
-            record_id = record.transport_id
-            reasons = []
-
-            # Check student ID
-            if search_term.isdigit() and int(search_term) == record.student_id:
-                results.append(record)
-                reasons.append('Student ID')
-
-            # Check responsible person name
-            if (hasattr(record, 'pickup_drop_responsible_name') and
-                    record.pickup_drop_responsible_name and
-                    search_term in record.pickup_drop_responsible_name.lower()):
-                if record not in results:
-                    results.append(record)
-                reasons.append('Responsible Person')
-
-            # Check contact number
-            if (hasattr(record, 'pickup_drop_contact_number') and
-                    record.pickup_drop_contact_number and
-                    search_term in record.pickup_drop_contact_number):
-                if record not in results:
-                    results.append(record)
-                reasons.append('Contact Number')
-
-            # Check transport type
-            if hasattr(record, 'transport_type') and record.transport_type:
-                if search_term in record.transport_type.lower():
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Transport Type')
-
-            # Check route information
-            if hasattr(record, 'route_information') and record.route_information:
-                if search_term in record.route_information.lower():
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Route Information')
-
-            # Check notes
-            if hasattr(record, 'notes') and record.notes:
-                if search_term in record.notes.lower():
-                    if record not in results:
-                        results.append(record)
-                    reasons.append('Notes')
-
-            # Store match reasons if any were found
-            if reasons:
-                match_reasons[record_id] = reasons
-
-        return results, match_reasons
+        contains = self.full_text.contains
+
+        conditions = []
+        if search_term.isdigit():
+            conditions.append(('Student ID', Transportation.student_id == int(search_term)))
+        conditions.append(('Responsible Person', contains(Transportation.pickup_drop_responsible_name, search_term)))
+        conditions.append(('Contact Number', contains(Transportation.pickup_drop_contact_number, search_term)))
+
+        relevance = self.full_text.relevance([Transportation.pickup_drop_responsible_name], search_term)
+        return self._search_with_reasons(conditions, relevance)
 
     def search_by_responsible_person(self, name: str) -> List[Transportation]:
         """
@@ -241,16 +163,7 @@ class TransportationService(CrudService):
             List of matching transportation records
         """
         name = name.lower().strip()
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if (hasattr(record, 'pickup_drop_responsible_name') and
-                    record.pickup_drop_responsible_name and
-                    name in record.pickup_drop_responsible_name.lower()):
-                results.append(record)
-
-        return results
+        return self._find(self.full_text.contains(Transportation.pickup_drop_responsible_name, name))
 
     def search_by_contact(self, contact: str) -> List[Transportation]:
         """
@@ -263,16 +176,7 @@ class TransportationService(CrudService):
             List of matching transportation records
         """
         contact = contact.strip()
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if (hasattr(record, 'pickup_drop_contact_number') and
-                    record.pickup_drop_contact_number and
-                    contact in record.pickup_drop_contact_number):
-                results.append(record)
-
-        return results
+        return self._find(Transportation.pickup_drop_contact_number.like(f'%{contact}%'))
 
     def search_by_transport_type(self, transport_type: str) -> List[Transportation]:
         """
@@ -282,19 +186,10 @@ class TransportationService(CrudService):
             transport_type: Type of transportation to search for
 
         Returns:
-            List of matching transportation records
+            Always an empty list: the transportation table has no transport
+            type column, so there is nothing to match
         """
-        transport_type = transport_type.lower().strip()
-        all_records = self.read_all()
-        results = []
-
-        for record in all_records:
-            if (hasattr(record, 'transport_type') and
-                    record.transport_type and
-                    transport_type in record.transport_type.lower()):
-                results.append(record)
-
-        return results
+        return []
 
     def get_transportation_summary(self, student_id: int) -> Dict[str, Any]:
         """
@@ -342,7 +237,13 @@ class TransportationService(CrudService):
         Returns:
             List of student IDs without transportation arrangements
         """
-        # This would require comparing with the student table
-        # Implementation would depend on how you want to handle this cross-table check
-        # This is a placeholder that should be updated based on your data model
-        pass
\ No newline at end of file
+        db_session = self.db.get_session()
+        try:
+            has_transport = exists().where(Transportation.student_id == Student.student_id)
+            rows = db_session.query(Student.student_id).filter(~has_transport).order_by(Student.student_id).all()
+            return [row[0] for row in rows]
+        except Exception as e:
+            self.logger.error(f"Error finding students without transportation: {str(e)}")
+            return []
+        finally:
+            db_session.close()
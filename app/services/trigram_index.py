@@ -0,0 +1,409 @@
+import math
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from app.config.config import Config
+from app.services.change_bus import ChangeBus
+from app.database.db_connection import DataDatabase
+from app.models.student_models import Student, StudentGuardian, Transportation
+from app.utils.logger import Logger
+
+
+class TrigramHit(NamedTuple):
+    """A ranked match returned by TrigramSearch.search"""
+    key: int
+    student_id: Optional[int]
+    score: float
+    fields: List[str]
+
+
+def _normalize(value) -> str:
+    """Lower-case a value and drop separators so '35202-123' matches '35202123'"""
+    if value is None:
+        return ''
+    return re.sub(r'[\W_]+', '', str(value).lower())
+
+
+def _words(value) -> List[str]:
+    if value is None:
+        return []
+    return re.findall(r'[^\W_]+', str(value).lower())
+
+
+def _substring_grams(text: str) -> Set[str]:
+    """Unpadded trigrams: every one must be present for a substring match"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _word_grams(words: Iterable[str]) -> Set[str]:
+    """Padded per-word trigrams (as in pg_trgm) that reward matching word starts and ends"""
+    grams = set()
+    for word in words:
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class _Document:
+    """Normalized text of one indexed row"""
+    __slots__ = ('student_id', 'texts', 'words')
+
+    def __init__(self, student_id, values: Dict[str, str]):
+        self.student_id = student_id
+        self.texts = {field: _normalize(value) for field, value in values.items()}
+        self.words = {field: _words(value) for field, value in values.items()}
+
+    def grams(self) -> Set[str]:
+        grams = set()
+        for field, text in self.texts.items():
+            grams |= _substring_grams(text)
+            grams |= _word_grams(self.words[field])
+        return grams
+
+
+class TrigramIndex:
+    """
+    Memory-resident trigram index over the text columns of one table
+
+    Every row is split into trigrams of its separator-free text (so partial
+    CNICs and phone numbers match as substrings) and padded trigrams of each
+    word (so misspelled names still share most of their trigrams). A query
+    is scored by the fraction of its trigrams a row contains.
+    """
+
+    def __init__(self, model_class, fields: Dict[str, str], owner_field: Optional[str] = None):
+        """
+        Args:
+            model_class: SQLAlchemy model class of the table
+            fields: Dictionary of column name: match reason label
+            owner_field: Column holding the student ID for child tables
+        """
+        self.model_class = model_class
+        self.fields = fields
+        self.owner_field = owner_field
+        self.key_field = model_class.__mapper__.primary_key[0].key
+        self._documents = {}
+        self._postings = defaultdict(set)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def add(self, key: int, student_id: Optional[int], values: Dict[str, str]):
+        """Index a row, replacing any previous version of it"""
+        self.remove(key)
+        document = _Document(student_id, values)
+        self._documents[key] = document
+        for gram in document.grams():
+            self._postings[gram].add(key)
+
+    def remove(self, key: int):
+        """Drop a row from the index"""
+        document = self._documents.pop(key, None)
+        if document is None:
+            return
+        for gram in document.grams():
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def remove_student(self, student_id: int):
+        """Drop every row owned by a student (used when a student is deleted)"""
+        for key in [key for key, document in self._documents.items() if document.student_id == student_id]:
+            self.remove(key)
+
+    def add_record(self, record):
+        """Index an ORM instance of the model"""
+        values = {field: getattr(record, field, None) for field in self.fields}
+        student_id = getattr(record, self.owner_field, None) if self.owner_field else None
+        self.add(getattr(record, self.key_field), student_id, values)
+
+    def search(self, search_term: str, min_similarity: float, limit: Optional[int] = None) -> List[TrigramHit]:
+        """
+        Find rows matching a term by substring or trigram similarity
+
+        Args:
+            search_term: Text typed by the user
+            min_similarity: Fraction (0-1) of the query trigrams a field must contain
+            limit: Maximum number of hits
+
+        Returns:
+            Hits ordered best first: ID matches, prefix matches, substring
+            matches, then fuzzy matches by similarity
+        """
+        query = _normalize(search_term)
+        if not query:
+            return []
+
+        hits = {}
+
+        if search_term.strip().isdigit():
+            number = int(search_term.strip())
+            if self.owner_field is None:
+                if number in self._documents:
+                    hits[number] = [3.0, ['Student ID']]
+            else:
+                for key, document in self._documents.items():
+                    if document.student_id == number:
+                        hits[key] = [3.0, ['Student ID']]
+
+        if len(query) < 3:
+            # Too short for a whole trigram; the padded word-start trigram finds
+            # rows with a word beginning with the query
+            candidates = set(self._postings.get(f"  {query}"[-3:], set()))
+            query_grams = set()
+        else:
+            query_grams = _substring_grams(query) | _word_grams(_words(search_term))
+            candidates = self._containing(_substring_grams(query)) | self._similar(query_grams, min_similarity)
+
+        for key in candidates:
+            document = self._documents[key]
+            best, reasons = self._score_fields(document, self._substring_score, query)
+            if not reasons and query_grams:
+                best, reasons = self._score_fields(
+                    document, self._similarity_score, query_grams, min_similarity)
+            if not reasons:
+                continue
+            if key in hits:
+                hits[key][1].extend(reason for reason in reasons if reason not in hits[key][1])
+            else:
+                hits[key] = [best, reasons]
+
+        ranked = sorted(hits.items(), key=lambda item: (-item[1][0], item[0]))
+        if limit:
+            ranked = ranked[:limit]
+        return [TrigramHit(key, self._documents[key].student_id, round(score, 3), reasons)
+                for key, (score, reasons) in ranked]
+
+    def _containing(self, grams: Set[str]) -> Set[int]:
+        """Keys of rows holding every trigram, intersecting the rarest postings first"""
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings or not postings[0]:
+            return set()
+        return postings[0].intersection(*postings[1:])
+
+    def _similar(self, grams: Set[str], min_similarity: float) -> Set[int]:
+        """
+        Keys of rows sharing at least min_similarity of the query trigrams
+
+        A row reaching the threshold must hold one of the rarest
+        len(grams) - needed + 1 trigrams, so only those postings are scanned
+        for candidates and the common trigrams are merely probed.
+        """
+        needed = max(1, math.ceil(min_similarity * len(grams)))
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        pool = set().union(*postings[:len(postings) - needed + 1])
+        return {key for key in pool if sum(1 for keys in postings if key in keys) >= needed}
+
+    def _score_fields(self, document, scorer, *args):
+        """Score each field of a row, returning (best score, match reasons)"""
+        best = 0.0
+        reasons = []
+        for field, text in document.texts.items():
+            if not text:
+                continue
+            score = scorer(text, document.words[field], *args)
+            if score:
+                best = max(best, score)
+                label = self.fields[field]
+                if label not in reasons:
+                    reasons.append(label)
+        return best, reasons
+
+    @staticmethod
+    def _substring_score(text, _words, query) -> float:
+        if text.startswith(query):
+            return 2.0
+        if query in text:
+            return 1.5
+        return 0.0
+
+    @staticmethod
+    def _similarity_score(text, words, query_grams, min_similarity) -> float:
+        similarity = len(query_grams & (_substring_grams(text) | _word_grams(words))) / len(query_grams)
+        return similarity if similarity >= min_similarity else 0.0
+
+
+class TrigramSearch:
+    """
+    In-process fuzzy search over students, guardians and transportation
+
+    The indexes are built once in a background thread at startup and then
+    kept current from the ChangeBus, including changes other workstations
+    made when the change log is enabled.
+    Until the build finishes search() returns None so callers can fall back
+    to their SQL search.
+    """
+    _instance = None
+
+    # Table name: (model, {column: match reason}, column holding the student ID)
+    INDEXED_TABLES = {
+        'students_personal': (Student, {
+            'student_name': 'Name',
+            'cnic': 'CNIC',
+            'phone': 'Phone',
+            'student_contact_no': 'Phone',
+            'address': 'Address',
+        }, None),
+        'student_guardians': (StudentGuardian, {
+            'guardian_name': 'Name',
+            'guardian_relationship': 'Relationship',
+            'guardian_contact_number': 'Contact',
+        }, 'student_id'),
+        'transportation': (Transportation, {
+            'pickup_drop_responsible_name': 'Responsible Person',
+            'pickup_drop_contact_number': 'Contact Number',
+        }, 'student_id'),
+    }
+
+    # Rows read per round trip while building
+    BUILD_BATCH_SIZE = 2000
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TrigramSearch, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = Config()
+        self.db = DataDatabase()
+        self.logger = Logger()
+        self._lock = threading.RLock()
+        self._indexes = {}
+        self._pending = None
+        self._build_thread = None
+        self.ready = False
+        ChangeBus().subscribe(self._on_changes, tables=self.INDEXED_TABLES)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config.trigram_index_enabled)
+
+    def is_indexed(self, model_class) -> bool:
+        return getattr(model_class, '__tablename__', None) in self.INDEXED_TABLES
+
+    def build_in_background(self):
+        """Start building the indexes on a daemon thread (no-op if running or built)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self.ready or (self._build_thread and self._build_thread.is_alive()):
+                return
+            self._pending = []
+            self._build_thread = threading.Thread(target=self._build, name="TrigramIndexBuild", daemon=True)
+            self._build_thread.start()
+
+    def _build(self):
+        start = time.perf_counter()
+        indexes = {}
+        session = self.db.session_factory()
+        try:
+            for table_name, (model_class, fields, owner_field) in self.INDEXED_TABLES.items():
+                index = TrigramIndex(model_class, fields, owner_field)
+                columns = [getattr(model_class, index.key_field)]
+                columns.append(getattr(model_class, owner_field) if owner_field else columns[0])
+                columns.extend(getattr(model_class, field) for field in fields)
+
+                rows = session.query(*columns).execution_options(stream_results=True).yield_per(
+                    self.BUILD_BATCH_SIZE)
+                for row in rows:
+                    index.add(row[0], row[1] if owner_field else None, dict(zip(fields, row[2:])))
+                indexes[table_name] = index
+        except Exception as e:
+            self.logger.error(f"Error building trigram search index: {str(e)}")
+            with self._lock:
+                self._pending = None
+            return
+        finally:
+            session.close()
+
+        with self._lock:
+            # Replay writes committed while the tables were being read
+            self._indexes = indexes
+            for change in self._pending or []:
+                self._apply(*change)
+            self._pending = None
+            self.ready = True
+
+        sizes = ", ".join(f"{name}={len(index)}" for name, index in indexes.items())
+        self.logger.info(f"Trigram search index built in {time.perf_counter() - start:.2f}s ({sizes})")
+
+    def record_saved(self, record):
+        """Index a created or updated record (ignored for tables that are not indexed)"""
+        if self.is_indexed(type(record)):
+            self._submit('saved', type(record).__tablename__, record)
+
+    def record_deleted(self, model_class, record_id):
+        """Remove a deleted record, and for students every row that cascaded with it"""
+        if self.is_indexed(model_class):
+            self._submit('deleted', model_class.__tablename__, record_id)
+
+    def _on_changes(self, changes):
+        for change in changes:
+            model_class = self.INDEXED_TABLES[change.table][0]
+            if change.op == ChangeBus.DELETE:
+                self.record_deleted(model_class, change.pk)
+            elif change.record is not None:
+                self.record_saved(change.record)
+            else:
+                self._reload(model_class, change.pk)
+
+    def _reload(self, model_class, record_id):
+        """Re-read a row another workstation wrote"""
+        with self._lock:
+            if self._pending is None and not self.ready:
+                return
+        session = self.db.session_factory()
+        try:
+            record = session.query(model_class).get(record_id)
+        except Exception as e:
+            self.logger.warning(f"Could not reload {model_class.__tablename__} #{record_id} for search: {str(e)}")
+            return
+        finally:
+            session.close()
+        if record is None:
+            self.record_deleted(model_class, record_id)
+        else:
+            self.record_saved(record)
+
+    def _submit(self, operation, table_name, payload):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((operation, table_name, payload))
+            elif self.ready:
+                self._apply(operation, table_name, payload)
+
+    def _apply(self, operation, table_name, payload):
+        index = self._indexes.get(table_name)
+        if operation == 'saved':
+            index.add_record(payload)
+        else:
+            index.remove(payload)
+            if table_name == Student.__tablename__:
+                for other in self._indexes.values():
+                    if other.owner_field:
+                        other.remove_student(payload)
+
+    def search(self, model_class, search_term: str, limit: Optional[int] = None) -> Optional[List[TrigramHit]]:
+        """
+        Search one table's index
+
+        Args:
+            model_class: Model of the table to search
+            search_term: Text typed by the user
+            limit: Maximum number of hits
+
+        Returns:
+            Ranked hits, or None when the index is disabled, still building or
+            does not cover this table
+        """
+        if not self.enabled or not self.ready or not self.is_indexed(model_class):
+            return None
+        with self._lock:
+            return self._indexes[model_class.__tablename__].search(
+                search_term, self.config.fuzzy_min_similarity, limit)
@@ -43,7 +43,7 @@ class StudentActionHandler:
         # Emit data changed signal
         self.parent.data_changed.emit()
 
-    def edit_student(self):
+    def edit_student(self, student_id=None):
         """Show dialog to edit an existing student"""
         # Check permission first
         if self.parent.user_role and not self.parent.rbac.check_permission(self.parent.user_role, 'data', 'update'):
@@ -52,8 +52,8 @@ class StudentActionHandler:
                                 "You don't have permission to edit student records.")
             return
 
-        sender = self.parent.sender()
-        student_id = sender.property("student_id")
+        if student_id is None:
+            student_id = self.parent.sender().property("student_id")
 
         # Ensure student_id is an integer
         try:
@@ -87,10 +87,10 @@ class StudentActionHandler:
             # Emit data changed signal
             self.parent.data_changed.emit()
 
-    def view_student(self):
+    def view_student(self, student_id=None):
         """Show detailed view of a student"""
-        sender = self.parent.sender()
-        student_id = sender.property("student_id")
+        if student_id is None:
+            student_id = self.parent.sender().property("student_id")
 
         # Ensure student_id is an integer
         try:
@@ -110,7 +110,7 @@ class StudentActionHandler:
         dialog = StudentDetailsDialog(student_data, self.parent)
         dialog.exec_()
 
-    def delete_student(self):
+    def delete_student(self, student_id=None):
         """Delete a student after confirmation"""
         # Check permission first
         if self.parent.user_role and not self.parent.rbac.check_permission(self.parent.user_role, 'data', 'delete'):
@@ -119,8 +119,8 @@ class StudentActionHandler:
                                 "You don't have permission to delete student records.")
             return
 
-        sender = self.parent.sender()
-        student_id = sender.property("student_id")
+        if student_id is None:
+            student_id = self.parent.sender().property("student_id")
 
         self.parent.utils._log_activity(f"Confirming deletion of student with ID: {student_id}")
 
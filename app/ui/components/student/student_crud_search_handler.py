@@ -52,8 +52,12 @@ class StudentSearchHandler:
 
     def _search_students_table(self, search_term):
         """Specialized search for students table"""
-        # Get search results and match reasons for students
-        students, match_reasons = self.parent.student_service.advanced_search(search_term)
+        # Get search results and match reasons for students, from the in-memory
+        # index when it is ready and from the database otherwise
+        result = self.parent.student_service.fuzzy_search(search_term)
+        if result is None:
+            result = self.parent.student_service.advanced_search(search_term)
+        students, match_reasons = result
         self.parent.table_manager.populate_table(students, match_reasons, search_term)
         count = len(students)
         self.parent.status_label.setText(f"Found {count} matching students")
@@ -74,9 +78,13 @@ class StudentSearchHandler:
             return
 
         try:
-            # Try advanced search first
-            if hasattr(service, 'advanced_search'):
-                guardians, match_reasons = service.advanced_search(search_term)
+            # Prefer the in-memory index, then advanced search
+            result = service.fuzzy_search(search_term)
+            if result is None and hasattr(service, 'advanced_search'):
+                result = service.advanced_search(search_term)
+
+            if result is not None:
+                guardians, match_reasons = result
                 self.parent.table_manager.populate_related_table(guardians, match_reasons, search_term)
             else:
                 # Use specialized guardian search if available
@@ -513,6 +521,23 @@ class StudentSearchHandler:
 
         try:
             self.parent.logger.info(f"Searching for transportation records with term: '{search_term}'")
+
+            # Answer from the in-memory index when it is ready; it also covers student IDs
+            result = service.fuzzy_search(search_term)
+            if result is not None:
+                records, match_reasons = result
+                self.parent.table_manager.populate_related_table(records, match_reasons, search_term)
+                count = len(records)
+                self.parent.status_label.setText(f"Found {count} matching transportation records")
+
+                if count == 0:
+                    QMessageBox.information(
+                        self.parent,
+                        "No Results",
+                        f"No transportation records found matching '{search_term}'."
+                    )
+                return
+
             all_records = []  # To collect results from multiple search approaches
             match_sources = {}  # Track where each record was found
 
@@ -665,7 +690,7 @@ class StudentSearchHandler:
 
     def _handle_missing_service(self, table_name):
         """Handle case when service is not available"""
-        self.parent.students_table.setRowCount(0)
+        self.parent.table_model.clear()
         self.parent.status_label.setText(f"Search not available for {table_name}")
         QMessageBox.information(
             self.parent,
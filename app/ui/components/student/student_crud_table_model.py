@@ -0,0 +1,394 @@
+import bisect
+from typing import Callable, NamedTuple, Optional
+
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRect, QSize, pyqtSignal
+from PyQt5.QtGui import QColor
+
+
+class TableColumn(NamedTuple):
+    """A data column of the CRUD grid"""
+    header: str
+    value: Callable[[object], str]
+    highlight: bool = False             # Highlight when the cell contains the search term
+    reason: Optional[str] = None        # Match reason that explains a highlight in the tooltip
+    match_text: Optional[Callable[[object], str]] = None  # Text searched when it differs from value
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+def _date(value):
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value
+    return value.strftime("%Y-%m-%d")
+
+
+def _yes_no(value):
+    return "Yes" if value else "No"
+
+
+def _truncate(value, length=50):
+    text = _text(value)
+    return text[:length - 3] + "..." if len(text) > length else text
+
+
+TABLE_COLUMNS = {
+    "students": [
+        TableColumn("ID", lambda r: _text(r.student_id), highlight=True),
+        TableColumn("Name", lambda r: _text(r.student_name), highlight=True, reason="Name"),
+        TableColumn("Gender", lambda r: _text(r.gender)),
+        TableColumn("Age", lambda r: _text(r.age) if r.age else ""),
+        TableColumn("CNIC", lambda r: _text(r.cnic), highlight=True, reason="CNIC"),
+        TableColumn("Admission Date", lambda r: _date(r.admission_date)),
+        TableColumn("Phone", lambda r: _text(r.phone), highlight=True, reason="Phone"),
+    ],
+    "guardians": [
+        TableColumn("ID", lambda r: _text(r.student_guardian_id)),
+        TableColumn("Student ID", lambda r: _text(r.student_id)),
+        TableColumn("Name", lambda r: _text(r.guardian_name), highlight=True),
+        TableColumn("Relationship", lambda r: _text(r.guardian_relationship)),
+        TableColumn("Contact", lambda r: _text(r.guardian_contact_number), highlight=True),
+    ],
+    "medical_history": [
+        TableColumn("ID", lambda r: _text(r.medical_id)),
+        TableColumn("Student ID", lambda r: _text(r.student_id)),
+        TableColumn("Disability Name", lambda r: _text(r.name_of_disability), highlight=True),
+        TableColumn("Epilepsy", lambda r: _yes_no(r.epilepsy)),
+        TableColumn("Drug Addiction", lambda r: _yes_no(r.drug_addiction_smoking)),
+    ],
+    "education": [
+        TableColumn("ID", lambda r: _text(r.education_id)),
+        TableColumn("Student ID", lambda r: _text(r.student_id)),
+        TableColumn("Education Level", lambda r: _text(r.education_level), highlight=True),
+        TableColumn("Certificate", lambda r: _yes_no(r.certificate_attached)),
+    ],
+    "enrollments": [
+        TableColumn("ID", lambda r: _text(r.enrollment_id)),
+        TableColumn("Student ID", lambda r: _text(r.student_id)),
+        TableColumn("Course", lambda r: _text(getattr(r, 'course_name', f'Course #{r.course_id}')), highlight=True),
+        TableColumn("Enrollment Date", lambda r: _date(r.date_of_enrollment)),
+        TableColumn("Completed", lambda r: _yes_no(r.completion_status)),
+    ],
+    "hostel": [
+        TableColumn("ID", lambda r: _text(r.hostel_id)),
+        TableColumn("Student ID", lambda r: _text(r.student_id)),
+        TableColumn("Duration of Stay", lambda r: _text(r.duration_of_stay), highlight=True),
+        TableColumn("Requirements", lambda r: _truncate(r.special_requirements), highlight=True,
+                    match_text=lambda r: _text(r.special_requirements)),
+    ],
+    "transportation": [
+        TableColumn("ID", lambda r: _text(r.transport_id)),
+        TableColumn("Student ID", lambda r: _text(r.student_id)),
+        TableColumn("Responsible Person", lambda r: _text(r.pickup_drop_responsible_name), highlight=True),
+        TableColumn("Contact", lambda r: _text(r.pickup_drop_contact_number), highlight=True),
+    ],
+}
+
+# Column that takes the remaining width, per table
+STRETCH_COLUMNS = {"students": 1}
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Table model behind the student CRUD grid
+
+    Rows come either from a fixed list (search results) or from a page
+    source that is asked for the next page only when the view scrolls near
+    the end (canFetchMore/fetchMore), so large tables never load at once.
+    The last column holds the row's student ID for ActionButtonsDelegate.
+
+    When a checksum source is set, the model remembers a checksum per loaded
+    row so an auto-refresh can apply only the rows that changed (see
+    apply_changes) instead of reloading and repainting everything.
+    """
+
+    # Rows requested per fetchMore
+    PAGE_SIZE = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.table_id = "students"
+        self.columns = TABLE_COLUMNS["students"]
+        self._records = []
+        self._match_reasons = {}
+        self._search_term = ""
+        self._fetch_page = None
+        self._next_key = None
+        self._exhausted = True
+        self._checksum_source = None
+        self._checksums = {}
+        self.summary = None
+
+    def set_checksum_source(self, checksum_source):
+        """
+        Args:
+            checksum_source: Callable taking a list of primary keys and returning
+                             {primary key: checksum}, or None to stop tracking
+        """
+        self._checksum_source = checksum_source
+
+    def set_table(self, table_id):
+        """Switch to the columns of another table and clear the rows"""
+        self.beginResetModel()
+        self.table_id = table_id
+        self.columns = TABLE_COLUMNS.get(table_id, [])
+        self._reset_rows()
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._reset_rows()
+        self.endResetModel()
+
+    def set_records(self, records, match_reasons=None, search_term=""):
+        """Show a fixed list of records, e.g. search results"""
+        self.beginResetModel()
+        self._reset_rows()
+        self._records = list(records)
+        self._match_reasons = match_reasons or {}
+        self._search_term = (search_term or "").lower()
+        self._remember_checksums(self._records)
+        self.endResetModel()
+
+    def set_page_source(self, fetch_page):
+        """
+        Show records loaded lazily, page by page
+
+        Args:
+            fetch_page: Callable taking the key returned with the previous page
+                        (None for the first) and returning (records, next key or None)
+        """
+        self.beginResetModel()
+        self._reset_rows()
+        self._fetch_page = fetch_page
+        self._exhausted = False
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def _reset_rows(self):
+        self._records = []
+        self._match_reasons = {}
+        self._search_term = ""
+        self._fetch_page = None
+        self._next_key = None
+        self._exhausted = True
+        self._checksums = {}
+        self.summary = None
+
+    def _remember_checksums(self, records):
+        if self._checksum_source and records:
+            # On error the rows stay untracked and are re-read by the next refresh
+            self._checksums.update(self._checksum_source([self._primary_key(record) for record in records]) or {})
+
+    def is_paged(self):
+        return self._fetch_page is not None
+
+    def loaded_keys(self):
+        return [self._primary_key(record) for record in self._records]
+
+    def last_key(self):
+        return self._primary_key(self._records[-1]) if self._records else None
+
+    def checksum(self, key):
+        return self._checksums.get(key)
+
+    def resume_fetching(self):
+        """Allow fetchMore again after the last page, once rows were added past it"""
+        if self.is_paged() and self._exhausted:
+            self._next_key = self.last_key()
+            self._exhausted = False
+
+    def apply_changes(self, records, removed_keys, checksums=None):
+        """
+        Apply a diff to the loaded rows without resetting the model
+
+        Selection and scroll position survive because only the affected rows
+        are removed, replaced or inserted.
+
+        Args:
+            records: Changed or new records; new ones are inserted in primary
+                     key order when the model is paged, ignored otherwise
+            removed_keys: Primary keys of rows that no longer exist
+            checksums: Known checksums of the records (asked from the checksum
+                       source when omitted)
+        """
+        keys = self.loaded_keys()
+        removed_keys = set(removed_keys)
+        removed_rows = sorted((row for row, key in enumerate(keys) if key in removed_keys), reverse=True)
+        for row in removed_rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._checksums.pop(keys[row], None)
+            del self._records[row]
+            del keys[row]
+            self.endRemoveRows()
+
+        last_column = self.columnCount() - 1
+        for record in records:
+            key = self._primary_key(record)
+            row = bisect.bisect_left(keys, key) if self.is_paged() else (keys.index(key) if key in keys else -1)
+            if 0 <= row < len(keys) and keys[row] == key:
+                self._records[row] = record
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+            elif self.is_paged():
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._records.insert(row, record)
+                keys.insert(row, key)
+                self.endInsertRows()
+
+        if checksums is None:
+            self._remember_checksums(records)
+        else:
+            self._checksums.update(checksums)
+
+    def actions_column(self):
+        return len(self.columns)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns) + 1
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+
+        records, next_key = self._fetch_page(self._next_key)
+        self._next_key = next_key
+        self._exhausted = next_key is None
+
+        if records:
+            first = len(self._records)
+            self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+            self._records.extend(records)
+            self.endInsertRows()
+            self._remember_checksums(records)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal:
+            return None
+        if section < len(self.columns):
+            return self.columns[section].header
+        return "Actions"
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        record = self._records[index.row()]
+        if index.column() >= len(self.columns):
+            # Actions column: the delegate paints the buttons from the student ID
+            return record.student_id if role == Qt.UserRole else None
+
+        column = self.columns[index.column()]
+        if role == Qt.DisplayRole:
+            return column.value(record)
+        if role == Qt.BackgroundRole and self._matches(column, record):
+            return QColor(Qt.yellow)
+        if role == Qt.ToolTipRole:
+            return self._tooltip(index.column(), column, record)
+        return None
+
+    def _matches(self, column, record):
+        if not self._search_term or not column.highlight:
+            return False
+        text = (column.match_text or column.value)(record)
+        return self._search_term in text.lower()
+
+    def _tooltip(self, column_index, column, record):
+        reasons = self._match_reasons.get(self._primary_key(record), [])
+        if column_index == 0:
+            if self._matches(column, record):
+                return f"Match found in ID: {column.value(record)}"
+            if reasons:
+                return f"Matched on: {', '.join(reasons)}"
+        elif column.reason and column.reason in reasons and self._matches(column, record):
+            return f"Match found in {column.reason.lower()}: {column.value(record)}"
+        return None
+
+    @staticmethod
+    def _primary_key(record):
+        return getattr(record, type(record).__mapper__.primary_key[0].key)
+
+    def student_id_at(self, row):
+        return self._records[row].student_id
+
+    def find_student_row(self, student_id):
+        """
+        Find the first row of a student, fetching further pages if needed
+
+        Returns:
+            Row index, or -1 when the student is not in the table
+        """
+        row = 0
+        while True:
+            for row in range(row, len(self._records)):
+                if self._records[row].student_id == student_id:
+                    return row
+            row = len(self._records)
+            if not self.canFetchMore():
+                return -1
+            self.fetchMore()
+
+
+class ActionButtonsDelegate(QStyledItemDelegate):
+    """
+    Paints View/Edit/Delete buttons in the actions column
+
+    The buttons are drawn, not created as widgets, so a row costs nothing
+    until it is visible. A click on a button emits action_triggered with
+    the action name and the row's student ID.
+    """
+
+    action_triggered = pyqtSignal(str, int)
+
+    BUTTON_WIDTH = 60
+    MARGIN = 2
+
+    def __init__(self, actions, parent=None):
+        """
+        Args:
+            actions: Button labels in display order, e.g. ["View", "Edit", "Delete"]
+            parent: Owning view
+        """
+        super().__init__(parent)
+        self.actions = list(actions)
+
+    def _button_rects(self, rect):
+        if not self.actions:
+            return []
+        width = rect.width() // len(self.actions)
+        return [
+            (action, QRect(rect.left() + i * width + self.MARGIN, rect.top() + self.MARGIN,
+                           width - 2 * self.MARGIN, rect.height() - 2 * self.MARGIN))
+            for i, action in enumerate(self.actions)
+        ]
+
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        for action, rect in self._button_rects(option.rect):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = action
+            button.state = QStyle.State_Enabled | QStyle.State_Raised
+            style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index):
+        return QSize(self.BUTTON_WIDTH * len(self.actions), 28)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            for action, rect in self._button_rects(option.rect):
+                if rect.contains(event.pos()):
+                    student_id = index.data(Qt.UserRole)
+                    if student_id is not None:
+                        self.action_triggered.emit(action, int(student_id))
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -1,7 +1,9 @@
-from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-                            QPushButton, QTableWidget, QTableWidgetItem, 
+from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                            QPushButton, QTableView, QAbstractItemView,
                             QHeaderView, QComboBox)
 from PyQt5.QtGui import QFont
+from app.ui.components.student.student_crud_table_model import (RecordTableModel, ActionButtonsDelegate,
+                                                                STRETCH_COLUMNS)
 
 class StudentCrudUIBuilder:
     """Responsible for building and updating the UI elements of the StudentCrudWidget"""
@@ -84,17 +86,25 @@ class StudentCrudUIBuilder:
 
         main_layout.addLayout(search_layout)
 
-        # Students table
-        self.parent.students_table = QTableWidget()
-        self.parent.students_table.setColumnCount(8)
-        self.parent.students_table.setHorizontalHeaderLabels([
-            "ID", "Name", "Gender", "Age", "CNIC",
-            "Admission Date", "Phone", "Actions"
-        ])
-        self.parent.students_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.parent.students_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.parent.students_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.parent.students_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Students table: a view over a lazily filled model, with the row
+        # actions painted by a delegate
+        self.parent.table_model = RecordTableModel(self.parent)
+        self.parent.students_table = QTableView()
+        self.parent.students_table.setModel(self.parent.table_model)
+        self.parent.students_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.parent.students_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.parent.students_table.verticalHeader().setVisible(False)
+
+        # View for everyone; Edit and Delete only with the matching permission
+        actions = ["View"]
+        if self.parent.user_role and self.parent.rbac.check_permission(self.parent.user_role, 'data', 'update'):
+            actions.append("Edit")
+        if self.parent.user_role and self.parent.rbac.check_permission(self.parent.user_role, 'data', 'delete'):
+            actions.append("Delete")
+        self.parent.action_delegate = ActionButtonsDelegate(actions, self.parent.students_table)
+        self.parent.action_delegate.action_triggered.connect(self.parent.on_row_action)
+
+        self.configure_table_for_selection()
 
         main_layout.addWidget(self.parent.students_table)
 
@@ -135,51 +145,19 @@ class StudentCrudUIBuilder:
 
     def configure_table_for_selection(self):
         """Configure table columns based on selected table"""
-        # Clear existing data
-        self.parent.students_table.clearContents()
-        self.parent.students_table.setRowCount(0)
-
-        # Configure columns based on table selection
-        if self.parent.selected_table == "students":
-            self.parent.students_table.setColumnCount(8)
-            self.parent.students_table.setHorizontalHeaderLabels([
-                "ID", "Name", "Gender", "Age", "CNIC",
-                "Admission Date", "Phone", "Actions"
-            ])
-            self.parent.students_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        elif self.parent.selected_table == "guardians":
-            self.parent.students_table.setColumnCount(6)  # 5 data columns + Actions
-            self.parent.students_table.setHorizontalHeaderLabels([
-                "ID", "Student ID", "Name", "Relationship", "Contact", "Actions"
-            ])
-            self.parent.students_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        elif self.parent.selected_table == "medical_history":
-            self.parent.students_table.setColumnCount(6)  # 5 data columns + Actions
-            self.parent.students_table.setHorizontalHeaderLabels([
-                "ID", "Student ID", "Disability Name", "Epilepsy", "Drug Addiction", "Actions"
-            ])
-            self.parent.students_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        elif self.parent.selected_table == "education":
-            self.parent.students_table.setColumnCount(5)  # 4 data columns + Actions
-            self.parent.students_table.setHorizontalHeaderLabels([
-                "ID", "Student ID", "Education Level", "Certificate", "Actions"
-            ])
-            self.parent.students_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        elif self.parent.selected_table == "enrollments":
-            self.parent.students_table.setColumnCount(6)  # 5 data columns + Actions
-            self.parent.students_table.setHorizontalHeaderLabels([
-                "ID", "Student ID", "Course", "Enrollment Date", "Completed", "Actions"
-            ])
-            self.parent.students_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        elif self.parent.selected_table == "hostel":
-            self.parent.students_table.setColumnCount(5)  # 4 data columns + Actions
-            self.parent.students_table.setHorizontalHeaderLabels([
-                "ID", "Student ID", "Duration of Stay", "Requirements", "Actions"
-            ])
-            self.parent.students_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        elif self.parent.selected_table == "transportation":
-            self.parent.students_table.setColumnCount(5)  # 4 data columns + Actions
-            self.parent.students_table.setHorizontalHeaderLabels([
-                "ID", "Student ID", "Responsible Person", "Contact", "Actions"
-            ])
-            self.parent.students_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
\ No newline at end of file
+        table = self.parent.students_table
+        model = self.parent.table_model
+
+        # Switching tables clears existing data
+        previous_actions_column = model.actions_column()
+        model.set_table(self.parent.selected_table)
+        table.setItemDelegateForColumn(previous_actions_column, None)
+        table.setItemDelegateForColumn(model.actions_column(), self.parent.action_delegate)
+
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(STRETCH_COLUMNS.get(self.parent.selected_table, 2), QHeaderView.Stretch)
+
+    def fit_columns(self):
+        """Size the non-stretched columns to the rows loaded so far"""
+        self.parent.students_table.resizeColumnsToContents()
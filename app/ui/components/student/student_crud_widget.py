@@ -10,6 +10,9 @@ from app.utils.logger import Logger
 from app.controllers.rbac_controller import RBACController
 from app.config.config import Config
 from app.utils.timer_manager import TimerManager
+from app.utils.change_notifier import ChangeNotifier
+from app.services.change_bus import ChangeBus
+from app.models.student_models import Student
 from app.ui.components.student_details_dialog import StudentDetailsDialog
 from app.ui.components.student.student_crud_table_manager import StudentTableManager
 from app.ui.components.student.student_crud_ui_builder import StudentCrudUIBuilder
@@ -75,35 +78,62 @@ class StudentCrudWidget(QWidget):
         self.ui_builder.init_ui()
         self.table_manager.load_students()
 
-        # Connect to timer manager for auto-refresh
-        self.timer_manager.student_data_refresh_signal.connect(self.on_auto_refresh)
-
-    def on_auto_refresh(self):
-        """Handle auto-refresh from timer manager"""
+        # Run the auto-refresh as the scheduled job so failures back it off
+        self.timer_manager.attach('student_data', lambda: self.on_auto_refresh(raise_errors=True))
+
+        # Refresh shortly after committed changes to the shown table; the
+        # single-shot timer coalesces bursts such as bulk imports
+        self.change_refresh_timer = QTimer(self)
+        self.change_refresh_timer.setSingleShot(True)
+        self.change_refresh_timer.setInterval(300)
+        self.change_refresh_timer.timeout.connect(self.on_auto_refresh)
+        self.change_notifier = ChangeNotifier.instance()
+        self.change_notifier.data_changed.connect(self.on_data_changed)
+
+    def on_data_changed(self, changes):
+        """Schedule an incremental refresh when a change touches the shown table"""
+        service = self.table_manager.current_service()
+        if service is None:
+            return
+        table_name = service.model_class.__tablename__
+        for change in changes:
+            # Deleting a student also removes its rows from every related table
+            if change.table == table_name or (change.table == Student.__tablename__
+                                              and change.op == ChangeBus.DELETE):
+                self.change_refresh_timer.start()
+                return
+
+    def on_auto_refresh(self, raise_errors=False):
+        """
+        Apply the changes to the shown table
+
+        Args:
+            raise_errors: Raise when the table could not be checked, so the
+                          scheduled job backs off; slots must leave it off, as
+                          an exception escaping a Qt slot aborts the app
+        """
         # Only refresh if widget is visible
         if self.isVisible():
             # Get current selection before refresh
             current_index = self.table_selector.currentIndex()
             current_table_id = self.table_selector.itemData(current_index)
 
-            # Log the refresh action with the current selected table
-            self.utils._log_activity(f"Auto-refreshing {current_table_id} data via timer manager")
-
             # Temporarily block signals from the table selector
             old_block_state = self.table_selector.blockSignals(True)
 
-            # Ensure selected_table matches current UI selection
-            self.selected_table = current_table_id
-
-            # Refresh the data for the current table
-            if self.selected_table == "students":
-                self.table_manager.load_students()
-            else:
-                self.table_manager.load_related_table_data()
-
-            # Restore the UI selection and unblock signals
-            self.table_selector.setCurrentIndex(current_index)
-            self.table_selector.blockSignals(old_block_state)
+            try:
+                # Ensure selected_table matches current UI selection
+                self.selected_table = current_table_id
+
+                # Apply only the rows changed since the last load; the search,
+                # selection and scroll position are kept
+                changed = self.table_manager.refresh_changes(raise_errors=raise_errors)
+                if changed:
+                    self.utils._log_activity(f"Auto-refresh applied {changed} changed {current_table_id} rows")
+            finally:
+                # Restore the UI selection and unblock signals
+                self.table_selector.setCurrentIndex(current_index)
+                self.table_selector.blockSignals(old_block_state)
         else:
             self.utils._log_activity("Auto-refresh skipped - widget not visible")
 
@@ -178,17 +208,26 @@ class StudentCrudWidget(QWidget):
         """Highlight a specific student in the table by ID"""
         self.table_manager.highlight_student(student_id)
 
-    def edit_student(self):
+    def edit_student(self, student_id=None):
         """Show dialog to edit an existing student"""
-        self.action_handler.edit_student()
+        self.action_handler.edit_student(student_id)
 
-    def view_student(self):
+    def view_student(self, student_id=None):
         """Show detailed view of a student"""
-        self.action_handler.view_student()
+        self.action_handler.view_student(student_id)
 
-    def delete_student(self):
+    def delete_student(self, student_id=None):
         """Delete a student after confirmation"""
-        self.action_handler.delete_student()
+        self.action_handler.delete_student(student_id)
+
+    def on_row_action(self, action, student_id):
+        """Handle a View/Edit/Delete button clicked in the table"""
+        if action == "View":
+            self.view_student(student_id)
+        elif action == "Edit":
+            self.edit_student(student_id)
+        elif action == "Delete":
+            self.delete_student(student_id)
 
     def show_search_info(self):
         """Show information about search capabilities"""
@@ -234,7 +273,9 @@ class StudentCrudWidget(QWidget):
         try:
             # Disconnect from timer manager
             self.timer_manager.datetime_update_signal.disconnect(self.update_time_display)
-            self.timer_manager.student_data_refresh_signal.disconnect(self.on_auto_refresh)
+            self.timer_manager.detach('student_data')
+            self.change_notifier.data_changed.disconnect(self.on_data_changed)
+            self.change_refresh_timer.stop()
 
             # Stop local timer if it exists
             if self.visible_refresh_timer and self.visible_refresh_timer.isActive():
@@ -6,13 +6,8 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
 from PyQt5.QtCore import Qt, QDate
 from PyQt5.QtGui import QFont, QIntValidator
 from app.services.student_service import StudentService
-from app.services.medical_service import MedicalService
-from app.services.education_service import EducationService
-from app.services.guardian_service import GuardianService
 from app.services.course_service import CourseService
-from app.services.enrollment_service import EnrollmentService
-from app.services.hostel_service import HostelService
-from app.services.transportation_service import TransportationService
+from app.services.registration_service import RegistrationService
 from app.ui.components.student_form import StudentForm
 from app.utils.logger import Logger
 import datetime
@@ -25,13 +20,8 @@ class StudentEditDialog(QDialog):
         super().__init__(parent)
         self.student_data = student_data
         self.student_service = StudentService()
-        self.medical_service = MedicalService()
-        self.education_service = EducationService()
-        self.guardian_service = GuardianService()
         self.course_service = CourseService()
-        self.enrollment_service = EnrollmentService()
-        self.hostel_service = HostelService()
-        self.transportation_service = TransportationService()
+        self.registration_service = RegistrationService()
         self.logger = Logger()
 
         self.setWindowTitle(f"Edit Student: {student_data.get('student_name', 'Unknown')}")
@@ -353,202 +343,67 @@ class StudentEditDialog(QDialog):
         layout.addWidget(form_group)
 
     def save_all_changes(self):
-        """Save all changes to the database"""
+        """Save the fields changed since the dialog was opened in one transaction"""
         try:
-            # Get student ID
             student_id = self.student_data['student_id']
             self.logger.info(f"Saving changes for student ID: {student_id}")
 
-            # 1. Save personal information
-            personal_data = self.personal_form.get_form_data()
-            success, result = self.student_service.update(student_id, personal_data)
-            if not success:
-                QMessageBox.critical(self, "Error", f"Failed to update personal information: {result}")
-                return
+            form_data = {'personal': self.personal_form.get_form_data()}
 
-            # 2. Save education information if form was initialized
             if hasattr(self, 'education_level_input'):
-                education_data = {
+                form_data['education'] = {
                     'education_level': self.education_level_input.text(),
-                    'certificate_attached': self.certificate_check.isChecked(),
-                    'student_id': student_id
+                    'certificate_attached': self.certificate_check.isChecked()
+                }
+
+            # Only save enrollment if a course is selected
+            if hasattr(self, 'course_combo') and self.course_combo.currentData():
+                form_data['enrollments'] = {
+                    'course_id': self.course_combo.currentData(),
+                    'date_of_enrollment': self.enrollment_date_edit.date().toString('yyyy-MM-dd'),
+                    'completion_status': self.completion_check.isChecked()
                 }
 
-                if 'education_history' in self.student_data and self.student_data['education_history']:
-                    education_id = self.student_data['education_history'][0].get('education_id')
-                    if education_id:
-                        # Update existing record
-                        success, result = self.education_service.update(education_id, education_data)
-                    else:
-                        # Create new record if ID is missing
-                        success, result = self.education_service.create_education_record(education_data)
-                else:
-                    # Create new record if no education history
-                    success, result = self.education_service.create_education_record(education_data)
-
-                if not success:
-                    QMessageBox.warning(self, "Warning", f"Education information update failed: {result}")
-
-            # 3. Save enrollment information if form was initialized
-            if hasattr(self, 'course_combo'):
-                course_id = self.course_combo.currentData()
-                if course_id:  # Only save if a course is selected
-                    enrollment_data = {
-                        'course_id': course_id,
-                        'date_of_enrollment': self.enrollment_date_edit.date().toString('yyyy-MM-dd'),
-                        'completion_status': self.completion_check.isChecked(),
-                        'student_id': student_id
-                    }
-
-                    if 'enrollments' in self.student_data and self.student_data['enrollments']:
-                        enrollment_id = self.student_data['enrollments'][0].get('enrollment_id')
-                        if enrollment_id:
-                            # Update existing record
-                            success, result = self.enrollment_service.update(enrollment_id, enrollment_data)
-                        else:
-                            # Create new record if ID is missing
-                            success, result = self.enrollment_service.create_enrollment(enrollment_data)
-                    else:
-                        # Create new record if no enrollments
-                        success, result = self.enrollment_service.create_enrollment(enrollment_data)
-
-                    if not success:
-                        QMessageBox.warning(self, "Warning", f"Enrollment information update failed: {result}")
-
-            # 4. Save medical information if form was initialized
             if hasattr(self, 'disability_input'):
-                medical_data = {
+                form_data['medical'] = {
                     'name_of_disability': self.disability_input.text(),
                     'brief_medical_history': self.medical_history_input.toPlainText(),
                     'regular_medication': self.medication_input.toPlainText(),
                     'epilepsy': self.epilepsy_check.isChecked(),
                     'communicable_disease': self.disease_input.toPlainText(),
                     'drug_addiction_smoking': self.addiction_check.isChecked(),
-                    'assistive_device_used': self.device_input.text(),
-                    'student_id': student_id
+                    'assistive_device_used': self.device_input.text()
+                }
+
+            # Only save guardian if a name is provided
+            if hasattr(self, 'guardian_name_input') and self.guardian_name_input.text().strip():
+                form_data['guardians'] = {
+                    'guardian_name': self.guardian_name_input.text().strip(),
+                    'guardian_relationship': self.guardian_relationship_input.text(),
+                    'guardian_contact_number': self.guardian_contact_input.text()
                 }
 
-                if 'medical_history' in self.student_data and self.student_data['medical_history']:
-                    medical_id = self.student_data['medical_history'][0].get('medical_id')
-                    if medical_id:
-                        # Update existing record
-                        success, result = self.medical_service.update(medical_id, medical_data)
-                    else:
-                        # Create new record if ID is missing
-                        success, result = self.medical_service.create_medical_record(medical_data)
-                else:
-                    # Create new record if no medical history
-                    success, result = self.medical_service.create_medical_record(medical_data)
-
-                if not success:
-                    QMessageBox.warning(self, "Warning", f"Medical information update failed: {result}")
-
-            # For guardian information (section #5 in save_all_changes method)
-            if hasattr(self, 'guardian_name_input'):
-                guardian_name = self.guardian_name_input.text().strip()
-                if guardian_name:  # Only save if name is provided
-                    guardian_data = {
-                        'guardian_name': guardian_name,
-                        'guardian_relationship': self.guardian_relationship_input.text(),
-                        'guardian_contact_number': self.guardian_contact_input.text(),
-                        'student_id': student_id
-                    }
-
-                    self.logger.info(f"Processing guardian data for student {student_id}: {guardian_data}")
-
-                    try:
-                        # Get existing guardians for this student
-                        existing_guardians = self.guardian_service.get_by_student(student_id)
-
-                        # If we have an existing guardian, update it
-                        if existing_guardians and isinstance(existing_guardians, list) and len(existing_guardians) > 0:
-                            guardian = existing_guardians[0]  # Take the first guardian
-                            guardian_id = guardian.student_guardian_id  # Use the correct field name
-                            self.logger.info(f"Updating guardian ID {guardian_id}")
-                            success, result = self.guardian_service.update(guardian_id, guardian_data)
-                            if not success:
-                                QMessageBox.warning(self, "Warning", f"Guardian information update failed: {result}")
-                        # If it's a single object (not a list)
-                        elif existing_guardians and not isinstance(existing_guardians, list):
-                            guardian_id = existing_guardians.student_guardian_id  # Use the correct field name
-                            self.logger.info(f"Updating guardian ID {guardian_id}")
-                            success, result = self.guardian_service.update(guardian_id, guardian_data)
-                            if not success:
-                                QMessageBox.warning(self, "Warning", f"Guardian information update failed: {result}")
-                        else:
-                            # Create new guardian record if none exists
-                            self.logger.info(f"Creating new guardian for student {student_id}")
-                            success, result = self.guardian_service.create_guardian(guardian_data)
-                            if not success:
-                                QMessageBox.warning(self, "Warning", f"Guardian information creation failed: {result}")
-                    except Exception as e:
-                        self.logger.error(f"Error handling guardian data: {str(e)}")
-                        QMessageBox.warning(self, "Warning", f"Guardian processing error: {str(e)}")
-
-            # 6. Save hostel information if form was initialized
             if hasattr(self, 'duration_input'):
-                hostel_data = {
+                form_data['hostel'] = {
                     'duration_of_stay': self.duration_input.text(),
-                    'special_requirements': self.requirements_input.toPlainText(),
-                    'student_id': student_id
+                    'special_requirements': self.requirements_input.toPlainText()
                 }
 
-                if 'hostel_info' in self.student_data and self.student_data['hostel_info']:
-                    hostel_id = self.student_data['hostel_info'][0].get('hostel_id')
-                    if hostel_id:
-                        # Update existing record
-                        success, result = self.hostel_service.update(hostel_id, hostel_data)
-                    else:
-                        # Create new record if ID is missing
-                        success, result = self.hostel_service.create_hostel_record(hostel_data)
-                else:
-                    # Create new record if no hostel info
-                    success, result = self.hostel_service.create_hostel_record(hostel_data)
-
-                if not success:
-                    QMessageBox.warning(self, "Warning", f"Hostel information update failed: {result}")
-
-            # For transportation information (section #7 in save_all_changes method)
             if hasattr(self, 'responsible_name_input'):
-                transport_data = {
+                form_data['transportation'] = {
                     'pickup_drop_responsible_name': self.responsible_name_input.text(),
-                    'pickup_drop_contact_number': self.transport_contact_input.text(),
-                    'student_id': student_id
+                    'pickup_drop_contact_number': self.transport_contact_input.text()
                 }
 
-                self.logger.info(f"Processing transportation data for student {student_id}: {transport_data}")
-
-                try:
-                    existing_transport = self.transportation_service.get_by_student(student_id)
-
-                    # If we have existing transportation data, update it
-                    if existing_transport and isinstance(existing_transport, list) and len(existing_transport) > 0:
-                        transport = existing_transport[0]  # Take the first record
-                        transport_id = transport.transport_id  # Use the correct field name
-                        self.logger.info(f"Updating transportation ID {transport_id}")
-                        success, result = self.transportation_service.update(transport_id, transport_data)
-                        if not success:
-                            QMessageBox.warning(self, "Warning", f"Transportation information update failed: {result}")
-                    # If it's a single object (not a list)
-                    elif existing_transport and not isinstance(existing_transport, list):
-                        transport_id = existing_transport.transport_id  # Use the correct field name
-                        self.logger.info(f"Updating transportation ID {transport_id}")
-                        success, result = self.transportation_service.update(transport_id, transport_data)
-                        if not success:
-                            QMessageBox.warning(self, "Warning", f"Transportation information update failed: {result}")
-                    else:
-                        # Create new transportation record if none exists
-                        self.logger.info(f"Creating new transportation for student {student_id}")
-                        success, result = self.transportation_service.create_transport_record(transport_data)
-                        if not success:
-                            QMessageBox.warning(self, "Warning",
-                                                f"Transportation information creation failed: {result}")
-                except Exception as e:
-                    self.logger.error(f"Error handling transportation data: {str(e)}")
-                    QMessageBox.warning(self, "Warning", f"Transportation processing error: {str(e)}")
+            success, result = self.registration_service.save_changes(self.student_data, form_data)
+            if not success:
+                QMessageBox.critical(self, "Error", f"Failed to save student information: {result}")
+                return
 
-            # Show success message and close dialog
-            QMessageBox.information(self, "Success", "All student information updated successfully!")
+            if result:
+                QMessageBox.information(self, "Success", "All student information updated successfully!")
+            else:
+                QMessageBox.information(self, "No Changes", "No changes to save.")
             self.accept()
 
         except Exception as e:
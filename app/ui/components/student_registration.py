@@ -13,6 +13,7 @@ from app.services.course_service import CourseService
 from app.services.enrollment_service import EnrollmentService
 from app.services.hostel_service import HostelService
 from app.services.transportation_service import TransportationService
+from app.services.registration_service import RegistrationService
 from app.utils.logger import Logger
 from PyQt5.QtWidgets import QPushButton, QHBoxLayout
 from PyQt5.QtPrintSupport import QPrinter, QPrintPreviewDialog
@@ -48,6 +49,7 @@ class StudentRegistrationDialog(QDialog):
         self.enrollment_service = EnrollmentService()
         self.hostel_service = HostelService()
         self.transportation_service = TransportationService()
+        self.registration_service = RegistrationService()
         self.logger = Logger()
 
         # Get current date/time and user
@@ -839,59 +841,29 @@ class StudentRegistrationDialog(QDialog):
             self.status_label.setText("Status: Saving data to database... Please wait.")
             QApplication.processEvents()  # Allow UI to update
 
-            # Step 1: Create the student record
-            success, result = self.student_service.create_student(self.form_data['personal'])
+            # Save the student and every related record in one transaction;
+            # only the first guardian, education and enrollment entry is kept
+            registration = {
+                'personal': self.form_data['personal'],
+                'guardians': self.form_data['guardians'][:1],
+                'medical': self.form_data['medical'] if self.data_collected['medical'] else None,
+                'education': self.form_data['education'][:1],
+                'enrollments': self.form_data['enrollments'][:1],
+                'hostel': self.form_data['hostel'] if self.data_collected['hostel'] else None,
+                'transportation': (self.form_data['transportation']
+                                   if self.data_collected['transportation'] else None),
+            }
+            success, result = self.registration_service.register(registration)
             if not success:
-                QMessageBox.critical(self, "Error", f"Failed to create student record: {result}")
+                QMessageBox.critical(self, "Error", f"Failed to register student: {result}")
                 return
 
             # Get the new student ID
-            student_id = result.student_id
+            student_id = result['student_id']
             self.current_student_id = student_id
 
-            # Step 2: Add guardian if data exists
-            if self.form_data['guardians']:
-                guardian_data = self.form_data['guardians'][0]
-                guardian_data['student_id'] = student_id
-                self.guardian_service.create_guardian(guardian_data)
-
-            # Step 3: Add medical record if data exists
-            if self.data_collected['medical']:
-                medical_data = self.form_data['medical']
-                medical_data['student_id'] = student_id
-                self.medical_service.create_medical_record(medical_data)
-
-            # Step 4: Add education record if data exists
-            if self.form_data['education']:
-                education_data = self.form_data['education'][0]
-                education_data['student_id'] = student_id
-                self.education_service.create_education_record(education_data)
-
-            # Step 5: Add enrollment if data exists
-            if self.form_data['enrollments']:
-                enrollment_data = self.form_data['enrollments'][0]
-                enrollment_data['student_id'] = student_id
-                # Remove course_name if present as it's not a database field
-                if 'course_name' in enrollment_data:
-                    del enrollment_data['course_name']
-                self.enrollment_service.create_enrollment(enrollment_data)
-
-            # Step 6: Add hostel information if data exists
-            if self.data_collected['hostel']:
-                hostel_data = self.form_data['hostel']
-                hostel_data['student_id'] = student_id
-                self.hostel_service.create_hostel_record(hostel_data)
-
-            # Step 7: Add transportation information if data exists
-            if self.data_collected['transportation']:
-                transport_data = self.form_data['transportation']
-                transport_data['student_id'] = student_id
-                self.transportation_service.create_transport_record(transport_data)
-
-            # Final step: Fetch complete record for the final summary
-            student_data = self.student_service.get_student_with_details(student_id)
-            if student_data:
-                self.generate_final_summary(student_data)
+            # The registration returns the complete record for the final summary
+            self.generate_final_summary(result)
 
             # Show success message
             QMessageBox.information(
@@ -1,15 +1,19 @@
 import datetime
+import time
 import traceback
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QGridLayout, QFrame, QSizePolicy,
                              QMessageBox, QSpacerItem, QGraphicsDropShadowEffect, QApplication, QGraphicsView)
 from PyQt5.QtCore import Qt, QDateTime, QTimeZone, pyqtSignal, QTimer, QSize, QPropertyAnimation, QEasingCurve, QRect, \
-    QMargins, pyqtProperty
+    QMargins, pyqtProperty, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush, QLinearGradient, QGradient, QIcon
 from PyQt5.QtChart import QChart, QChartView, QPieSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis, QPieSlice
 from app.utils.logger import Logger
 from app.database.db_connection import DataDatabase
+from app.services.dashboard_stats import DashboardStats
+from app.utils.change_notifier import ChangeNotifier
+from app.utils.timer_manager import TimerManager
 
 try:
     from app.models.student_models import Student, Course, Enrollment, HostelManagement
@@ -18,7 +22,7 @@ except ImportError as e:
     print(f"Failed to import student models: {str(e)}")
     MODELS_AVAILABLE = False
 
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, case, extract
 
 
 class NumberDisplayWidget(QFrame):
@@ -63,20 +67,66 @@ class NumberDisplayWidget(QFrame):
 
         layout.addLayout(header_layout)
 
+        self.color = "#1976D2"
+        self.loading = False
+        self.has_value = False
+
         self.value_label = QLabel(value)
-        self.value_label.setStyleSheet("color: #1976D2; font-size: 36px; font-weight: 500;")
+        self.value_label.setStyleSheet(f"color: {self.color}; font-size: 36px; font-weight: 500;")
         self.value_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
 
         layout.addWidget(self.value_label)
         layout.addStretch()
 
     def set_value(self, value):
+        self.has_value = True
         self.value_label.setText(str(value))
 
     def set_color(self, color):
+        self.color = color
+        self._update_style()
+
+    def set_loading(self, loading):
+        """Grey out the value while a refresh is in flight"""
+        self.loading = loading
+        if loading and not self.has_value:
+            self.value_label.setText("...")
+        self.setToolTip("Loading..." if loading else "")
+        self._update_style()
+
+    def _update_style(self):
+        color = "#BDBDBD" if self.loading else self.color
         self.value_label.setStyleSheet(f"color: {color}; font-size: 36px; font-weight: 500;")
 
 
+class AnalyticsLoaderSignals(QObject):
+    finished = pyqtSignal(int, dict)
+    failed = pyqtSignal(int, str)
+
+
+class AnalyticsLoader(QRunnable):
+    """Fetches dashboard analytics on a thread-pool thread using its own session"""
+
+    def __init__(self, request_id, fetch):
+        super().__init__()
+        self.request_id = request_id
+        self.fetch = fetch
+        self.signals = AnalyticsLoaderSignals()
+
+    def run(self):
+        session = None
+        try:
+            # Scoped sessions are per thread, but pool threads are reused, so
+            # take a private session and always close it
+            session = DataDatabase().session_factory()
+            self.signals.finished.emit(self.request_id, self.fetch(session))
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+        finally:
+            if session is not None:
+                session.close()
+
+
 class DashboardWidget(QWidget):
 
     tab_switch_requested = pyqtSignal(int)
@@ -94,18 +144,30 @@ class DashboardWidget(QWidget):
 
         self._opacity = 1.0
 
-        self.db_session = None
-        try:
-            self.db = DataDatabase()
-            self.db_session = self.db.get_session()
-            self.logger.info("Dashboard database connection established successfully")
-        except Exception as e:
-            self.logger.error(f"Failed to initialize database connection for dashboard: {str(e)}")
+        # Analytics are fetched off the GUI thread; only the newest request's
+        # results are shown
+        self.thread_pool = QThreadPool.globalInstance()
+        self.stats = DashboardStats()
+        self._load_request_id = 0
+        self._loaders = {}
+        # Request id: start time of loads started by the scheduled refresh job
+        self._scheduled_loads = {}
+        # Whether any load has succeeded; until then a failure paints zeros
+        self._has_data = False
 
         self.datetime_timer = QTimer(self)
         self.datetime_timer.timeout.connect(self.update_datetime)
         self.datetime_timer.start(1000)
 
+        # Reload after writes to the counted tables, at most once per burst
+        self.tracked_tables = {model.__tablename__ for model in DashboardStats.TRACKED_MODELS}
+        self.change_reload_timer = QTimer(self)
+        self.change_reload_timer.setSingleShot(True)
+        self.change_reload_timer.setInterval(1000)
+        self.change_reload_timer.timeout.connect(self.load_data)
+        self.change_notifier = ChangeNotifier.instance()
+        self.change_notifier.data_changed.connect(self.on_data_changed)
+
         self.init_ui()
         self.update_datetime()
         self.load_data()
@@ -423,15 +485,72 @@ class DashboardWidget(QWidget):
         self.session_info.setText(f"IP: {ip_address} | Logged In: {login_time}")
 
     def load_data(self):
-        self.logger.info("Starting dashboard data load...")
-        stats = None
+        """Start fetching analytics on a worker thread; results arrive in on_analytics_loaded"""
+        self._load_request_id += 1
+        request_id = self._load_request_id
+        self.logger.info(f"Starting dashboard data load #{request_id}...")
+
+        self.set_loading(True)
+
+        loader = AnalyticsLoader(request_id, self.get_analytics_data)
+        loader.signals.finished.connect(self.on_analytics_loaded)
+        loader.signals.failed.connect(self.on_analytics_failed)
+        self._loaders[request_id] = loader
+        self.thread_pool.start(loader)
+
+    def refresh(self, scheduled=False):
+        """
+        Entry point for MainWindow's timer and tab-switch refreshes
+
+        Args:
+            scheduled: Started by the TimerManager 'dashboard' job, which is
+                       told how the load went so it can back off on failures
+        """
+        self.load_data()
+        if scheduled:
+            self._scheduled_loads[self._load_request_id] = time.perf_counter()
+
+    def _report_scheduled_load(self, request_id, success, error=None):
+        started = self._scheduled_loads.pop(request_id, None)
+        if started is not None:
+            TimerManager.instance().job_finished('dashboard', success,
+                                                 (time.perf_counter() - started) * 1000, error)
+
+    def set_loading(self, loading):
+        for widget in (self.total_students_widget, self.active_courses_widget,
+                       self.new_students_widget, self.hostel_students_widget):
+            widget.set_loading(loading)
+        if loading:
+            self.last_update_label.setText("Loading...")
+
+    def on_analytics_loaded(self, request_id, stats):
+        self._loaders.pop(request_id, None)
+        self._report_scheduled_load(request_id, True)
+        if request_id != self._load_request_id:
+            self.logger.debug(f"Dropping stale dashboard data from load #{request_id}")
+            return
+
+        self._has_data = True
+        self.set_loading(False)
+        self.apply_analytics(stats)
+
+    def on_analytics_failed(self, request_id, error):
+        self._loaders.pop(request_id, None)
+        self._report_scheduled_load(request_id, False, error)
+        if request_id != self._load_request_id:
+            return
+
+        self.set_loading(False)
+        self.logger.error(f"Error loading dashboard data: {error}")
+        if not self._has_data:
+            # First paint: show empty figures rather than loading placeholders;
+            # later failures keep the last figures on screen
+            self.apply_analytics(self.get_empty_analytics_structure())
+        self.last_update_label.setText(f"Update failed: {QDateTime.currentDateTime().toString('hh:mm:ss AP')}")
+
+    def apply_analytics(self, stats):
+        """Show fetched analytics in the metric widgets and charts (GUI thread only)"""
         try:
-            if not self.first_load and self.db_session:
-                 self.db_session.expire_all()
-                 self.logger.info("Database session expired for refresh.")
-
-            stats = self.get_analytics_data()
-
             if not stats:
                 raise ValueError("Failed to retrieve analytics data.")
 
@@ -568,11 +687,26 @@ class DashboardWidget(QWidget):
         self.logger.debug(f"should_animate check: first_load={self.first_load}, animation_played={self.animation_played} -> Result: {should}")
         return should
 
-    def get_analytics_data(self):
+    def get_analytics_data(self, session):
+        """
+        Fetch the dashboard figures in three round trips
+
+        Counts are computed with conditional SUM(CASE ...) aggregates: one
+        query over students, one GROUP BY month for admissions, and one for
+        courses, enrollments and hostel via scalar subqueries. Runs on a
+        worker thread, so it must not touch any widget.
+
+        Args:
+            session: Database session owned by the calling thread
+
+        Raises:
+            Exception: Query errors are re-raised so AnalyticsLoader reports
+                       the load as failed
+        """
         self.logger.info("Fetching analytics data from database...")
         analytics = self.get_empty_analytics_structure()
 
-        if not self.db_session:
+        if not session:
             self.logger.warning("Database session not available for analytics.")
             return analytics
 
@@ -581,101 +715,29 @@ class DashboardWidget(QWidget):
             return analytics
 
         try:
-            analytics['total_students'] = self.db_session.query(func.count(Student.student_id)).scalar() or 0
-
-            if hasattr(Student, 'gender'):
-                analytics['male_count'] = self.db_session.query(func.count(Student.student_id)).filter(Student.gender.ilike('M%')).scalar() or 0
-                analytics['female_count'] = self.db_session.query(func.count(Student.student_id)).filter(Student.gender.ilike('F%')).scalar() or 0
-                other_count = analytics['total_students'] - analytics['male_count'] - analytics['female_count']
-                if other_count > 0:
-                     self.logger.warning(f"Found {other_count} students with gender other than M/F.")
-            else:
-                self.logger.warning("Student model has no 'gender' attribute. Cannot calculate gender breakdown.")
-
-
-            if hasattr(Course, 'is_active'):
-                 analytics['active_courses'] = self.db_session.query(func.count(Course.course_id)).filter(Course.is_active == True).scalar() or 0
-            else:
-                 analytics['active_courses'] = self.db_session.query(func.count(Course.course_id)).scalar() or 0
-                 self.logger.warning("Course model has no 'is_active' attribute. Counting all courses.")
-
-
-            if hasattr(Enrollment, 'completion_status'):
-                try:
-                    analytics['active_enrollments'] = self.db_session.query(func.count(Enrollment.enrollment_id)).filter(Enrollment.completion_status == False).scalar() or 0
-                    analytics['completed_enrollments'] = self.db_session.query(func.count(Enrollment.enrollment_id)).filter(Enrollment.completion_status == True).scalar() or 0
-                except Exception:
-                    try:
-                        analytics['active_enrollments'] = self.db_session.query(func.count(Enrollment.enrollment_id)).filter(Enrollment.completion_status == 0).scalar() or 0
-                        analytics['completed_enrollments'] = self.db_session.query(func.count(Enrollment.enrollment_id)).filter(Enrollment.completion_status == 1).scalar() or 0
-                    except Exception as e:
-                         self.logger.error(f"Could not determine enrollment status (tried bool and int): {e}")
-            else:
-                 self.logger.warning("Enrollment model has no 'completion_status' attribute.")
-
-
-            thirty_days_ago = datetime.datetime.utcnow() - datetime.timedelta(days=30)
-            date_field_reg = None
-            if hasattr(Student, 'admission_date'): date_field_reg = Student.admission_date
-            elif hasattr(Student, 'date_of_registration'): date_field_reg = Student.date_of_registration
-            elif hasattr(Student, 'created_at'): date_field_reg = Student.created_at
-
-            if date_field_reg:
-                try:
-                    analytics['new_registrations'] = self.db_session.query(func.count(Student.student_id)).filter(
-                        date_field_reg >= thirty_days_ago).scalar() or 0
-                except Exception as e:
-                    self.logger.error(f"Error querying new registrations using {date_field_reg.key}: {e}")
-            else:
-                self.logger.warning("No suitable date field found for new registrations (tried admission_date, date_of_registration, created_at).")
-
-
-            if hasattr(HostelManagement, 'active_status'):
-                try:
-                    analytics['hostel_students'] = self.db_session.query(func.count(HostelManagement.hostel_id)).filter(HostelManagement.active_status == True).scalar() or 0
-                except Exception as e:
-                     self.logger.error(f"Error querying active hostel students: {e}")
-                     if hasattr(HostelManagement, 'hostel_id'):
-                         analytics['hostel_students'] = self.db_session.query(func.count(HostelManagement.hostel_id)).scalar() or 0
-            elif hasattr(HostelManagement, 'hostel_id'):
-                 analytics['hostel_students'] = self.db_session.query(func.count(HostelManagement.hostel_id)).scalar() or 0
-                 self.logger.warning("HostelManagement has no 'active_status'. Counting all records.")
-            else:
-                 self.logger.warning("HostelManagement model or required fields not found.")
-
-
-            date_field_adm = date_field_reg
-            if date_field_adm:
-                monthly_data = []
-                current_date = datetime.datetime.utcnow()
-                for i in range(5, -1, -1):
-                    target_month_date = current_date - datetime.timedelta(days=30 * i)
-                    month_start = datetime.datetime(target_month_date.year, target_month_date.month, 1)
-
-                    next_month_year = month_start.year
-                    next_month_month = month_start.month + 1
-                    if next_month_month > 12:
-                        next_month_month = 1
-                        next_month_year += 1
-                    month_end = datetime.datetime(next_month_year, next_month_month, 1) - datetime.timedelta(seconds=1)
-
-                    month_name = month_start.strftime("%b %y")
-
-                    try:
-                        count = self.db_session.query(func.count(Student.student_id)).filter(
-                            date_field_adm >= month_start,
-                            date_field_adm <= month_end
-                        ).scalar() or 0
-                        monthly_data.append((month_name, count))
-                    except Exception as e:
-                        self.logger.error(f"Error querying admissions for {month_name}: {e}")
-                        monthly_data.append((month_name, 0))
-
-                analytics['monthly_admissions'] = monthly_data
+            # Pre-aggregated counters, when the dashboard_stats table has been built
+            stats = self.stats.read(session, self._recent_months(),
+                                    (datetime.datetime.utcnow() - datetime.timedelta(days=30)).date())
+            if stats is not None:
+                self.logger.info(f"Analytics data read from dashboard_stats: {stats}")
+                return stats
+
+            date_field = None
+            if hasattr(Student, 'admission_date'): date_field = Student.admission_date
+            elif hasattr(Student, 'date_of_registration'): date_field = Student.date_of_registration
+            elif hasattr(Student, 'created_at'): date_field = Student.created_at
+
+            analytics.update(self._query_student_counts(session, date_field))
+            analytics.update(self._query_related_counts(session))
+
+            if date_field is not None:
+                analytics['monthly_admissions'] = self._query_monthly_admissions(session, date_field)
             else:
                 self.logger.warning("No date field for monthly admissions. Using empty data.")
-                analytics['monthly_admissions'] = self.get_empty_months()
 
+            other_count = analytics['total_students'] - analytics['male_count'] - analytics['female_count']
+            if other_count > 0:
+                self.logger.warning(f"Found {other_count} students with gender other than M/F.")
 
             self.logger.info(f"Analytics data fetched: {analytics}")
             return analytics
@@ -683,7 +745,80 @@ class DashboardWidget(QWidget):
         except Exception as e:
             self.logger.error(f"Fatal error fetching dashboard analytics: {str(e)}")
             self.logger.error(traceback.format_exc())
-            return self.get_empty_analytics_structure()
+            raise
+
+    @staticmethod
+    def _count_where(condition):
+        """SUM(CASE WHEN condition THEN 1 ELSE 0 END)"""
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    def _query_student_counts(self, session, date_field):
+        """Total, gender and new-registration counts in one pass over students"""
+        columns = [func.count(Student.student_id).label('total_students')]
+
+        if hasattr(Student, 'gender'):
+            columns.append(self._count_where(Student.gender.ilike('M%')).label('male_count'))
+            columns.append(self._count_where(Student.gender.ilike('F%')).label('female_count'))
+        else:
+            self.logger.warning("Student model has no 'gender' attribute. Cannot calculate gender breakdown.")
+
+        if date_field is not None:
+            thirty_days_ago = datetime.datetime.utcnow() - datetime.timedelta(days=30)
+            columns.append(self._count_where(date_field >= thirty_days_ago).label('new_registrations'))
+        else:
+            self.logger.warning("No suitable date field found for new registrations (tried admission_date, date_of_registration, created_at).")
+
+        row = session.query(*columns).one()
+        return {key: int(value or 0) for key, value in row._asdict().items()}
+
+    def _query_related_counts(self, session):
+        """Course, enrollment and hostel counts as scalar subqueries of a single SELECT"""
+        course_filter = [Course.is_active == True] if hasattr(Course, 'is_active') else []
+        hostel_filter = [HostelManagement.active_status == True] if hasattr(HostelManagement, 'active_status') else []
+
+        columns = [
+            session.query(func.count(Course.course_id)).filter(*course_filter)
+                .scalar_subquery().label('active_courses'),
+            session.query(func.count(HostelManagement.hostel_id)).filter(*hostel_filter)
+                .scalar_subquery().label('hostel_students'),
+        ]
+
+        if hasattr(Enrollment, 'completion_status'):
+            columns.append(session.query(
+                self._count_where(Enrollment.completion_status == False)
+            ).scalar_subquery().label('active_enrollments'))
+            columns.append(session.query(
+                self._count_where(Enrollment.completion_status == True)
+            ).scalar_subquery().label('completed_enrollments'))
+        else:
+            self.logger.warning("Enrollment model has no 'completion_status' attribute.")
+
+        row = session.query(*columns).one()
+        return {key: int(value or 0) for key, value in row._asdict().items()}
+
+    def _query_monthly_admissions(self, session, date_field, num_months=6):
+        """Admissions for each of the last num_months months with one GROUP BY query"""
+        months = self._recent_months(num_months)
+
+        year = extract('year', date_field)
+        month = extract('month', date_field)
+        rows = session.query(year, month, func.count(Student.student_id)).filter(
+            date_field >= months[0]
+        ).group_by(year, month).all()
+
+        counts = {(int(row_year), int(row_month)): count for row_year, row_month, count in rows}
+        return [(month_start.strftime("%b %y"), counts.get((month_start.year, month_start.month), 0))
+                for month_start in months]
+
+    @staticmethod
+    def _recent_months(num_months=6):
+        """First day of each of the last num_months months, oldest first"""
+        months = []
+        current_date = datetime.datetime.utcnow()
+        for i in range(num_months - 1, -1, -1):
+            target_month_date = current_date - datetime.timedelta(days=30 * i)
+            months.append(datetime.datetime(target_month_date.year, target_month_date.month, 1))
+        return months
 
     def get_empty_analytics_structure(self):
         return {
@@ -774,18 +909,27 @@ class DashboardWidget(QWidget):
         event.accept()
 
 
+    def on_data_changed(self, changes):
+        if any(change.table in self.tracked_tables for change in changes):
+            self.change_reload_timer.start()
+
     def cleanup(self):
         self.logger.info("Cleaning up DashboardWidget resources...")
         if hasattr(self, 'datetime_timer'):
             self.datetime_timer.stop()
             self.logger.info("Stopped datetime timer.")
 
-        if hasattr(self, 'db_session') and self.db_session:
+        if hasattr(self, 'change_reload_timer'):
+            self.change_reload_timer.stop()
             try:
-                self.db_session.close()
-                self.logger.info("Closed database session.")
-            except Exception as e:
-                self.logger.error(f"Error closing database session: {str(e)}")
+                self.change_notifier.data_changed.disconnect(self.on_data_changed)
+            except TypeError:
+                pass  # Already disconnected
+
+        # Results of loads still in flight are dropped when they arrive
+        self._load_request_id += 1
+        self._loaders.clear()
+        self._scheduled_loads.clear()
 
         if hasattr(self, 'fade_animation') and self.fade_animation:
             self.fade_animation.stop()
@@ -31,12 +31,8 @@ class DataExplorerWidget(QWidget):
             self.db_session = self.db.get_session()
             self.init_ui()
 
-            # Set up auto-refresh timer - refresh every 30 seconds
-            self.refresh_timer = QTimer(self)
-            self.refresh_timer.timeout.connect(self.auto_refresh)
-            self.refresh_timer.start(30000)  # 30 seconds
-
-            self.logger.info("Auto-refresh timer started (30 second interval)")
+            # No refresh timer of its own: the student CRUD widget is refreshed
+            # by TimerManager and by ChangeNotifier when data changes
         except Exception as e:
             self.logger.error(f"Failed to initialize DataExplorerWidget: {str(e)}")
             self.show_error_ui(str(e))
@@ -1,7 +1,7 @@
 import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                             QLabel, QLineEdit, QPushButton, QMessageBox, QComboBox)
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QLabel, QLineEdit, QPushButton, QMessageBox, QComboBox, QProgressBar)
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt5.QtGui import QIcon, QFont
 import socket
 import datetime
@@ -13,6 +13,33 @@ from app.utils.logger import Logger
 from app.config.config import Config
 
 
+class LoginWorkerSignals(QObject):
+    finished = pyqtSignal(object, object, str)  # user, session, message
+
+
+class LoginWorker(QRunnable):
+    """Runs authentication, including the bcrypt check, on a thread-pool thread"""
+
+    def __init__(self, auth_controller, username, password, user_agent):
+        super().__init__()
+        self.auth_controller = auth_controller
+        self.username = username
+        self.password = password
+        self.user_agent = user_agent
+        self.signals = LoginWorkerSignals()
+
+    def run(self):
+        try:
+            # Host name resolution can block as well
+            client_ip = socket.gethostbyname(socket.gethostname())
+            user, session, message = self.auth_controller.authenticate(
+                self.username, self.password, client_ip, self.user_agent
+            )
+        except Exception as e:
+            user, session, message = None, None, f"Authentication error: {str(e)}"
+        self.signals.finished.emit(user, session, message)
+
+
 class LoginWindow(QMainWindow):
     login_successful = pyqtSignal(object, object)  # Signals: user, session
 
@@ -32,6 +59,9 @@ class LoginWindow(QMainWindow):
             QMessageBox.critical(self, "Database Error", f"Failed to connect to database: {str(e)}")
             sys.exit(1)
 
+        self.thread_pool = QThreadPool.globalInstance()
+        self._login_worker = None
+
         self.init_ui()
 
     def init_ui(self):
@@ -73,12 +103,20 @@ class LoginWindow(QMainWindow):
         self.login_button.setMinimumHeight(40)
         self.login_button.clicked.connect(self.attempt_login)
 
+        # Busy indicator shown while credentials are checked
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setMaximumHeight(6)
+        self.progress_bar.hide()
+
         # Add widgets to main layout
         main_layout.addWidget(title_label)
         main_layout.addSpacing(20)
         main_layout.addLayout(username_layout)
         main_layout.addLayout(password_layout)
         main_layout.addStretch(1)
+        main_layout.addWidget(self.progress_bar)
         main_layout.addWidget(self.login_button)
 
         # Set return/enter key to trigger login
@@ -89,6 +127,9 @@ class LoginWindow(QMainWindow):
         self.username_input.setFocus()
 
     def attempt_login(self):
+        if self._login_worker is not None:
+            return  # A login is already being checked
+
         username = self.username_input.text().strip()
         password = self.password_input.text()
 
@@ -97,13 +138,28 @@ class LoginWindow(QMainWindow):
             return
 
         # Get client information for session
-        client_ip = socket.gethostbyname(socket.gethostname())
         user_agent = f"PyQt5 MIS Client {QApplication.applicationVersion()}"
 
-        # Authenticate user
-        user, session, message = self.auth_controller.authenticate(
-            username, password, client_ip, user_agent
-        )
+        # Authenticate on a worker thread so the window stays responsive while
+        # bcrypt runs. The window does not use its database session until the
+        # worker has finished.
+        self.set_busy(True)
+        self._login_worker = LoginWorker(self.auth_controller, username, password, user_agent)
+        self._login_worker.signals.finished.connect(self.on_login_finished)
+        self.thread_pool.start(self._login_worker)
+
+    def set_busy(self, busy):
+        """Show or hide the progress state and lock the form while a login is checked"""
+        self.username_input.setEnabled(not busy)
+        self.password_input.setEnabled(not busy)
+        self.login_button.setEnabled(not busy)
+        self.login_button.setText("Signing in..." if busy else "Login")
+        self.progress_bar.setVisible(busy)
+
+    def on_login_finished(self, user, session, message):
+        username = self._login_worker.username
+        self._login_worker = None
+        self.set_busy(False)
 
         if user and session:
             # Update last login in config
@@ -118,6 +174,7 @@ class LoginWindow(QMainWindow):
         else:
             self.logger.warning(f"Failed login attempt for user {username}: {message}")
             QMessageBox.warning(self, "Login Failed", message)
+            self.password_input.setFocus()
 
 
 class MainApplication(QMainWindow):
@@ -9,6 +9,9 @@ from app.controllers.rbac_controller import RBACController
 from app.utils.logger import Logger
 from app.ui.dashboard import DashboardWidget
 from app.utils.timer_manager import TimerManager
+from app.services.trigram_index import TrigramSearch
+from app.services.change_bus import ChangeBus
+from app.services.login_attempt_retention import LoginAttemptRetention
 
 # Import data explorer conditionally to prevent import errors
 try:
@@ -48,11 +51,21 @@ class MainWindow(QMainWindow):
         self.timer_manager = TimerManager.instance()
         self.timer_manager.start()
 
-        # Connect to timer manager signals
-        self.timer_manager.dashboard_refresh_signal.connect(self.safe_refresh_dashboard)
-        self.timer_manager.student_data_refresh_signal.connect(self.safe_refresh_student_data)
+        # Run the dashboard refresh as the scheduled job so failures back it
+        # off. The student CRUD widget attaches its own refresh, which
+        # applies only changed rows
+        self.timer_manager.attach('dashboard', self.run_dashboard_job, asynchronous=True)
         self.timer_manager.datetime_update_signal.connect(self.update_datetime)
 
+        # Build the in-memory search index without blocking the UI
+        TrigramSearch().build_in_background()
+
+        # Pick up other workstations' changes when the change log is enabled
+        ChangeBus().start_polling()
+
+        # Archive login attempts older than the retention window
+        LoginAttemptRetention().run_in_background()
+
         self.logger.info("MainWindow constructed and timer manager connected")
 
     def init_ui(self):
@@ -216,6 +229,11 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.logger.error(f"Error refreshing dashboard: {str(e)}")
 
+    def run_dashboard_job(self):
+        """Scheduled dashboard refresh; the dashboard reports the outcome to the timer manager"""
+        if hasattr(self, 'dashboard') and self.dashboard and not self.closing:
+            self.dashboard.refresh(scheduled=True)
+
     def safe_refresh_student_data(self):
         """Safely refresh student data with error handling"""
         try:
@@ -360,8 +378,7 @@ class MainWindow(QMainWindow):
             # Stop and disconnect timer manager connections
             if hasattr(self, 'timer_manager') and self.timer_manager:
                 # Disconnect our own slots from timer manager signals
-                safe_disconnect(self.timer_manager.dashboard_refresh_signal, self.safe_refresh_dashboard)
-                safe_disconnect(self.timer_manager.student_data_refresh_signal, self.safe_refresh_student_data)
+                self.timer_manager.detach('dashboard')
                 safe_disconnect(self.timer_manager.datetime_update_signal, self.update_datetime)
 
                 # Stop the timer manager
@@ -373,6 +390,8 @@ class MainWindow(QMainWindow):
 
                 self.logger.info("Timer manager disconnected and stopped")
 
+            ChangeBus().stop_polling()
+
             # Stop our own timer
             if hasattr(self, 'timer') and self.timer:
                 if self.timer.isActive():
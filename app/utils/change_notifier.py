@@ -0,0 +1,29 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from app.services.change_bus import ChangeBus
+from app.utils.logger import Logger
+
+
+class ChangeNotifier(QObject):
+    """Qt side of the ChangeBus: re-emits published changes on the GUI thread"""
+
+    # List of DataChange, emitted once per committed transaction or poll
+    data_changed = pyqtSignal(object)
+
+    # Singleton instance
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Get the singleton instance"""
+        if cls._instance is None:
+            cls._instance = ChangeNotifier()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.logger = Logger()
+        # Emitting from the change-log polling thread queues the slots onto
+        # the thread of each receiving widget
+        ChangeBus().subscribe(self.data_changed.emit)
+        self.logger.info("Change notifier initialized")
@@ -1,16 +1,73 @@
 # app/utils/timer_manager.py
-from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+import random
+import time
+
+from PyQt5.QtCore import QObject, QTimer, QEvent, pyqtSignal
+from PyQt5.QtWidgets import QApplication
 from app.utils.logger import Logger  # Import your logger class
+from app.config.config import Config
+
+
+class ScheduledJob:
+    """A callback run periodically by TimerManager, with its timing statistics"""
+    __slots__ = ('name', 'callback', 'interval', 'jitter', 'pause_when_idle', 'asynchronous', 'next_due',
+                 'failures', 'skipped', 'runs', 'total_ms', 'last_ms', 'max_ms')
+
+    def __init__(self, name, callback, interval, jitter, pause_when_idle, asynchronous=False):
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.jitter = jitter
+        self.pause_when_idle = pause_when_idle
+        self.asynchronous = asynchronous
+        self.next_due = 0.0
+        self.failures = 0
+        self.skipped = False
+        self.runs = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms):
+        self.runs += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
 
 
 class TimerManager(QObject):
-    """Centralized timer manager for the entire application"""
+    """
+    Centralized job scheduler for the entire application
+
+    Jobs are registered with an interval instead of being ticked by a fixed
+    one-second timer: a single-shot QTimer is armed for the earliest due job
+    and every job due within COALESCE_MS of it runs in the same wake-up.
+    Intervals get random jitter so clients do not refresh in lock-step, back
+    off exponentially while a job keeps failing, and stretch when a job is
+    slow so it cannot take more than a small share of the GUI thread. Jobs
+    pause while every window is minimized or the user has been idle, and run
+    as soon as the user returns.
+    """
 
     # Define signals for different refresh events
     dashboard_refresh_signal = pyqtSignal()
     student_data_refresh_signal = pyqtSignal()
     datetime_update_signal = pyqtSignal()
 
+    # Jobs due within this many milliseconds of each other run together
+    COALESCE_MS = 500
+    # How often a paused job checks whether it may run again
+    PAUSED_RECHECK_MS = 5000
+    # A job is not run more often than every SLOW_JOB_FACTOR times its duration
+    SLOW_JOB_FACTOR = 10
+    # Runs longer than this are logged as slow
+    SLOW_JOB_MS = 200
+    # Remaining due jobs yield to the event loop once a wake-up has used this long
+    FRAME_BUDGET_MS = 50
+
+    INPUT_EVENTS = (QEvent.MouseButtonPress, QEvent.MouseMove, QEvent.KeyPress, QEvent.Wheel,
+                    QEvent.TouchBegin)
+
     # Singleton instance
     _instance = None
 
@@ -35,61 +92,269 @@ class TimerManager(QObject):
         # Flag to track if timers are active
         self.active = False
 
-        # Create a single master timer
+        # Single-shot timer armed for the next due job
         self.master_timer = QTimer()
+        self.master_timer.setSingleShot(True)
         self.master_timer.timeout.connect(self._handle_timeout)
 
-        # Track time since last refresh for different components
-        self.last_refresh = {
-            'dashboard': 0,
-            'student_data': 0,
-            'datetime': 0
-        }
+        settings = Config().refresh_settings
+        self.default_jitter = float(settings['jitter'])
+        self.max_backoff_ms = int(settings['max_backoff_seconds']) * 1000
+        self.idle_timeout_ms = int(float(settings['idle_pause_minutes']) * 60000)
 
-        # Set refresh intervals (in milliseconds)
-        self.refresh_intervals = {
-            'dashboard': 60000,  # Dashboard every 60 seconds
-            'student_data': 30000,  # Student data every 30 seconds
-            'datetime': 1000  # DateTime every 1 second
-        }
+        self.jobs = {}
+        self._last_input = self._now()
+        self._was_idle = False
 
-        # Counter for master timer ticks (in milliseconds)
-        self.tick_count = 0
+        # Local edits and, with the change log enabled, other workstations'
+        # edits arrive through ChangeNotifier, so the data refreshes are only
+        # a safety net and can be raised or disabled in the "refresh" section
+        # of config.json. Until a widget attach()es its refresh, the jobs
+        # just emit their signals.
+        self._signal_callbacks = {
+            'dashboard': self.dashboard_refresh_signal.emit,
+            'student_data': self.student_data_refresh_signal.emit,
+        }
+        self.register('dashboard', self._signal_callbacks['dashboard'],
+                      int(settings['dashboard_seconds']) * 1000)
+        self.register('student_data', self._signal_callbacks['student_data'],
+                      int(settings['student_data_seconds']) * 1000)
+        # The clock keeps ticking while the user is idle, but not when minimized
+        self.register('datetime', self.datetime_update_signal.emit, 1000, jitter=0, pause_when_idle=False)
 
         self.logger.info("Timer manager initialized")
 
+    @staticmethod
+    def _now():
+        return time.monotonic() * 1000
+
+    def register(self, name, callback, interval, jitter=None, pause_when_idle=True):
+        """
+        Register (or replace) a periodic job
+
+        Args:
+            name: Unique job name
+            callback: Callable run on the GUI thread; raising counts as a failure
+            interval: Milliseconds between runs (0 or less disables the job)
+            jitter: Fraction the interval is randomly varied by (defaults to config)
+            pause_when_idle: Skip the job while the user is idle
+        """
+        if interval <= 0:
+            self.jobs.pop(name, None)
+            self.logger.info(f"Scheduled job {name} disabled")
+            return
+
+        job = ScheduledJob(name, callback, interval,
+                           self.default_jitter if jitter is None else jitter, pause_when_idle)
+        job.next_due = self._now() + self._delay(job)
+        self.jobs[name] = job
+        self._arm()
+
+    def unregister(self, name):
+        self.jobs.pop(name, None)
+        self._arm()
+
+    def attach(self, name, callback, asynchronous=False):
+        """
+        Run callback for a configured job, keeping its interval and statistics
+
+        Slots connected to a signal cannot report failure back to emit(), so
+        widgets attach the refresh itself to get backoff on failures.
+
+        Args:
+            name: Job name, e.g. 'dashboard' or 'student_data'
+            callback: Callable that raises on failure
+            asynchronous: The callback only starts the work; its owner reports
+                          the outcome and duration with job_finished()
+        """
+        job = self.jobs.get(name)
+        if job is None:
+            return
+        job.callback = callback
+        job.asynchronous = asynchronous
+
+    def detach(self, name):
+        """Go back to emitting the job's signal"""
+        job = self.jobs.get(name)
+        if job is None or name not in self._signal_callbacks:
+            return
+        job.callback = self._signal_callbacks[name]
+        job.asynchronous = False
+
+    def job_finished(self, name, success, elapsed_ms, error=None):
+        """
+        Report the outcome of an asynchronous job started by the scheduler
+
+        Args:
+            name: Job name
+            success: Whether the work succeeded
+            elapsed_ms: How long the work took
+            error: Error message to log on failure
+        """
+        job = self.jobs.get(name)
+        if job is None:
+            return
+        self._finish(job, success, elapsed_ms, error)
+        self._arm()
+
+    def set_interval(self, name, interval):
+        """Change the interval of a registered job (0 or less disables it)"""
+        job = self.jobs.get(name)
+        if job is None:
+            return
+        if interval <= 0:
+            self.unregister(name)
+            return
+        job.interval = interval
+        job.next_due = self._now() + self._delay(job)
+        self._arm()
+
+    def job_stats(self):
+        """
+        Get the timing of every job
+
+        Returns:
+            Dictionary of job name: {runs, failures, last_ms, avg_ms, max_ms, interval_ms}
+        """
+        return {
+            name: {
+                'runs': job.runs,
+                'failures': job.failures,
+                'last_ms': round(job.last_ms, 1),
+                'avg_ms': round(job.total_ms / job.runs, 1) if job.runs else 0.0,
+                'max_ms': round(job.max_ms, 1),
+                'interval_ms': job.interval,
+            }
+            for name, job in self.jobs.items()
+        }
+
+    def _delay(self, job):
+        """Milliseconds until the next run: interval with jitter, backoff and slow-job stretch"""
+        delay = job.interval
+        if job.failures:
+            delay = min(job.interval * (2 ** job.failures), max(self.max_backoff_ms, job.interval))
+        delay = max(delay, job.last_ms * self.SLOW_JOB_FACTOR)
+        if job.jitter:
+            delay *= 1 + random.uniform(-job.jitter, job.jitter)
+        return delay
+
     def start(self):
-        """Start the master timer"""
+        """Start running jobs"""
         if not self.active:
             self.active = True
-            self.tick_count = 0
-            self.master_timer.start(1000)  # Tick every second (1000ms)
+            self._last_input = self._now()
+            app = QApplication.instance()
+            if app is not None:
+                app.installEventFilter(self)
+                app.applicationStateChanged.connect(self._on_application_state_changed)
+            self._arm()
             self.logger.info("Timer manager started")
 
     def stop(self):
-        """Stop the master timer"""
+        """Stop running jobs"""
         if self.active:
             self.active = False
             self.master_timer.stop()
+            app = QApplication.instance()
+            if app is not None:
+                app.removeEventFilter(self)
+                try:
+                    app.applicationStateChanged.disconnect(self._on_application_state_changed)
+                except TypeError:
+                    pass  # Signal might not be connected
             self.logger.info("Timer manager stopped")
 
+    def eventFilter(self, watched, event):
+        """Track user input to detect idleness"""
+        if event.type() in self.INPUT_EVENTS:
+            self._last_input = self._now()
+            if self._was_idle:
+                self._was_idle = False
+                self._resume_paused()
+        return False
+
+    def _on_application_state_changed(self, _state):
+        if not self._is_minimized():
+            self._resume_paused()
+
+    def _is_idle(self):
+        return self.idle_timeout_ms > 0 and self._now() - self._last_input > self.idle_timeout_ms
+
+    @staticmethod
+    def _is_minimized():
+        """True when no application window is showing"""
+        windows = [widget for widget in QApplication.topLevelWidgets() if widget.isVisible()]
+        return bool(windows) and all(widget.isMinimized() for widget in windows)
+
+    def _resume_paused(self):
+        """Run jobs skipped while paused as soon as the user is back"""
+        if not self.active:
+            return
+        now = self._now()
+        for job in self.jobs.values():
+            if job.skipped:
+                job.skipped = False
+                job.next_due = now
+        self._arm()
+
+    def _arm(self):
+        """Arm the master timer for the earliest due job"""
+        if not self.active:
+            return
+        if not self.jobs:
+            self.master_timer.stop()
+            return
+        next_due = min(job.next_due for job in self.jobs.values())
+        self.master_timer.start(max(0, int(next_due - self._now())))
+
     def _handle_timeout(self):
-        """Handle timeout from the master timer"""
+        """Run every job that is due (or nearly due) in one wake-up"""
         if not self.active:
             return
 
-        # Increment tick count by 1 second (1000ms)
-        self.tick_count += 1000
+        start = self._now()
+        minimized = self._is_minimized()
+        idle = self._is_idle()
+        self._was_idle = self._was_idle or idle
+
+        due = sorted((job for job in self.jobs.values() if job.next_due <= start + self.COALESCE_MS),
+                     key=lambda job: job.next_due)
+        for job in due:
+            if self._now() - start > self.FRAME_BUDGET_MS:
+                # Leave the rest for the next event-loop turn so input is not starved
+                break
+            if minimized or (idle and job.pause_when_idle):
+                job.skipped = True
+                job.next_due = self._now() + min(job.interval, self.PAUSED_RECHECK_MS)
+                continue
+            self._run(job)
 
-        # Check each refresh interval
-        for component, interval in self.refresh_intervals.items():
-            if self.tick_count % interval == 0:
-                if component == 'dashboard':
-                    self.dashboard_refresh_signal.emit()
-                elif component == 'student_data':
-                    self.student_data_refresh_signal.emit()
-                elif component == 'datetime':
-                    self.datetime_update_signal.emit()
+        self._arm()
+
+    def _run(self, job):
+        started = time.perf_counter()
+        try:
+            job.callback()
+        except Exception as e:
+            self._finish(job, False, (time.perf_counter() - started) * 1000, str(e))
+            return
+        if job.asynchronous:
+            # The outcome and timing arrive with job_finished(); until then
+            # keep the current backoff
+            job.next_due = self._now() + self._delay(job)
+            return
+        self._finish(job, True, (time.perf_counter() - started) * 1000)
+
+    def _finish(self, job, success, elapsed_ms, error=None):
+        if success:
+            job.failures = 0
+        else:
+            job.failures += 1
+            self.logger.error(f"Scheduled job {job.name} failed ({job.failures} in a row): {error}")
+        job.record(elapsed_ms)
+        if elapsed_ms > self.SLOW_JOB_MS:
+            self.logger.warning(f"Scheduled job {job.name} took {elapsed_ms:.0f} ms")
+        job.next_due = self._now() + self._delay(job)
 
     def cleanup(self):
         """Clean up all timers when application is closing"""
@@ -107,7 +372,9 @@ class TimerManager(QObject):
         self.student_data_refresh_signal.disconnect()
         self.datetime_update_signal.disconnect()
 
+        self.jobs.clear()
+
         # Reset the instance
         TimerManager._instance = None
 
-        self.logger.info("Timer manager cleaned up")
\ No newline at end of file
+        self.logger.info("Timer manager cleaned up")
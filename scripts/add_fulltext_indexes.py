@@ -0,0 +1,35 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.full_text_search import FullTextSearch
+from app.utils.logger import Logger
+
+
+def add_fulltext_indexes():
+    """Add FULLTEXT indexes on the searchable text columns of the data database"""
+    logger = Logger()
+    logger.info("Starting FULLTEXT index migration")
+
+    try:
+        created = FullTextSearch().create_indexes()
+
+        if created:
+            print(f"Created {len(created)} FULLTEXT indexes: {', '.join(created)}")
+        else:
+            print("No FULLTEXT indexes created (already present or database does not support them).")
+        print('Set "search": {"full_text": true} in config.json to use them.')
+        return True
+
+    except Exception as e:
+        logger.error(f"Error creating FULLTEXT indexes: {str(e)}")
+        print(f"Error creating FULLTEXT indexes: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Adding FULLTEXT indexes to the data database...")
+    add_fulltext_indexes()
+    print("Done.")
@@ -0,0 +1,48 @@
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import bcrypt
+
+
+def time_hash(rounds, repeat):
+    """Best hashpw time in milliseconds for a cost factor"""
+    password = b"Benchmark@123"
+    best = None
+    for _ in range(repeat):
+        salt = bcrypt.gensalt(rounds=rounds)
+        start = time.perf_counter()
+        bcrypt.hashpw(password, salt)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def run_benchmark(min_rounds=10, max_rounds=14, repeat=3, target_ms=250):
+    configured = None
+    try:
+        from app.config.config import Config
+        configured = Config().bcrypt_rounds
+    except Exception:
+        pass  # Benchmark still runs without a readable config
+
+    print(f"bcrypt hash time, best of {repeat} runs (target about {target_ms} ms per login)")
+    suggested = None
+    for rounds in range(min_rounds, max_rounds + 1):
+        elapsed = time_hash(rounds, repeat)
+        if elapsed <= target_ms:
+            suggested = rounds
+        marker = "  <- configured" if rounds == configured else ""
+        print(f"  cost {rounds:2d} : {elapsed:9.1f} ms{marker}")
+
+    if suggested is not None:
+        print(f"Highest cost within {target_ms} ms on this machine: {suggested}")
+    print('Set "security": {"bcrypt_rounds": N} in config.json; passwords are rehashed at next login.')
+
+
+if __name__ == "__main__":
+    highest = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    run_benchmark(max_rounds=highest)
@@ -0,0 +1,87 @@
+import sys
+import os
+import time
+import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models.student_models import Base, Student
+
+
+def seed_students(session_factory, count):
+    """Insert synthetic students into the benchmark database"""
+    session = session_factory()
+    session.bulk_insert_mappings(Student, [
+        {
+            'student_name': f"Student {i}",
+            'cnic': f"35202-{i:07d}-1",
+            'gender': 'M' if i % 2 else 'F',
+            'age': 18 + i % 20,
+            'date_of_birth': datetime.date(2000, 1, 1),
+            'phone': f"0300{i:07d}",
+            'address': f"House {i}, Street {i % 50}",
+            'admission_date': datetime.date(2024, 1 + i % 12, 1),
+        }
+        for i in range(count)
+    ])
+    session.commit()
+    session.close()
+
+
+def read_all_with_copies(session_factory):
+    """Previous strategy: copy every column of every row into a new instance"""
+    session = session_factory()
+    try:
+        results = []
+        for record in session.query(Student).all():
+            result = Student()
+            for column in record.__table__.columns:
+                setattr(result, column.name, getattr(record, column.name))
+            results.append(result)
+        return results
+    finally:
+        session.close()
+
+
+def read_all_detached(session_factory):
+    """Current strategy: return the loaded rows and let close() detach them"""
+    session = session_factory()
+    try:
+        return session.query(Student).all()
+    finally:
+        session.close()
+
+
+def time_per_row(func, session_factory, rows, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = func(session_factory)
+        elapsed = time.perf_counter() - start
+        # Touch a column to prove the rows are usable after the session closed
+        assert records[-1].student_name
+        best = elapsed if best is None else min(best, elapsed)
+    return best / rows * 1_000_000
+
+
+def run_benchmark(rows=20000, repeat=5):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+    seed_students(session_factory, rows)
+
+    copy_cost = time_per_row(read_all_with_copies, session_factory, rows, repeat)
+    detach_cost = time_per_row(read_all_detached, session_factory, rows, repeat)
+
+    print(f"Rows: {rows}, best of {repeat} runs")
+    print(f"  Per-column copy : {copy_cost:8.2f} us/row")
+    print(f"  Detach on close : {detach_cost:8.2f} us/row")
+    print(f"  Speed-up        : {copy_cost / detach_cost:8.2f}x")
+
+
+if __name__ == "__main__":
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    run_benchmark(row_count)
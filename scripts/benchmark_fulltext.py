@@ -0,0 +1,102 @@
+import sys
+import os
+import time
+import random
+import argparse
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import create_engine, text, or_
+from sqlalchemy.orm import sessionmaker
+from app.models.student_models import Student
+
+FIRST_NAMES = ['Ali', 'Ahmed', 'Fatima', 'Ayesha', 'Hassan', 'Zainab', 'Usman', 'Maryam', 'Bilal', 'Sana']
+LAST_NAMES = ['Khan', 'Malik', 'Hussain', 'Qureshi', 'Butt', 'Sheikh', 'Chaudhry', 'Raza', 'Iqbal', 'Javed']
+CITIES = ['Lahore', 'Karachi', 'Islamabad', 'Multan', 'Peshawar', 'Quetta', 'Faisalabad', 'Sialkot']
+OCCUPATIONS = ['Student', 'Tailor', 'Clerk', 'Shopkeeper', 'Teacher', 'Driver', 'Unemployed']
+
+SEARCH_TERMS = ['Fatima', 'Qureshi', 'Faisalabad', 'Ayesha Raza', 'Tailor']
+COLUMNS = [Student.student_name, Student.address, Student.student_occupation]
+
+
+def seed(engine, rows, batch_size=5000):
+    """Create a synthetic students_personal table with the given number of rows"""
+    Student.__table__.drop(engine, checkfirst=True)
+    Student.__table__.create(engine)
+
+    rng = random.Random(42)
+    session = sessionmaker(bind=engine)()
+    for start in range(0, rows, batch_size):
+        session.bulk_insert_mappings(Student, [
+            {
+                'student_name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                'cnic': f"{rng.randint(10000, 99999)}-{rng.randint(1000000, 9999999)}-{rng.randint(1, 9)}",
+                'gender': rng.choice('MF'),
+                'phone': f"03{rng.randint(100000000, 999999999)}",
+                'address': f"House {i}, Block {rng.randint(1, 40)}, {rng.choice(CITIES)}",
+                'student_occupation': rng.choice(OCCUPATIONS),
+            }
+            for i in range(start, min(start + batch_size, rows))
+        ])
+        session.commit()
+    session.close()
+
+
+def add_fulltext_indexes(engine):
+    with engine.begin() as connection:
+        for column in COLUMNS:
+            connection.execute(text(
+                f"ALTER TABLE students_personal ADD FULLTEXT INDEX ft_bench_{column.key} ({column.key})"
+            ))
+
+
+def time_query(session, condition, repeat):
+    best = None
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = session.query(Student.student_id).filter(condition).count()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, count
+
+
+def run_benchmark(url, rows, repeat):
+    engine = create_engine(url)
+    print(f"Seeding {rows} synthetic students into {engine.url.render_as_string(hide_password=True)}...")
+    seed(engine, rows)
+
+    full_text = engine.dialect.name == 'mysql'
+    if full_text:
+        print("Adding FULLTEXT indexes...")
+        add_fulltext_indexes(engine)
+    else:
+        print(f"{engine.dialect.name} has no FULLTEXT support; only LIKE is measured.")
+
+    session = sessionmaker(bind=engine)()
+    print(f"\n{'term':<16}{'LIKE ms':>10}{'rows':>9}{'MATCH ms':>11}{'rows':>9}")
+    for term in SEARCH_TERMS:
+        like_ms, like_rows = time_query(
+            session, or_(*[column.ilike(f"%{term}%") for column in COLUMNS]), repeat)
+        line = f"{term:<16}{like_ms:>10.1f}{like_rows:>9}"
+
+        if full_text:
+            query = ' '.join(f"+{word}*" for word in term.split())
+            match_ms, match_rows = time_query(
+                session, or_(*[column.match(query) for column in COLUMNS]), repeat)
+            line += f"{match_ms:>11.1f}{match_rows:>9}"
+        print(line)
+
+    session.close()
+    Student.__table__.drop(engine)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare LIKE and FULLTEXT search on synthetic students")
+    parser.add_argument('--url', default="sqlite://",
+                        help="Database URL of a SCRATCH database; students_personal is dropped and recreated")
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    run_benchmark(args.url, args.rows, args.repeat)
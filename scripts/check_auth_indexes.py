@@ -0,0 +1,118 @@
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.database.db_connection import AuthDatabase
+from app.models import LoginAttempt, User, UserRole, UserSession
+from app.utils.logger import Logger
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN of a SELECT, executed with the statement's own bound parameters"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    prefix = "EXPLAIN QUERY PLAN " if compiler.dialect.name == 'sqlite' else "EXPLAIN "
+    return prefix + compiler.process(element.statement, **kw)
+
+
+def hot_queries():
+    """
+    The auth queries run on every login or session check
+
+    Returns:
+        List of (description, statement, table, indexes expected to be used;
+        None accepts any index)
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return [
+        ("SessionManager.validate_session",
+         select(UserSession).where(UserSession.session_token == 'x', UserSession.is_active == True),
+         'user_sessions', None),
+        ("SessionManager._deactivate_existing_sessions",
+         select(UserSession).where(UserSession.user_id == 1, UserSession.is_active == True),
+         'user_sessions', {'ix_user_sessions_user_active'}),
+        ("SessionManager._get_active_sessions_count",
+         select(func.count(UserSession.id)).select_from(UserSession).join(User).where(
+             User.role == UserRole.ADMIN, UserSession.is_active == True,
+             UserSession.last_activity >= now - timedelta(hours=8)),
+         'user_sessions', {'ix_user_sessions_active_activity'}),
+        ("SessionManager.cleanup_expired_sessions",
+         select(UserSession.id).where(UserSession.is_active == True,
+                                      UserSession.last_activity < now - timedelta(hours=8)),
+         'user_sessions', {'ix_user_sessions_active_activity'}),
+        ("Attempts by IP in the last hour",
+         select(func.count(LoginAttempt.id)).where(LoginAttempt.ip_address == '127.0.0.1',
+                                                   LoginAttempt.timestamp >= now - timedelta(hours=1)),
+         'login_attempts', {'ix_login_attempts_ip_time'}),
+        ("LoginMonitor.get_failed_attempts",
+         select(func.count(LoginAttempt.id)).where(LoginAttempt.username == 'admin',
+                                                   LoginAttempt.successful == False,
+                                                   LoginAttempt.timestamp >= now - timedelta(days=1)),
+         'login_attempts', {'ix_login_attempts_user_result_time'}),
+    ]
+
+
+def index_used(connection, statement, table):
+    """Name of the index the plan uses to read table, or None for a full scan"""
+    rows = connection.execute(Explain(statement)).mappings().all()
+    if connection.dialect.name == 'sqlite':
+        for row in rows:
+            detail = row['detail']
+            if f" {table} " in f" {detail} " and " INDEX " in detail:
+                return detail.split(" INDEX ", 1)[1].split(" ", 1)[0]
+        return None
+    for row in rows:
+        if row['table'] == table and row['type'] != 'ALL':
+            return row['key']
+    return None
+
+
+def check_auth_indexes():
+    """EXPLAIN every hot auth query and report the index it uses"""
+    logger = Logger()
+    logger.info("Checking auth query plans")
+
+    try:
+        engine = AuthDatabase().engine
+        if engine.dialect.name not in ('mysql', 'sqlite'):
+            print(f"Query plan check is not supported on {engine.dialect.name}")
+            return False
+
+        all_ok = True
+        with engine.connect() as connection:
+            for description, statement, table, expected in hot_queries():
+                key = index_used(connection, statement, table)
+                ok = key is not None and (expected is None or key in expected)
+                all_ok = all_ok and ok
+                print(f"{'OK  ' if ok else 'FAIL'} {description}: {table} via {key or 'full scan'}")
+                if not ok:
+                    logger.warning(f"{description} does not use the expected index on {table} (uses {key})")
+
+        if not all_ok:
+            print("Run scripts/init_database.py to add missing indexes. On tables with only a few rows "
+                  "the optimizer may still prefer a scan.")
+        return all_ok
+
+    except Exception as e:
+        logger.error(f"Error checking auth query plans: {str(e)}")
+        print(f"Error checking auth query plans: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Checking that the hot auth queries use their indexes...")
+    check_auth_indexes()
+    print("Done.")
@@ -0,0 +1,30 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.change_bus import ChangeBus
+from app.utils.logger import Logger
+
+
+def create_change_log():
+    """Create the data_change_log table used to share changes between workstations"""
+    logger = Logger()
+    logger.info("Creating data_change_log table")
+
+    try:
+        ChangeBus().create_log_table()
+        print("data_change_log is ready. Set \"change_log.enabled\" to true in config.json on every workstation.")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error creating data_change_log: {str(e)}")
+        print(f"Error creating data_change_log: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Creating change log table...")
+    create_change_log()
+    print("Done.")
@@ -132,6 +132,12 @@ def setup_initial_users():
         db.create_tables()
         logger.info("Auth database tables created/verified successfully")
 
+        # Add indexes declared after the tables were first created
+        created = db.create_indexes()
+        if created:
+            print(f"Created {len(created)} indexes: {', '.join(created)}")
+            logger.info(f"Created auth indexes: {', '.join(created)}")
+
         # Get a session for user operations
         db_session = db.get_session()
 
@@ -153,7 +159,7 @@ def setup_initial_users():
 
             for user_data in default_users:
                 user = User(username=user_data["username"], role=user_data["role"])
-                user.set_password(user_data["password"])
+                user.set_password(user_data["password"], Config().bcrypt_rounds)
                 db_session.add(user)
 
             db_session.commit()
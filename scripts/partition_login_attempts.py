@@ -0,0 +1,34 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.login_attempt_retention import LoginAttemptRetention
+from app.utils.logger import Logger
+
+
+def partition_login_attempts():
+    """Partition login_attempts by month so old months can be dropped instantly (MySQL only)"""
+    logger = Logger()
+    logger.info("Starting login_attempts partitioning")
+
+    try:
+        if LoginAttemptRetention().enable_partitioning():
+            print("login_attempts is partitioned by month. The retention job now drops whole months.")
+            print("Note: the user_id foreign key was removed and the primary key is now (id, timestamp).")
+            return True
+
+        print("login_attempts was not partitioned (partitioning needs MySQL).")
+        return False
+
+    except Exception as e:
+        logger.error(f"Error partitioning login_attempts: {str(e)}")
+        print(f"Error partitioning login_attempts: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Partitioning login_attempts by month...")
+    partition_login_attempts()
+    print("Done.")
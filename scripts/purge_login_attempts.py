@@ -0,0 +1,36 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.login_attempt_retention import LoginAttemptRetention
+from app.utils.logger import Logger
+
+
+def purge_login_attempts():
+    """Archive and delete login attempts older than "login_attempts.retention_days" """
+    logger = Logger()
+    logger.info("Starting login attempt retention")
+
+    try:
+        retention = LoginAttemptRetention()
+        if retention.retention_days <= 0:
+            print("Retention is disabled (login_attempts.retention_days is 0).")
+            return True
+
+        removed = retention.purge()
+        print(f"Archived {removed} login attempts older than {retention.cutoff():%Y-%m-%d} "
+              f"(archive: {retention.archive}).")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error purging login attempts: {str(e)}")
+        print(f"Error purging login attempts: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Purging old login attempts...")
+    purge_login_attempts()
+    print("Done.")
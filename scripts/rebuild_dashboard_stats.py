@@ -0,0 +1,30 @@
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.dashboard_stats import DashboardStats
+from app.utils.logger import Logger
+
+
+def rebuild_dashboard_stats():
+    """Recompute the dashboard_stats table from the base tables"""
+    logger = Logger()
+    logger.info("Starting dashboard_stats rebuild")
+
+    try:
+        rows = DashboardStats().rebuild()
+        print(f"Wrote {rows} dashboard counters.")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error rebuilding dashboard_stats: {str(e)}")
+        print(f"Error rebuilding dashboard_stats: {str(e)}")
+        return False
+
+
+if __name__ == "__main__":
+    print("Rebuilding dashboard statistics...")
+    rebuild_dashboard_stats()
+    print("Done.")
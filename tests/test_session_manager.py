@@ -0,0 +1,61 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, User, UserRole, UserSession
+from app.services.session_manager import SessionCache, SessionManager
+
+
+class ValidateSessionTest(unittest.TestCase):
+    def setUp(self):
+        SessionCache._instance = None
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={'check_same_thread': False})
+        Base.metadata.create_all(engine)
+        # Same settings as AuthDatabase: commits expire loaded instances
+        self.session_factory = sessionmaker(bind=engine)
+
+        db_session = self.session_factory()
+        user = User(username='alice', password_hash='x', salt='x', role=UserRole.TEACHER, is_active=True)
+        db_session.add(user)
+        db_session.flush()
+        # Idle long enough that the first validation flushes (and commits) last_activity
+        idle_since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=5)
+        db_session.add(UserSession(user_id=user.id, session_token='token', is_active=True,
+                                   created_at=idle_since, last_activity=idle_since))
+        db_session.commit()
+        db_session.close()
+
+    def tearDown(self):
+        SessionCache._instance = None
+
+    def test_cached_user_readable_after_owning_session_closes(self):
+        first = self.session_factory()
+        user, message = SessionManager(first).validate_session('token')
+        self.assertEqual(message, "Session valid")
+        first.close()
+
+        second = self.session_factory()
+        try:
+            user, message = SessionManager(second).validate_session('token')
+            self.assertEqual(message, "Session valid")
+            self.assertEqual(user.username, 'alice')
+            self.assertEqual(user.role, UserRole.TEACHER)
+        finally:
+            second.close()
+
+    def test_ended_session_is_not_served_from_cache(self):
+        db_session = self.session_factory()
+        try:
+            manager = SessionManager(db_session)
+            self.assertIsNotNone(manager.validate_session('token')[0])
+            self.assertTrue(manager.end_session('token')[0])
+            self.assertIsNone(manager.validate_session('token')[0])
+        finally:
+            db_session.close()
+
+
+if __name__ == '__main__':
+    unittest.main()